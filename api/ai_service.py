@@ -18,13 +18,31 @@ Docs: /ai/docs
 Health: /ai/health
 """
 
+import asyncio
+import contextlib
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
 
+# Background loops of the mounted routers, started by the lifespan
+BACKGROUND_JOBS: list = []
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    background = [asyncio.create_task(job()) for job in BACKGROUND_JOBS]
+    yield
+    for task in background:
+        task.cancel()
+    for task in background:
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
 app = FastAPI(
     title="LoadMoveGH AI Service",
     description=(
@@ -34,6 +52,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/ai/docs",
     redoc_url="/ai/redoc",
+    lifespan=lifespan,
 )
 
 # CORS — only allow main API and frontend
@@ -63,14 +82,20 @@ except ImportError:
     pass
 
 try:
-    from app.api.v1.endpoints.matching import router as matching_router
+    from app.api.v1.endpoints.matching import (
+        router as matching_router,
+        run_courier_snapshot_refresher,
+        run_recommendation_audit_writer,
+    )
     app.include_router(matching_router, prefix="/ai/v1")
+    BACKGROUND_JOBS += [run_courier_snapshot_refresher, run_recommendation_audit_writer]
 except ImportError:
     pass
 
 try:
-    from app.api.v1.endpoints.fraud import router as fraud_router
+    from app.api.v1.endpoints.fraud import router as fraud_router, run_category_stats_refresher
     app.include_router(fraud_router, prefix="/ai/v1")
+    BACKGROUND_JOBS.append(run_category_stats_refresher)
 except ImportError:
     pass
 
@@ -45,6 +45,7 @@ from app.models.matching import (  # noqa: F401
 )
 from app.models.fraud import (  # noqa: F401
     FraudAlert,
+    FraudCategoryStat,
     FraudDecision,
     FraudSignal,
     RiskProfile,
@@ -53,6 +54,7 @@ from app.models.assistant import (  # noqa: F401
     ChatMessage,
     ChatSession,
 )
+from app.models.outbox import OutboxEvent  # noqa: F401
 
 config = context.config
 
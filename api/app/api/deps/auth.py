@@ -21,6 +21,9 @@ from app.models.user import User
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
+# Roles with platform-wide access to escrows, disputes, listings and trips
+ADMIN_ROLES = frozenset({"system_admin", "org_admin"})
+
 
 # ═══════════════════════════════════════════════════════════════
 #  GET CURRENT USER (from JWT)
@@ -102,12 +105,16 @@ async def get_current_user(
 async def get_current_active_user(
     user: User = Depends(get_current_user),
 ) -> User:
-    """Ensure the user account is active."""
+    """
+    Ensure the user account is active and stash the user's role names on
+    the instance as ``role_set`` so downstream checks are O(1) lookups.
+    """
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Account is deactivated",
         )
+    object.__setattr__(user, "role_set", frozenset(user.role_names))
     return user
 
 
@@ -128,8 +135,7 @@ class RoleChecker:
         self,
         user: User = Depends(get_current_active_user),
     ) -> User:
-        user_roles = user.role_names
-        if not any(role in user_roles for role in self.required_roles):
+        if user.role_set.isdisjoint(self.required_roles):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Insufficient permissions. Required roles: {', '.join(self.required_roles)}",
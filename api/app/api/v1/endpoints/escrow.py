@@ -37,23 +37,36 @@ payout scheduling.  Also includes the dispute system.
 
 from __future__ import annotations
 
+import json
+import logging
+import secrets
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, TypedDict
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select
+from fastapi.responses import StreamingResponse
+from sqlalchemy import case, exists, insert, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from starlette.background import BackgroundTask
 
 from app.api.deps.auth import (
+    ADMIN_ROLES,
     get_current_active_user,
     require_any_authenticated,
     require_system_admin,
 )
+from app.core.cache import TTLCache
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import async_session_factory, get_db
+from app.core.responses import ORJSONResponse, dumps as json_dumps
+from app.core.security import hash_password
 from app.models.freight import FreightListing, FreightTrip, TripStatus
-from app.models.user import User
+from app.models.outbox import OutboxEvent
+from app.models.user import AuditLog, User
 from app.models.wallet import (
     Dispute,
     DisputeReason,
@@ -78,11 +91,63 @@ from app.schemas.wallet import (
     ResolveDisputeRequest,
 )
 
+logger = logging.getLogger("loadmovegh.api.escrow")
+
 router = APIRouter(tags=["Escrow & Disputes"])
 
 # Platform commission rate (5%)
 PLATFORM_COMMISSION_RATE = 0.05
 
+_UTC = timezone.utc
+
+
+class TransactionRow(TypedDict, total=False):
+    """Column values for one ledger row in a Core ``insert(Transaction)``."""
+    wallet_id: uuid.UUID
+    type: TransactionType
+    amount: float
+    currency: str
+    fee: float
+    net_amount: float
+    balance_after: float
+    status: TransactionStatus
+    reference_type: str
+    reference_id: str
+    description: str
+    completed_at: datetime
+
+
+# Columns every completed ledger row starts from; handlers layer the
+# per-request constants on top once, then each row adds its own fields.
+_BASE_TX: TransactionRow = {"fee": 0.00, "status": TransactionStatus.COMPLETED}
+
+# Ledger descriptions for the release/refund/dispute paths.  The constant
+# parts (commission %) are rendered once; handlers only fill in the trip id.
+_RATE_PCT = f"{PLATFORM_COMMISSION_RATE * 100:.0f}%"
+_DESC_RELEASE = "Escrow released for trip {}"
+_DESC_RELEASE_COMMISSION = f"Platform commission ({_RATE_PCT}) on trip {{}}"
+_DESC_RELEASE_PAYMENT = f"Payment for trip {{}} (net of {_RATE_PCT} commission)"
+_DESC_REFUND = "Escrow refund for trip {}"
+_DESC_DISPUTE_SHIPPER = "Dispute resolved in shipper's favour — full refund for trip {}"
+_DESC_DISPUTE_COMMISSION = "Platform commission after dispute resolution — trip {}"
+_DESC_DISPUTE_COURIER = "Dispute resolved in courier's favour — trip {}"
+_DESC_SPLIT_REFUND = "Partial refund (dispute split) — trip {}"
+_DESC_SPLIT_PAYOUT = "Partial payout (dispute split) — trip {}"
+_DESC_SPLIT_COMMISSION = "Platform commission from dispute split — trip {}"
+
+# currency → id of the platform commission wallet (None if there is
+# none), primed by provision_platform_wallets() at startup and re-read
+# after the TTL so a wallet added later is picked up without a restart.
+# A currency without one keeps booking commission against the shipper.
+_platform_wallet_cache = TTLCache(ttl=settings.PLATFORM_WALLET_CACHE_TTL_SECONDS)
+
+# Relationships read by build_dispute_response, loaded with the dispute
+DISPUTE_RESPONSE_LOADS = (
+    selectinload(Dispute.raised_by),
+    selectinload(Dispute.against_user),
+    selectinload(Dispute.resolved_by),
+)
+
 
 # ═══════════════════════════════════════════════════════════════
 #  HELPERS
@@ -100,27 +165,204 @@ async def get_wallet_for_user(
     return result.scalar_one_or_none()
 
 
-def build_dispute_response(d: Dispute) -> DisputeResponse:
-    return DisputeResponse(
-        id=d.id,
-        trip_id=d.trip_id,
-        escrow_id=d.escrow_id,
-        raised_by_user_id=d.raised_by_user_id,
-        raised_by_name=d.raised_by.full_name if d.raised_by else None,
-        against_user_id=d.against_user_id,
-        against_user_name=d.against_user.full_name if d.against_user else None,
-        reason=d.reason.value if hasattr(d.reason, "value") else d.reason,
-        description=d.description,
-        evidence_urls=d.evidence_urls,
-        status=d.status.value if hasattr(d.status, "value") else d.status,
-        resolution_notes=d.resolution_notes,
-        resolved_by_name=d.resolved_by.full_name if d.resolved_by else None,
-        shipper_refund_amount=float(d.shipper_refund_amount) if d.shipper_refund_amount else None,
-        courier_payout_amount=float(d.courier_payout_amount) if d.courier_payout_amount else None,
-        created_at=d.created_at,
-        updated_at=d.updated_at,
-        resolved_at=d.resolved_at,
+async def apply_wallet_deltas(
+    db: AsyncSession,
+    deltas: dict[uuid.UUID, dict[str, float]],
+    now: datetime,
+) -> dict[uuid.UUID, float]:
+    """
+    Apply per-wallet column deltas (balance / escrow_balance / total_earned)
+    in a single UPDATE ... CASE, letting the database add to the current
+    values under its own row locks.  Returns {wallet_id: new balance}.
+    """
+    values: dict = {"updated_at": now}
+    for col in ("balance", "escrow_balance", "total_earned"):
+        column = getattr(Wallet, col)
+        whens = [
+            (Wallet.id == wallet_id, column + d[col])
+            for wallet_id, d in deltas.items()
+            if d.get(col)
+        ]
+        if whens:
+            values[col] = case(*whens, else_=column)
+
+    result = await db.execute(
+        update(Wallet)
+        .where(Wallet.id.in_(list(deltas)))
+        .values(**values)
+        .returning(Wallet.id, Wallet.balance)
+        .execution_options(synchronize_session=False)
+    )
+    return dict(result.all())
+
+
+async def ensure_wallet_id(
+    db: AsyncSession, user_id: uuid.UUID, currency: str = "GHS"
+) -> uuid.UUID:
+    """
+    Return the id of the user's wallet for `currency`, creating an empty
+    one if needed.  ON CONFLICT on (user_id, currency) makes concurrent
+    creators converge on the same row instead of racing to INSERT.
+    """
+    result = await db.execute(
+        pg_insert(Wallet)
+        .values(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            currency=currency,
+            balance=0.00,
+            escrow_balance=0.00,
+            total_deposited=0.00,
+            total_withdrawn=0.00,
+            total_earned=0.00,
+            status=WalletStatus.ACTIVE,
+        )
+        .on_conflict_do_nothing(index_elements=["user_id", "currency"])
+        .returning(Wallet.id)
     )
+    wallet_id = result.scalar_one_or_none()
+    if wallet_id is None:
+        # Lost the race — another request created it first
+        result = await db.execute(
+            select(Wallet.id).where(
+                Wallet.user_id == user_id,
+                Wallet.currency == currency,
+            )
+        )
+        wallet_id = result.scalar_one()
+    return wallet_id
+
+
+def violates(exc: IntegrityError, constraint: str) -> bool:
+    """
+    True when `exc` was raised by `constraint`.  asyncpg reports the
+    constraint name on the driver error SQLAlchemy wraps; FK, NOT NULL
+    and check failures name a different constraint (or none).
+    """
+    return getattr(exc.orig.__cause__, "constraint_name", None) == constraint
+
+
+async def flush_or_conflict(db: AsyncSession, constraint: str, detail: str) -> None:
+    """
+    Flush pending writes, translating a violation of the unique
+    `constraint` (duplicate escrow for a trip, duplicate ledger row) into
+    a 409.  Any other integrity error is a bug and propagates as-is.
+    """
+    try:
+        await db.flush()
+    except IntegrityError as exc:
+        if not violates(exc, constraint):
+            raise
+        raise HTTPException(status_code=409, detail=detail)
+
+
+def build_dispute_response(d: Dispute) -> dict:
+    """
+    Map a Dispute row to the `DisputeResponse` shape as a plain dict.
+
+    The data comes straight from the DB, so it is handed to orjson directly
+    instead of paying for Pydantic validation per row.
+    """
+    return {
+        "id": d.id,
+        "trip_id": d.trip_id,
+        "escrow_id": d.escrow_id,
+        "raised_by_user_id": d.raised_by_user_id,
+        "raised_by_name": d.raised_by.full_name if d.raised_by else None,
+        "against_user_id": d.against_user_id,
+        "against_user_name": d.against_user.full_name if d.against_user else None,
+        "reason": d.reason.value if hasattr(d.reason, "value") else d.reason,
+        "description": d.description,
+        "evidence_urls": d.evidence_urls,
+        "status": d.status.value if hasattr(d.status, "value") else d.status,
+        "resolution_notes": d.resolution_notes,
+        "resolved_by_name": d.resolved_by.full_name if d.resolved_by else None,
+        "shipper_refund_amount": float(d.shipper_refund_amount) if d.shipper_refund_amount else None,
+        "courier_payout_amount": float(d.courier_payout_amount) if d.courier_payout_amount else None,
+        "created_at": d.created_at,
+        "updated_at": d.updated_at,
+        "resolved_at": d.resolved_at,
+    }
+
+
+async def provision_platform_wallets(db: AsyncSession) -> None:
+    """
+    Create the platform's system account and one commission wallet per
+    configured currency if they are missing, commit, and prime the wallet
+    id cache.  Every worker runs this at startup; ON CONFLICT makes
+    concurrent runs converge on the same rows.
+    """
+    # Inactive, with a random password nobody knows — it never logs in
+    owner_id = await db.scalar(
+        pg_insert(User)
+        .values(
+            id=uuid.uuid4(),
+            email=settings.PLATFORM_ACCOUNT_EMAIL,
+            full_name=f"{settings.APP_NAME} Platform",
+            password_hash=hash_password(secrets.token_urlsafe(32)),
+            is_active=False,
+        )
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(User.id)
+    )
+    if owner_id is None:
+        owner_id = await db.scalar(
+            select(User.id).where(User.email == settings.PLATFORM_ACCOUNT_EMAIL)
+        )
+
+    if settings.PLATFORM_WALLET_CURRENCIES:
+        await db.execute(
+            pg_insert(Wallet)
+            .values([
+                {
+                    "id": uuid.uuid4(),
+                    "user_id": owner_id,
+                    "currency": currency,
+                    "status": WalletStatus.ACTIVE,
+                    "is_verified": True,
+                    "is_platform": True,
+                }
+                for currency in settings.PLATFORM_WALLET_CURRENCIES
+            ])
+            # Literal predicate so it matches uq_wallet_platform_currency
+            .on_conflict_do_nothing(index_elements=["currency"], index_where=text("is_platform"))
+        )
+    await db.commit()
+
+    result = await db.execute(
+        select(Wallet.currency, Wallet.id).where(Wallet.is_platform.is_(True))
+    )
+    for currency, wallet_id in result.tuples():
+        _platform_wallet_cache.set(currency, wallet_id)
+
+
+async def get_platform_wallet_id(db: AsyncSession, currency: str) -> Optional[uuid.UUID]:
+    """The platform commission wallet for `currency`, if there is one."""
+    async def load() -> Optional[uuid.UUID]:
+        return await db.scalar(
+            select(Wallet.id).where(Wallet.is_platform.is_(True), Wallet.currency == currency)
+        )
+
+    return await _platform_wallet_cache.get_or_load(currency, load)
+
+
+def warmup_statements() -> list:
+    """
+    The hot escrow/dispute lookups, bound to a dummy id, for
+    `warm_statement_cache` at startup.  They must match the handlers'
+    statements structurally so they hit the same cache entries.
+    """
+    dummy = uuid.UUID(int=0)
+    return [
+        select(FreightTrip).where(FreightTrip.id == dummy),
+        select(EscrowHold).where(EscrowHold.id == dummy).with_for_update(of=EscrowHold),
+        select(Dispute).where(Dispute.id == dummy),
+        select(Dispute).where(
+            Dispute.id == dummy,
+            Dispute.status.in_((DisputeStatus.OPEN, DisputeStatus.UNDER_REVIEW, DisputeStatus.ESCALATED)),
+        ).with_for_update(),
+        select(Wallet).where(Wallet.user_id == dummy, Wallet.currency == "GHS"),
+    ]
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -161,13 +403,6 @@ async def create_escrow_hold(
             detail=f"Trip must be in pickup_pending status (current: {trip.status.value})",
         )
 
-    # Check no existing escrow
-    existing_result = await db.execute(
-        select(EscrowHold).where(EscrowHold.trip_id == trip_id)
-    )
-    if existing_result.scalar_one_or_none():
-        raise HTTPException(status_code=409, detail="Escrow already exists for this trip")
-
     # Get bid amount
     bid = trip.bid
     if not bid:
@@ -191,26 +426,32 @@ async def create_escrow_hold(
     if shipper_wallet.status != WalletStatus.ACTIVE:
         raise HTTPException(status_code=400, detail="Shipper wallet is frozen or closed")
 
-    if float(shipper_wallet.balance) < amount:
+    available = float(shipper_wallet.balance)
+    if available < amount:
         raise HTTPException(
             status_code=400,
-            detail=f"Insufficient shipper balance. Available: {currency} {float(shipper_wallet.balance):.2f}, "
+            detail=f"Insufficient shipper balance. Available: {currency} {available:.2f}, "
                    f"Required: {currency} {amount:.2f}",
         )
 
-    # Get/create courier wallet
+    # Get/create courier wallet up front so release never has to INSERT one
     courier_wallet = await get_wallet_for_user(db, trip.courier_id, currency)
-    courier_wallet_id = courier_wallet.id if courier_wallet else None
+    if courier_wallet is not None:
+        courier_wallet_id = courier_wallet.id
+    else:
+        courier_wallet_id = await ensure_wallet_id(db, trip.courier_id, currency)
 
-    now = datetime.now(timezone.utc)
+    now = datetime.now(_UTC)
 
     # Deduct from shipper wallet → escrow
-    shipper_wallet.balance = float(shipper_wallet.balance) - amount
+    shipper_balance = available - amount
+    shipper_wallet.balance = shipper_balance
     shipper_wallet.escrow_balance = float(shipper_wallet.escrow_balance) + amount
     shipper_wallet.updated_at = now
 
-    # Create escrow hold
+    # Create escrow hold (client-side id so the ledger row can reference it pre-flush)
     escrow = EscrowHold(
+        id=uuid.uuid4(),
         trip_id=trip_id,
         listing_id=listing.id,
         shipper_wallet_id=shipper_wallet.id,
@@ -221,25 +462,26 @@ async def create_escrow_hold(
         status=EscrowStatus.HELD,
     )
     db.add(escrow)
-    await db.flush()
+    # Duplicate holds are rejected by uq_escrow_trip_active
+    await flush_or_conflict(db, "uq_escrow_trip_active", "Escrow already exists for this trip")
 
     # Log the escrow_hold transaction on the shipper's wallet
-    txn = Transaction(
-        wallet_id=shipper_wallet.id,
-        type=TransactionType.ESCROW_HOLD,
-        amount=amount,
-        currency=currency,
-        fee=0.00,
-        net_amount=amount,
-        balance_after=float(shipper_wallet.balance),
-        status=TransactionStatus.COMPLETED,
-        reference_type="escrow",
-        reference_id=str(escrow.id),
-        description=f"Escrow hold for trip {trip_id} — {currency} {amount:.2f}",
-        completed_at=now,
+    await db.execute(
+        insert(Transaction),
+        [{
+            **_BASE_TX,
+            "wallet_id": shipper_wallet.id,
+            "type": TransactionType.ESCROW_HOLD,
+            "amount": amount,
+            "currency": currency,
+            "net_amount": amount,
+            "balance_after": shipper_balance,
+            "reference_type": "escrow",
+            "reference_id": str(escrow.id),
+            "description": f"Escrow hold for trip {trip_id} — {currency} {amount:.2f}",
+            "completed_at": now,
+        }],
     )
-    db.add(txn)
-    await db.flush()
 
     return EscrowHoldResponse(
         id=escrow.id,
@@ -279,13 +521,26 @@ async def release_escrow(
 
     Only callable when the trip is in `confirmed` status.
     """
-    # Get escrow
-    escrow_result = await db.execute(
-        select(EscrowHold).where(EscrowHold.id == escrow_id)
-    )
+    # Authorization: shipper or admin.  The shipper check rides in the
+    # locking SELECT's WHERE clause, so an unauthorised caller never takes
+    # the row lock; a miss falls back to an unlocked lookup for 404 vs 403.
+    is_admin = not ADMIN_ROLES.isdisjoint(user.role_set)
+    escrow_q = select(EscrowHold).where(EscrowHold.id == escrow_id)
+    if not is_admin:
+        escrow_q = escrow_q.where(
+            exists().where(
+                FreightListing.id == EscrowHold.listing_id,
+                FreightListing.shipper_id == user.id,
+            )
+        )
+
+    escrow_result = await db.execute(escrow_q.with_for_update(of=EscrowHold))
     escrow = escrow_result.scalar_one_or_none()
     if not escrow:
-        raise HTTPException(status_code=404, detail="Escrow hold not found")
+        found = await db.scalar(select(exists().where(EscrowHold.id == escrow_id)))
+        if not found:
+            raise HTTPException(status_code=404, detail="Escrow hold not found")
+        raise HTTPException(status_code=403, detail="Only the shipper or admin can release escrow")
 
     if escrow.status != EscrowStatus.HELD:
         raise HTTPException(
@@ -304,14 +559,7 @@ async def release_escrow(
             detail=f"Trip must be confirmed before escrow release (current: {trip.status.value})",
         )
 
-    # Authorization: shipper, courier, or admin
-    user_roles = user.role_names
-    is_admin = "system_admin" in user_roles or "org_admin" in user_roles
-    is_shipper = trip.listing and trip.listing.shipper_id == user.id
-    if not (is_shipper or is_admin):
-        raise HTTPException(status_code=403, detail="Only the shipper or admin can release escrow")
-
-    now = datetime.now(timezone.utc)
+    now = datetime.now(_UTC)
     amount = float(escrow.amount)
     currency = escrow.currency
 
@@ -325,112 +573,95 @@ async def release_escrow(
     escrow.status = EscrowStatus.RELEASED
     escrow.released_at = now
 
-    # Get shipper wallet — reduce escrow_balance
-    shipper_wallet_result = await db.execute(
-        select(Wallet).where(Wallet.id == escrow.shipper_wallet_id)
-    )
-    shipper_wallet = shipper_wallet_result.scalar_one()
-    shipper_wallet.escrow_balance = float(shipper_wallet.escrow_balance) - amount
-    shipper_wallet.updated_at = now
-
-    # Get or create courier wallet
-    courier_wallet = None
-    if escrow.courier_wallet_id:
-        cw_result = await db.execute(
-            select(Wallet).where(Wallet.id == escrow.courier_wallet_id)
-        )
-        courier_wallet = cw_result.scalar_one_or_none()
-
-    if courier_wallet is None:
-        # Create courier wallet
-        courier_wallet = Wallet(
-            user_id=trip.courier_id,
-            currency=currency,
-            balance=0.00,
-            escrow_balance=0.00,
-            total_deposited=0.00,
-            total_withdrawn=0.00,
-            total_earned=0.00,
-            status=WalletStatus.ACTIVE,
-        )
-        db.add(courier_wallet)
-        await db.flush()
-        escrow.courier_wallet_id = courier_wallet.id
-
-    # Credit courier wallet
-    courier_wallet.balance = float(courier_wallet.balance) + courier_payout
-    courier_wallet.total_earned = float(courier_wallet.total_earned) + courier_payout
-    courier_wallet.updated_at = now
+    shipper_wallet_id = escrow.shipper_wallet_id
+    # Courier wallet is created when the hold is placed; holds placed
+    # before that (courier_wallet_id NULL) get one here and keep it.
+    courier_wallet_id = escrow.courier_wallet_id
+    if courier_wallet_id is None:
+        courier_wallet_id = await ensure_wallet_id(db, trip.courier_id, currency)
+        escrow.courier_wallet_id = courier_wallet_id
+    commission_wallet_id = await get_platform_wallet_id(db, currency) or shipper_wallet_id
+    trip_id_str = str(trip.id)
+    tx_base: TransactionRow = {
+        **_BASE_TX,
+        "currency": currency,
+        "reference_type": "escrow",
+        "reference_id": str(escrow.id),
+        "completed_at": now,
+    }
 
     # ── Transaction ledger entries ────────────────────────────
-
-    # 1. Escrow release on shipper wallet (informational)
-    shipper_release_txn = Transaction(
-        wallet_id=shipper_wallet.id,
-        type=TransactionType.ESCROW_RELEASE,
-        amount=amount,
-        currency=currency,
-        fee=0.00,
-        net_amount=amount,
-        balance_after=float(shipper_wallet.balance),
-        status=TransactionStatus.COMPLETED,
-        reference_type="escrow",
-        reference_id=str(escrow.id),
-        description=f"Escrow released for trip {trip.id}",
-        completed_at=now,
-    )
-    db.add(shipper_release_txn)
-
-    # 2. Commission deduction transaction (platform revenue)
-    commission_txn = Transaction(
-        wallet_id=shipper_wallet.id,
-        type=TransactionType.COMMISSION,
-        amount=commission,
-        currency=currency,
-        fee=0.00,
-        net_amount=commission,
-        balance_after=float(shipper_wallet.balance),
-        status=TransactionStatus.COMPLETED,
-        reference_type="escrow",
-        reference_id=str(escrow.id),
-        description=f"Platform commission ({PLATFORM_COMMISSION_RATE*100:.0f}%) on trip {trip.id}",
-        completed_at=now,
-    )
-    db.add(commission_txn)
-
-    # 3. Escrow release credit on courier wallet
-    courier_credit_txn = Transaction(
-        wallet_id=courier_wallet.id,
-        type=TransactionType.ESCROW_RELEASE,
-        amount=courier_payout,
-        currency=currency,
-        fee=commission,
-        net_amount=courier_payout,
-        balance_after=float(courier_wallet.balance),
-        status=TransactionStatus.COMPLETED,
-        reference_type="escrow",
-        reference_id=str(escrow.id),
-        description=f"Payment for trip {trip.id} (net of {PLATFORM_COMMISSION_RATE*100:.0f}% commission)",
-        completed_at=now,
-    )
-    db.add(courier_credit_txn)
+    # balance_after is filled in from the wallet UPDATE's RETURNING below
+    ledger: list[TransactionRow] = [
+        # 1. Escrow release on shipper wallet (informational)
+        {
+            **tx_base,
+            "wallet_id": shipper_wallet_id,
+            "type": TransactionType.ESCROW_RELEASE,
+            "amount": amount,
+            "net_amount": amount,
+            "description": _DESC_RELEASE.format(trip_id_str),
+        },
+        # 2. Commission deduction transaction (platform revenue)
+        {
+            **tx_base,
+            "wallet_id": commission_wallet_id,
+            "type": TransactionType.COMMISSION,
+            "amount": commission,
+            "net_amount": commission,
+            "description": _DESC_RELEASE_COMMISSION.format(trip_id_str),
+        },
+        # 3. Escrow release credit on courier wallet
+        {
+            **tx_base,
+            "wallet_id": courier_wallet_id,
+            "type": TransactionType.ESCROW_RELEASE,
+            "amount": courier_payout,
+            "fee": commission,
+            "net_amount": courier_payout,
+            "description": _DESC_RELEASE_PAYMENT.format(trip_id_str),
+        },
+    ]
 
     # ── Payout schedule ──────────────────────────────────────
 
-    payout = PayoutSchedule(
-        courier_id=trip.courier_id,
-        wallet_id=courier_wallet.id,
-        escrow_id=escrow.id,
-        trip_id=trip.id,
-        amount=courier_payout,
-        currency=currency,
-        status=PayoutStatus.COMPLETED,  # Instant in-wallet payout
-        due_date=now,
-        paid_at=now,
-    )
-    db.add(payout)
-
-    await db.flush()
+    payout = {
+        "courier_id": trip.courier_id,
+        "wallet_id": courier_wallet_id,
+        "escrow_id": escrow.id,
+        "trip_id": trip.id,
+        "amount": courier_payout,
+        "currency": currency,
+        "status": PayoutStatus.COMPLETED,  # Instant in-wallet payout
+        "due_date": now,
+        "paid_at": now,
+    }
+
+    # Shipper escrow_balance down, courier balance up — one UPDATE applied
+    # to the locked current values, then one ledger INSERT.  The platform
+    # wallet is deliberately left out: every release would otherwise hold
+    # that one row's lock until commit and queue behind each other.  Its
+    # commission row is written with no balance_after instead.
+    wallet_deltas: dict[uuid.UUID, dict[str, float]] = {
+        shipper_wallet_id: {"escrow_balance": -amount},
+        courier_wallet_id: {
+            "balance": courier_payout,
+            "total_earned": courier_payout,
+        },
+    }
+
+    try:
+        async with db.begin_nested():
+            balances = await apply_wallet_deltas(db, wallet_deltas, now)
+            for row in ledger:
+                row["balance_after"] = balances.get(row["wallet_id"])
+            await db.execute(insert(Transaction), ledger)
+            await db.execute(insert(PayoutSchedule), [payout])
+    except IntegrityError as exc:
+        # A replayed request re-inserts the same ledger rows
+        if not violates(exc, "uq_txn_wallet_ref_type"):
+            raise
+        raise HTTPException(status_code=409, detail="Escrow has already been released")
 
     return EscrowReleaseResponse(
         message=f"Escrow released. Courier receives {currency} {courier_payout:.2f} "
@@ -464,7 +695,7 @@ async def refund_escrow(
     Requires system_admin role.
     """
     escrow_result = await db.execute(
-        select(EscrowHold).where(EscrowHold.id == escrow_id)
+        select(EscrowHold).where(EscrowHold.id == escrow_id).with_for_update()
     )
     escrow = escrow_result.scalar_one_or_none()
     if not escrow:
@@ -476,40 +707,47 @@ async def refund_escrow(
             detail=f"Cannot refund escrow with status: {escrow.status.value}",
         )
 
-    now = datetime.now(timezone.utc)
+    now = datetime.now(_UTC)
     amount = float(escrow.amount)
     currency = escrow.currency
 
-    # Credit back to shipper
-    shipper_wallet_result = await db.execute(
-        select(Wallet).where(Wallet.id == escrow.shipper_wallet_id)
-    )
-    shipper_wallet = shipper_wallet_result.scalar_one()
-    shipper_wallet.balance = float(shipper_wallet.balance) + amount
-    shipper_wallet.escrow_balance = float(shipper_wallet.escrow_balance) - amount
-    shipper_wallet.updated_at = now
+    shipper_wallet_id = escrow.shipper_wallet_id
 
     # Update escrow
     escrow.status = EscrowStatus.REFUNDED
     escrow.refunded_at = now
 
-    # Log transaction
-    txn = Transaction(
-        wallet_id=shipper_wallet.id,
-        type=TransactionType.ESCROW_REFUND,
-        amount=amount,
-        currency=currency,
-        fee=0.00,
-        net_amount=amount,
-        balance_after=float(shipper_wallet.balance),
-        status=TransactionStatus.COMPLETED,
-        reference_type="escrow",
-        reference_id=str(escrow.id),
-        description=f"Escrow refund for trip {escrow.trip_id}",
-        completed_at=now,
-    )
-    db.add(txn)
-    await db.flush()
+    try:
+        async with db.begin_nested():
+            # Credit back to shipper
+            balances = await apply_wallet_deltas(
+                db,
+                {shipper_wallet_id: {"balance": amount, "escrow_balance": -amount}},
+                now,
+            )
+
+            # Log transaction
+            await db.execute(
+                insert(Transaction),
+                [{
+                    **_BASE_TX,
+                    "wallet_id": shipper_wallet_id,
+                    "type": TransactionType.ESCROW_REFUND,
+                    "amount": amount,
+                    "currency": currency,
+                    "net_amount": amount,
+                    "balance_after": balances[shipper_wallet_id],
+                    "reference_type": "escrow",
+                    "reference_id": str(escrow.id),
+                    "description": _DESC_REFUND.format(escrow.trip_id),
+                    "completed_at": now,
+                }],
+            )
+    except IntegrityError as exc:
+        # A replayed request re-inserts the same ledger rows
+        if not violates(exc, "uq_txn_wallet_ref_type"):
+            raise
+        raise HTTPException(status_code=409, detail="Escrow has already been refunded")
 
     return MessageResponse(
         message=f"Escrow refunded. {currency} {amount:.2f} returned to shipper wallet."
@@ -530,7 +768,7 @@ async def open_dispute(
     body: OpenDisputeRequest,
     user: User = Depends(require_any_authenticated),
     db: AsyncSession = Depends(get_db),
-) -> DisputeResponse:
+) -> ORJSONResponse:
     """
     Open a dispute on a delivered trip.
 
@@ -566,15 +804,18 @@ async def open_dispute(
     if not (is_shipper or is_courier):
         raise HTTPException(status_code=403, detail="Only the shipper or courier can open a dispute")
 
-    # Determine the "against" party
+    # Determine the "against" party (both candidates are selectin-loaded)
     if is_shipper:
-        against_user_id = trip.courier_id
+        against_user = trip.courier
     else:
-        against_user_id = listing.shipper_id if listing else trip.courier_id
+        against_user = listing.shipper if listing else trip.courier
 
     # Find the escrow hold
     escrow_result = await db.execute(
-        select(EscrowHold).where(EscrowHold.trip_id == body.trip_id)
+        select(EscrowHold).where(
+            EscrowHold.trip_id == body.trip_id,
+            EscrowHold.status != EscrowStatus.REFUNDED,
+        )
     )
     escrow = escrow_result.scalar_one_or_none()
     if not escrow:
@@ -593,7 +834,7 @@ async def open_dispute(
     if existing_result.scalar_one_or_none():
         raise HTTPException(status_code=409, detail="A dispute is already open for this trip")
 
-    now = datetime.now(timezone.utc)
+    now = datetime.now(_UTC)
 
     # Update trip status
     trip.status = TripStatus.DISPUTED
@@ -603,22 +844,31 @@ async def open_dispute(
     if escrow.status == EscrowStatus.HELD:
         escrow.status = EscrowStatus.DISPUTED
 
-    # Create dispute
+    # Create dispute.  Everything the response needs is set up front, so
+    # only the flush is needed — no refresh round-trip.
     dispute = Dispute(
+        id=uuid.uuid4(),
         trip_id=body.trip_id,
         escrow_id=escrow.id,
         raised_by_user_id=user.id,
-        against_user_id=against_user_id,
+        against_user_id=against_user.id,
+        raised_by=user,
+        against_user=against_user,
+        resolved_by=None,
         reason=DisputeReason(body.reason),
         description=body.description,
         evidence_urls=body.evidence_urls,
         status=DisputeStatus.OPEN,
+        created_at=now,
+        updated_at=now,
     )
     db.add(dispute)
+    # Write before answering 201 — get_db only commits after the response
     await db.flush()
-    await db.refresh(dispute, attribute_names=["raised_by", "against_user"])
 
-    return build_dispute_response(dispute)
+    return ORJSONResponse(
+        build_dispute_response(dispute), status_code=status.HTTP_201_CREATED
+    )
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -635,11 +885,16 @@ async def list_disputes(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     user: User = Depends(require_any_authenticated),
-    db: AsyncSession = Depends(get_db),
-) -> DisputeListResponse:
-    """Admins see all disputes. Users see only disputes they are party to."""
-    user_roles = user.role_names
-    is_admin = "system_admin" in user_roles or "org_admin" in user_roles
+) -> StreamingResponse:
+    """
+    Admins see all disputes. Users see only disputes they are party to.
+
+    The page is streamed as it is read from the database rather than
+    materialised up front; the body matches `DisputeListResponse`.  The
+    first batch is read before the 200 goes out, so a failing query
+    still answers 5xx instead of a truncated body.
+    """
+    is_admin = not ADMIN_ROLES.isdisjoint(user.role_set)
 
     stmt = select(Dispute)
 
@@ -654,14 +909,45 @@ async def list_disputes(
 
     stmt = stmt.order_by(Dispute.created_at.desc())
     offset = (page - 1) * per_page
-    stmt = stmt.offset(offset).limit(per_page)
-
-    result = await db.execute(stmt)
-    disputes = result.scalars().all()
-
-    return DisputeListResponse(
-        disputes=[build_dispute_response(d) for d in disputes],
-        total=len(disputes),
+    stmt = stmt.offset(offset).limit(per_page).execution_options(yield_per=50)
+
+    # The generator outlives the request-scoped session, so it reads
+    # through its own session.  The response's background task closes it
+    # even if the body is never iterated (client gone before the first
+    # chunk); closing twice is harmless.
+    session = async_session_factory()
+    try:
+        result = await session.stream_scalars(stmt)
+        batches = result.partitions()
+        batch = await anext(batches, [])
+    except BaseException:
+        await session.close()
+        raise
+
+    async def stream_disputes():
+        nonlocal batch
+        total = 0
+        yield b'{"disputes":['
+        try:
+            while batch:
+                for d in batch:
+                    if total:
+                        yield b","
+                    yield json_dumps(build_dispute_response(d))
+                    total += 1
+                batch = await anext(batches, [])
+        except Exception:
+            # Too late for an error status — end the page at the rows
+            # already sent so the body is still valid JSON.
+            logger.exception("Dispute list stream failed after %d rows", total)
+        finally:
+            await session.close()
+        yield b'],"total":%d}' % total
+
+    return StreamingResponse(
+        stream_disputes(),
+        media_type="application/json",
+        background=BackgroundTask(session.close),
     )
 
 
@@ -678,22 +964,26 @@ async def get_dispute(
     dispute_id: uuid.UUID,
     user: User = Depends(require_any_authenticated),
     db: AsyncSession = Depends(get_db),
-) -> DisputeResponse:
-    result = await db.execute(
-        select(Dispute).where(Dispute.id == dispute_id)
-    )
-    dispute = result.scalar_one_or_none()
-    if not dispute:
-        raise HTTPException(status_code=404, detail="Dispute not found")
+) -> ORJSONResponse:
+    # The party check is part of the WHERE clause, so a caller who may not
+    # see the dispute never hydrates it; only a miss pays for the
+    # existence probe that picks 404 vs 403.
+    is_admin = not ADMIN_ROLES.isdisjoint(user.role_set)
+    stmt = select(Dispute).where(Dispute.id == dispute_id)
+    if not is_admin:
+        stmt = stmt.where(
+            (Dispute.raised_by_user_id == user.id)
+            | (Dispute.against_user_id == user.id)
+        )
 
-    # Auth check
-    user_roles = user.role_names
-    is_admin = "system_admin" in user_roles or "org_admin" in user_roles
-    is_party = user.id in (dispute.raised_by_user_id, dispute.against_user_id)
-    if not (is_admin or is_party):
+    dispute = (await db.execute(stmt)).scalar_one_or_none()
+    if dispute is None:
+        found = await db.scalar(select(exists().where(Dispute.id == dispute_id)))
+        if not found:
+            raise HTTPException(status_code=404, detail="Dispute not found")
         raise HTTPException(status_code=403, detail="Not authorised to view this dispute")
 
-    return build_dispute_response(dispute)
+    return ORJSONResponse(build_dispute_response(dispute))
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -710,7 +1000,7 @@ async def resolve_dispute(
     body: ResolveDisputeRequest,
     user: User = Depends(require_system_admin),
     db: AsyncSession = Depends(get_db),
-) -> DisputeResponse:
+) -> ORJSONResponse:
     """
     Admin resolves a dispute. Three outcomes:
 
@@ -721,235 +1011,240 @@ async def resolve_dispute(
 
     The resolution moves funds accordingly and closes the dispute.
     """
+    # The admin check has already run in the dependency; eligibility is
+    # part of the locking SELECT so a closed dispute is never locked.  Only
+    # a miss reads the row again to pick 404 vs 400.
+    resolvable = (DisputeStatus.OPEN, DisputeStatus.UNDER_REVIEW, DisputeStatus.ESCALATED)
     result = await db.execute(
-        select(Dispute).where(Dispute.id == dispute_id)
+        select(Dispute)
+        .where(Dispute.id == dispute_id, Dispute.status.in_(resolvable))
+        .options(*DISPUTE_RESPONSE_LOADS)
+        .with_for_update()
     )
     dispute = result.scalar_one_or_none()
     if not dispute:
-        raise HTTPException(status_code=404, detail="Dispute not found")
-
-    if dispute.status not in (DisputeStatus.OPEN, DisputeStatus.UNDER_REVIEW, DisputeStatus.ESCALATED):
+        current = await db.scalar(select(Dispute.status).where(Dispute.id == dispute_id))
+        if current is None:
+            raise HTTPException(status_code=404, detail="Dispute not found")
         raise HTTPException(
             status_code=400,
-            detail=f"Cannot resolve dispute with status: {dispute.status.value}",
+            detail=f"Cannot resolve dispute with status: {current.value}",
         )
 
-    escrow = dispute.escrow
+    # Lock the escrow row so concurrent resolutions/releases serialise
+    escrow_result = await db.execute(
+        select(EscrowHold)
+        .where(EscrowHold.id == dispute.escrow_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    escrow = escrow_result.scalar_one_or_none()
     if not escrow:
         raise HTTPException(status_code=400, detail="No escrow associated with this dispute")
 
-    now = datetime.now(timezone.utc)
+    now = datetime.now(_UTC)
     amount = float(escrow.amount)
     currency = escrow.currency
-
-    # Get wallets
-    shipper_wallet_result = await db.execute(
-        select(Wallet).where(Wallet.id == escrow.shipper_wallet_id)
-    )
-    shipper_wallet = shipper_wallet_result.scalar_one()
-
-    courier_wallet = None
-    if escrow.courier_wallet_id:
-        cw_result = await db.execute(
-            select(Wallet).where(Wallet.id == escrow.courier_wallet_id)
-        )
-        courier_wallet = cw_result.scalar_one_or_none()
-
-    trip = dispute.trip
-
+    shipper_wallet_id = escrow.shipper_wallet_id
+    courier_wallet_id = escrow.courier_wallet_id
+    commission_wallet_id = await get_platform_wallet_id(db, currency) or shipper_wallet_id
+    # Bound once; each is reused by several ledger/audit/outbox rows below
+    trip_id_str = str(escrow.trip_id)
+    dispute_id_str = str(dispute_id)
+
+    # ── Work out every amount before touching any state ──────
     if body.resolution == "resolved_shipper":
         # Full refund to shipper
-        shipper_wallet.balance = float(shipper_wallet.balance) + amount
-        shipper_wallet.escrow_balance = float(shipper_wallet.escrow_balance) - amount
-        shipper_wallet.updated_at = now
-
-        escrow.status = EscrowStatus.REFUNDED
-        escrow.refunded_at = now
-        dispute.shipper_refund_amount = amount
-        dispute.courier_payout_amount = 0
-
-        txn = Transaction(
-            wallet_id=shipper_wallet.id,
-            type=TransactionType.ESCROW_REFUND,
-            amount=amount,
-            currency=currency,
-            fee=0.00,
-            net_amount=amount,
-            balance_after=float(shipper_wallet.balance),
-            status=TransactionStatus.COMPLETED,
-            reference_type="dispute",
-            reference_id=str(dispute.id),
-            description=f"Dispute resolved in shipper's favour — full refund for trip {escrow.trip_id}",
-            completed_at=now,
-        )
-        db.add(txn)
-
+        shipper_refund, courier_payout, platform_take = amount, 0.0, 0.0
     elif body.resolution == "resolved_courier":
         # Full payout to courier (minus commission)
-        commission = round(amount * PLATFORM_COMMISSION_RATE, 2)
-        courier_payout = round(amount - commission, 2)
-
-        shipper_wallet.escrow_balance = float(shipper_wallet.escrow_balance) - amount
-        shipper_wallet.updated_at = now
-
-        if courier_wallet is None:
-            courier_wallet = Wallet(
-                user_id=trip.courier_id if trip else escrow.courier_wallet_id,
-                currency=currency,
-                balance=0.00,
-                escrow_balance=0.00,
-                total_deposited=0.00,
-                total_withdrawn=0.00,
-                total_earned=0.00,
-                status=WalletStatus.ACTIVE,
-            )
-            db.add(courier_wallet)
-            await db.flush()
-
-        courier_wallet.balance = float(courier_wallet.balance) + courier_payout
-        courier_wallet.total_earned = float(courier_wallet.total_earned) + courier_payout
-        courier_wallet.updated_at = now
-
-        escrow.platform_commission_amount = commission
-        escrow.courier_payout_amount = courier_payout
-        escrow.status = EscrowStatus.RELEASED
-        escrow.released_at = now
-        dispute.courier_payout_amount = courier_payout
-        dispute.shipper_refund_amount = 0
-
-        # Commission txn
-        db.add(Transaction(
-            wallet_id=shipper_wallet.id,
-            type=TransactionType.COMMISSION,
-            amount=commission,
-            currency=currency,
-            fee=0.00,
-            net_amount=commission,
-            balance_after=float(shipper_wallet.balance),
-            status=TransactionStatus.COMPLETED,
-            reference_type="dispute",
-            reference_id=str(dispute.id),
-            description=f"Platform commission after dispute resolution — trip {escrow.trip_id}",
-            completed_at=now,
-        ))
-        # Courier credit
-        db.add(Transaction(
-            wallet_id=courier_wallet.id,
-            type=TransactionType.ESCROW_RELEASE,
-            amount=courier_payout,
-            currency=currency,
-            fee=commission,
-            net_amount=courier_payout,
-            balance_after=float(courier_wallet.balance),
-            status=TransactionStatus.COMPLETED,
-            reference_type="dispute",
-            reference_id=str(dispute.id),
-            description=f"Dispute resolved in courier's favour — trip {escrow.trip_id}",
-            completed_at=now,
-        ))
-
-    elif body.resolution == "resolved_split":
-        # Custom split
+        platform_take = round(amount * PLATFORM_COMMISSION_RATE, 2)
+        courier_payout = round(amount - platform_take, 2)
+        shipper_refund = 0.0
+    else:
+        # Custom split — platform keeps the remainder as commission
         shipper_refund = body.shipper_refund_amount or 0
         courier_payout = body.courier_payout_amount or 0
-
         if round(shipper_refund + courier_payout, 2) > amount:
             raise HTTPException(
                 status_code=400,
                 detail=f"Split amounts ({currency} {shipper_refund + courier_payout:.2f}) "
                        f"exceed escrow amount ({currency} {amount:.2f})",
             )
+        platform_take = round(amount - shipper_refund - courier_payout, 2)
 
-        shipper_wallet.escrow_balance = float(shipper_wallet.escrow_balance) - amount
-        shipper_wallet.updated_at = now
+    # Older holds may predate the courier wallet; give it one if paid
+    if courier_wallet_id is None and courier_payout > 0:
+        courier_wallet_id = await ensure_wallet_id(db, escrow.trip.courier_id, currency)
+        escrow.courier_wallet_id = courier_wallet_id
+
+    # Only plain assignments from here on; every write is emitted together
+    # below.  Ledger rows get balance_after once the wallet UPDATE has
+    # returned the new balances.
+    wallet_deltas: dict[uuid.UUID, dict[str, float]] = {
+        shipper_wallet_id: {"escrow_balance": -amount},
+    }
+    if shipper_refund > 0:
+        wallet_deltas[shipper_wallet_id]["balance"] = shipper_refund
+    if courier_payout > 0:
+        wallet_deltas[courier_wallet_id] = {
+            "balance": courier_payout,
+            "total_earned": courier_payout,
+        }
+
+    tx_base: TransactionRow = {
+        **_BASE_TX,
+        "currency": currency,
+        "reference_type": "dispute",
+        "reference_id": dispute_id_str,
+        "completed_at": now,
+    }
+    ledger: list[TransactionRow] = []
+
+    dispute.shipper_refund_amount = shipper_refund
+    dispute.courier_payout_amount = courier_payout
 
-        if shipper_refund > 0:
-            shipper_wallet.balance = float(shipper_wallet.balance) + shipper_refund
-            db.add(Transaction(
-                wallet_id=shipper_wallet.id,
-                type=TransactionType.ESCROW_REFUND,
-                amount=shipper_refund,
-                currency=currency,
-                fee=0.00,
-                net_amount=shipper_refund,
-                balance_after=float(shipper_wallet.balance),
-                status=TransactionStatus.COMPLETED,
-                reference_type="dispute",
-                reference_id=str(dispute.id),
-                description=f"Partial refund (dispute split) — trip {escrow.trip_id}",
-                completed_at=now,
-            ))
+    if body.resolution == "resolved_shipper":
+        escrow.status = EscrowStatus.REFUNDED
+        escrow.refunded_at = now
+
+        ledger.append({
+            **tx_base,
+            "wallet_id": shipper_wallet_id,
+            "type": TransactionType.ESCROW_REFUND,
+            "amount": amount,
+            "net_amount": amount,
+            "description": _DESC_DISPUTE_SHIPPER.format(trip_id_str),
+        })
+
+    elif body.resolution == "resolved_courier":
+        escrow.platform_commission_amount = platform_take
+        escrow.courier_payout_amount = courier_payout
+        escrow.status = EscrowStatus.RELEASED
+        escrow.released_at = now
 
-        if courier_payout > 0:
-            if courier_wallet is None:
-                courier_wallet = Wallet(
-                    user_id=trip.courier_id if trip else uuid.uuid4(),
-                    currency=currency,
-                    balance=0.00,
-                    escrow_balance=0.00,
-                    total_deposited=0.00,
-                    total_withdrawn=0.00,
-                    total_earned=0.00,
-                    status=WalletStatus.ACTIVE,
-                )
-                db.add(courier_wallet)
-                await db.flush()
-
-            courier_wallet.balance = float(courier_wallet.balance) + courier_payout
-            courier_wallet.total_earned = float(courier_wallet.total_earned) + courier_payout
-            courier_wallet.updated_at = now
-
-            db.add(Transaction(
-                wallet_id=courier_wallet.id,
-                type=TransactionType.ESCROW_RELEASE,
-                amount=courier_payout,
-                currency=currency,
-                fee=0.00,
-                net_amount=courier_payout,
-                balance_after=float(courier_wallet.balance),
-                status=TransactionStatus.COMPLETED,
-                reference_type="dispute",
-                reference_id=str(dispute.id),
-                description=f"Partial payout (dispute split) — trip {escrow.trip_id}",
-                completed_at=now,
-            ))
-
-        # Platform keeps remainder as commission
-        platform_take = round(amount - shipper_refund - courier_payout, 2)
         if platform_take > 0:
-            db.add(Transaction(
-                wallet_id=shipper_wallet.id,
-                type=TransactionType.COMMISSION,
-                amount=platform_take,
-                currency=currency,
-                fee=0.00,
-                net_amount=platform_take,
-                balance_after=float(shipper_wallet.balance),
-                status=TransactionStatus.COMPLETED,
-                reference_type="dispute",
-                reference_id=str(dispute.id),
-                description=f"Platform commission from dispute split — trip {escrow.trip_id}",
-                completed_at=now,
-            ))
+            ledger.append({
+                **tx_base,
+                "wallet_id": commission_wallet_id,
+                "type": TransactionType.COMMISSION,
+                "amount": platform_take,
+                "net_amount": platform_take,
+                "description": _DESC_DISPUTE_COMMISSION.format(trip_id_str),
+            })
+        ledger.append({
+            **tx_base,
+            "wallet_id": courier_wallet_id,
+            "type": TransactionType.ESCROW_RELEASE,
+            "amount": courier_payout,
+            "fee": platform_take,
+            "net_amount": courier_payout,
+            "description": _DESC_DISPUTE_COURIER.format(trip_id_str),
+        })
 
+    else:
         escrow.status = EscrowStatus.PARTIALLY_RELEASED
         escrow.released_at = now
         escrow.courier_payout_amount = courier_payout
         escrow.platform_commission_amount = platform_take
-        dispute.shipper_refund_amount = shipper_refund
-        dispute.courier_payout_amount = courier_payout
+
+        if shipper_refund > 0:
+            ledger.append({
+                **tx_base,
+                "wallet_id": shipper_wallet_id,
+                "type": TransactionType.ESCROW_REFUND,
+                "amount": shipper_refund,
+                "net_amount": shipper_refund,
+                "description": _DESC_SPLIT_REFUND.format(trip_id_str),
+            })
+        if courier_payout > 0:
+            ledger.append({
+                **tx_base,
+                "wallet_id": courier_wallet_id,
+                "type": TransactionType.ESCROW_RELEASE,
+                "amount": courier_payout,
+                "net_amount": courier_payout,
+                "description": _DESC_SPLIT_PAYOUT.format(trip_id_str),
+            })
+        if platform_take > 0:
+            ledger.append({
+                **tx_base,
+                "wallet_id": commission_wallet_id,
+                "type": TransactionType.COMMISSION,
+                "amount": platform_take,
+                "net_amount": platform_take,
+                "description": _DESC_SPLIT_COMMISSION.format(trip_id_str),
+            })
 
     # Finalize dispute
     dispute.status = DisputeStatus(body.resolution)
     dispute.resolution_notes = body.resolution_notes
     dispute.resolved_by_user_id = user.id
+    dispute.resolved_by = user
     dispute.resolved_at = now
     dispute.updated_at = now
 
-    await db.flush()
-    await db.refresh(dispute, attribute_names=["raised_by", "against_user", "resolved_by"])
+    # ── Emit every write back-to-back ────────────────────────
+    # begin_nested() flushes the escrow/dispute UPDATEs, then inside the
+    # savepoint the wallets move in one UPDATE and the ledger goes out as
+    # one multi-row INSERT.
+    try:
+        async with db.begin_nested():
+            balances = await apply_wallet_deltas(db, wallet_deltas, now)
+            ledger_ids: list[str] = []
+            if ledger:
+                # The platform wallet is not in the UPDATE (see release_escrow)
+                for row in ledger:
+                    row["balance_after"] = balances.get(row["wallet_id"])
+                ledger_result = await db.execute(
+                    insert(Transaction).returning(Transaction.id, Transaction.type),
+                    ledger,
+                )
+                # Ids come back in-band — no refresh needed for the audit trail
+                ledger_ids = [
+                    f"{txn_type.value}:{txn_id}" for txn_id, txn_type in ledger_result.all()
+                ]
+
+            await db.execute(
+                insert(AuditLog),
+                [{
+                    "entity_type": "dispute",
+                    "entity_id": dispute_id_str,
+                    "action": f"dispute.{body.resolution}",
+                    "actor_id": user.id,
+                    "changes": json.dumps({"transactions": ledger_ids}),
+                }],
+            )
 
-    return build_dispute_response(dispute)
+            # Notifications go out via the outbox dispatcher, only once
+            # this transaction has committed.
+            await db.execute(
+                insert(OutboxEvent),
+                [{
+                    "aggregate_type": "dispute",
+                    "aggregate_id": dispute_id_str,
+                    "event_type": "dispute.resolved",
+                    "payload": {
+                        "dispute_id": dispute_id_str,
+                        "trip_id": trip_id_str,
+                        "resolution": body.resolution,
+                        "raised_by_user_id": str(dispute.raised_by_user_id),
+                        "against_user_id": str(dispute.against_user_id),
+                        "shipper_refund_amount": float(dispute.shipper_refund_amount or 0),
+                        "courier_payout_amount": float(dispute.courier_payout_amount or 0),
+                        "currency": currency,
+                        "transactions": ledger_ids,
+                    },
+                    "created_at": now,
+                }],
+            )
+    except IntegrityError as exc:
+        # A replayed request re-inserts the same ledger rows
+        if not violates(exc, "uq_txn_wallet_ref_type"):
+            raise
+        raise HTTPException(status_code=409, detail="Dispute has already been resolved")
+
+    return ORJSONResponse(build_dispute_response(dispute))
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -965,30 +1260,49 @@ async def escalate_dispute(
     dispute_id: uuid.UUID,
     user: User = Depends(require_any_authenticated),
     db: AsyncSession = Depends(get_db),
-) -> DisputeResponse:
-    """Mark a dispute for escalated review (either party or admin can escalate)."""
-    result = await db.execute(
-        select(Dispute).where(Dispute.id == dispute_id)
-    )
-    dispute = result.scalar_one_or_none()
-    if not dispute:
-        raise HTTPException(status_code=404, detail="Dispute not found")
+) -> ORJSONResponse:
+    """
+    Mark a dispute for escalated review (either party or admin can escalate).
 
-    user_roles = user.role_names
-    is_admin = "system_admin" in user_roles or "org_admin" in user_roles
-    is_party = user.id in (dispute.raised_by_user_id, dispute.against_user_id)
-    if not (is_admin or is_party):
-        raise HTTPException(status_code=403, detail="Not authorised to escalate this dispute")
+    The status change, eligibility and party check are a single
+    UPDATE ... RETURNING; only when nothing matched is the row read again
+    to pick the right error.
+    """
+    now = datetime.now(_UTC)
+    is_admin = not ADMIN_ROLES.isdisjoint(user.role_set)
+    escalatable = (DisputeStatus.OPEN, DisputeStatus.UNDER_REVIEW)
+
+    stmt = (
+        update(Dispute)
+        .where(Dispute.id == dispute_id, Dispute.status.in_(escalatable))
+        .values(status=DisputeStatus.ESCALATED, updated_at=now)
+        .returning(Dispute)
+        .options(*DISPUTE_RESPONSE_LOADS)
+        .execution_options(populate_existing=True)
+    )
+    if not is_admin:
+        stmt = stmt.where(
+            (Dispute.raised_by_user_id == user.id)
+            | (Dispute.against_user_id == user.id)
+        )
 
-    if dispute.status not in (DisputeStatus.OPEN, DisputeStatus.UNDER_REVIEW):
+    result = await db.execute(stmt)
+    dispute = result.scalar_one_or_none()
+    if dispute is None:
+        existing = (await db.execute(
+            select(
+                Dispute.raised_by_user_id,
+                Dispute.against_user_id,
+                Dispute.status,
+            ).where(Dispute.id == dispute_id)
+        )).one_or_none()
+        if existing is None:
+            raise HTTPException(status_code=404, detail="Dispute not found")
+        if not (is_admin or user.id in (existing.raised_by_user_id, existing.against_user_id)):
+            raise HTTPException(status_code=403, detail="Not authorised to escalate this dispute")
         raise HTTPException(
             status_code=400,
-            detail=f"Cannot escalate dispute with status: {dispute.status.value}",
+            detail=f"Cannot escalate dispute with status: {existing.status.value}",
         )
 
-    dispute.status = DisputeStatus.ESCALATED
-    dispute.updated_at = datetime.now(timezone.utc)
-    await db.flush()
-    await db.refresh(dispute, attribute_names=["raised_by", "against_user", "resolved_by"])
-
-    return build_dispute_response(dispute)
+    return ORJSONResponse(build_dispute_response(dispute))
@@ -14,34 +14,61 @@ GET  /fraud/signals/{user_id}          — List raw signals for a user
 
 from __future__ import annotations
 
-import json
+import asyncio
+import base64
+import logging
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+import numpy as np
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, func, insert, or_, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, lazyload, load_only
 
 from app.api.deps.auth import (
     get_current_active_user,
     require_system_admin,
 )
-from app.core.database import get_db
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import async_session_factory, get_db
+from app.core.responses import ORJSONResponse
 from app.models.fraud import (
     AlertStatus,
     DecisionAction,
     FraudAlert,
     FraudCategory,
+    FraudCategoryStat,
     FraudDecision,
     FraudSignal as FraudSignalModel,
     RiskLevel,
     RiskProfile,
     SignalSeverity,
 )
-from app.models.freight import FreightBid, FreightListing, FreightTrip
+from app.models.freight import (
+    BidStatus,
+    FreightBid,
+    FreightListing,
+    FreightTrip,
+    ListingStatus,
+    TripStatus,
+)
 from app.models.user import Organization, User
-from app.models.wallet import MoMoPayment, Transaction, Wallet
+from app.models.wallet import (
+    Dispute,
+    DisputeReason,
+    DisputeStatus,
+    MoMoPayment,
+    Transaction,
+    TransactionStatus,
+    TransactionType,
+    Wallet,
+)
+from app.ml._fraud_numeric import count_cycles, count_splits
 from app.ml.fraud import (
     FraudScanResult,
     Signal,
@@ -63,13 +90,228 @@ from app.schemas.fraud import (
     RiskProfileResponse,
 )
 
+logger = logging.getLogger("loadmovegh.api.fraud")
+
 router = APIRouter(prefix="/fraud", tags=["Fraud Detection"])
 
+# Time windows for the payment-abuse patterns
+_CYCLE_WINDOW = timedelta(hours=1).total_seconds()
+_SPLIT_WINDOW = timedelta(minutes=10).total_seconds()
+
+# Server-side cursor batch size when streaming a wallet's transactions
+_TXN_STREAM_BATCH = 1000
+
+# Transaction type/status → small int code, resolved once at import so
+# the snapshot masks are integer compares rather than per-element
+# Python string equality on object arrays
+_TXN_TYPE_CODE = {t: i for i, t in enumerate(TransactionType)}
+_TXN_STATUS_CODE = {st: i for i, st in enumerate(TransactionStatus)}
+_DEPOSIT = _TXN_TYPE_CODE[TransactionType.DEPOSIT]
+_WITHDRAWAL = _TXN_TYPE_CODE[TransactionType.WITHDRAWAL]
+_COMPLETED = _TXN_STATUS_CODE[TransactionStatus.COMPLETED]
+_PROCESSING = _TXN_STATUS_CODE[TransactionStatus.PROCESSING]
+_FAILED = _TXN_STATUS_CODE[TransactionStatus.FAILED]
+
+_EMPTY_TXN_ARRAYS = (
+    np.empty(0, dtype=np.int8),
+    np.empty(0, dtype=np.int8),
+    np.empty(0, dtype=np.float64),
+    np.empty(0, dtype=np.float64),
+)
+
+# Alert-list totals per (status, category).  Cleared in this worker
+# whenever an alert is created or changes status; other workers catch up
+# within the TTL.
+_alert_totals = TTLCache(ttl=settings.FRAUD_ALERT_TOTAL_TTL_SECONDS)
+
+# Admin dashboard aggregates (one entry), cleared alongside _alert_totals
+_dashboard_cache = TTLCache(ttl=settings.FRAUD_DASHBOARD_TTL_SECONDS, maxsize=1)
+
+# Value → enum lookups for engine output, built once at import
+_CATEGORY_BY_VALUE = {c.value: c for c in FraudCategory}
+_SEVERITY_BY_VALUE = {s.value: s for s in SignalSeverity}
+_RISK_LEVEL_BY_VALUE = {r.value: r for r in RiskLevel}
+_ACTION_BY_VALUE = {a.value: a for a in DecisionAction}
+
+# Auto-actions that set RiskProfile.is_restricted
+_RESTRICTING_ACTIONS = frozenset({
+    "restrict_bidding", "restrict_withdrawals",
+    "freeze_wallet", "suspend_account", "ban_account",
+})
+
+# Admin decision → resulting alert status
+_ACTION_TO_STATUS = {
+    "clear": AlertStatus.RESOLVED_CLEAR,
+    "warning": AlertStatus.RESOLVED_WARNING,
+    "freeze_wallet": AlertStatus.RESOLVED_RESTRICT,
+    "suspend_account": AlertStatus.RESOLVED_RESTRICT,
+    "restrict_bidding": AlertStatus.RESOLVED_RESTRICT,
+    "restrict_withdrawals": AlertStatus.RESOLVED_RESTRICT,
+    "ban_account": AlertStatus.RESOLVED_BAN,
+    "manual_review": AlertStatus.INVESTIGATING,
+}
+
+# Global 90-day accepted-bid price stats (one entry)
+_market_cache = TTLCache(ttl=settings.FRAUD_MARKET_STATS_TTL_SECONDS, maxsize=1)
+
+# Scan responses keyed by (user_id, activity version) — see
+# _activity_version.  A re-scan with no new activity is served from here
+# without rebuilding the snapshot or persisting duplicate signals.
+_scan_cache = TTLCache(ttl=settings.FRAUD_SCAN_CACHE_TTL_SECONDS)
+
+# Alert responses only need the subject's name, joined into the alert
+# query itself.  Without this the mapper-level selectin loads pull each
+# user's organisation (and its members) and roles, plus the assignee.
+_ALERT_RESPONSE_LOAD = (
+    joinedload(FraudAlert.user).options(load_only(User.full_name), lazyload("*")),
+    lazyload(FraudAlert.assigned_to),
+)
+
 
 # ───────────────────────────────────────────────────────────
 #  SNAPSHOT BUILDER (hydrates from DB)
 # ───────────────────────────────────────────────────────────
 
+async def _fetch_scalars(stmt) -> list:
+    """
+    Run one read-only snapshot query on its own short-lived session.
+
+    An AsyncSession drives a single connection, so the independent
+    snapshot queries each get a session of their own to go out
+    concurrently under asyncio.gather.
+    """
+    async with async_session_factory() as session:
+        return list((await session.execute(stmt)).scalars().all())
+
+
+async def _fetch_rows(stmt) -> list:
+    async with async_session_factory() as session:
+        return list((await session.execute(stmt)).all())
+
+
+async def _fetch_row(stmt):
+    async with async_session_factory() as session:
+        return (await session.execute(stmt)).one_or_none()
+
+
+async def _fetch_txn_arrays(wallet_id: uuid.UUID) -> tuple[np.ndarray, ...]:
+    """
+    A wallet's transactions as (type codes, status codes, amounts,
+    timestamps) column arrays, oldest first.
+
+    Rows are streamed through a server-side cursor in batches of
+    _TXN_STREAM_BATCH and each batch is packed into arrays straight away,
+    so a wallet with 10⁵ transactions never holds 10⁵ Row objects.
+    """
+    stmt = (
+        select(
+            Transaction.type,
+            Transaction.status,
+            Transaction.amount,
+            Transaction.created_at,
+        )
+        .where(Transaction.wallet_id == wallet_id)
+        # Time-ordered so the pattern kernels can sweep forward
+        .order_by(Transaction.created_at)
+        .execution_options(yield_per=_TXN_STREAM_BATCH)
+    )
+    chunks: list[tuple[np.ndarray, ...]] = []
+    async with async_session_factory() as session:
+        result = await session.stream(stmt)
+        async for rows in result.partitions():
+            n = len(rows)
+            chunks.append((
+                np.fromiter(
+                    (_TXN_TYPE_CODE[t] for t, _, _, _ in rows), dtype=np.int8, count=n
+                ),
+                np.fromiter(
+                    (_TXN_STATUS_CODE[st] for _, st, _, _ in rows), dtype=np.int8, count=n
+                ),
+                np.fromiter(
+                    (float(a) if a else 0.0 for _, _, a, _ in rows),
+                    dtype=np.float64, count=n,
+                ),
+                np.fromiter(
+                    (c.timestamp() for _, _, _, c in rows), dtype=np.float64, count=n
+                ),
+            ))
+    if not chunks:
+        return _EMPTY_TXN_ARRAYS
+    if len(chunks) == 1:
+        return chunks[0]
+    return tuple(np.concatenate(col) for col in zip(*chunks))
+
+
+async def refresh_category_stats() -> None:
+    """
+    Recompute fraud_category_stats: one scan of risk_profiles for all
+    five averages and high-risk counts, then a five-row upsert.
+    """
+    score_cols = {c: getattr(RiskProfile, f"{c.value}_score") for c in FraudCategory}
+    async with async_session_factory() as session:
+        row = (
+            await session.execute(select(
+                *(func.avg(col) for col in score_cols.values()),
+                *(func.count().filter(col >= 50.0) for col in score_cols.values()),
+            ))
+        ).one()
+        n = len(score_cols)
+        now = datetime.now(timezone.utc)
+        stmt = pg_insert(FraudCategoryStat).values([
+            {
+                "category": cat,
+                "avg_risk_score": float(row[i] or 0.0),
+                "high_risk_users": row[n + i],
+                "refreshed_at": now,
+            }
+            for i, cat in enumerate(score_cols)
+        ])
+        await session.execute(stmt.on_conflict_do_update(
+            index_elements=[FraudCategoryStat.category],
+            set_={
+                "avg_risk_score": stmt.excluded.avg_risk_score,
+                "high_risk_users": stmt.excluded.high_risk_users,
+                "refreshed_at": stmt.excluded.refreshed_at,
+            },
+        ))
+        await session.commit()
+
+
+async def run_category_stats_refresher() -> None:
+    """Refresh the dashboard's category aggregates forever."""
+    while True:
+        try:
+            await refresh_category_stats()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("Fraud category stats refresh failed", exc_info=True)
+        await asyncio.sleep(settings.FRAUD_CATEGORY_STATS_REFRESH_SECONDS)
+
+
+async def _market_stats() -> tuple[float, float]:
+    """
+    Mean and standard deviation of accepted bid prices across all routes
+    over the last 90 days.  Identical for every user and slow-moving, so
+    it is computed at most once per FRAUD_MARKET_STATS_TTL_SECONDS.
+    """
+    async def load() -> tuple[float, float]:
+        ninety_days_ago = datetime.now(timezone.utc) - timedelta(days=90)
+        row = await _fetch_row(
+            select(func.avg(FreightBid.price), func.stddev(FreightBid.price)).where(
+                and_(
+                    FreightBid.status == "accepted",
+                    FreightBid.created_at >= ninety_days_ago,
+                )
+            )
+        )
+        avg = float(row[0]) if row and row[0] else 0.0
+        std = float(row[1]) if row and row[1] else 0.0
+        return avg, std
+
+    return await _market_cache.get_or_load("accepted_bids_90d", load)
+
+
 async def _build_snapshot(
     user_id: uuid.UUID,
     db: AsyncSession,
@@ -85,6 +327,99 @@ async def _build_snapshot(
 
     now = datetime.now(timezone.utc)
     account_age = (now - user.created_at).days if user.created_at else 0
+    day_ago = now - timedelta(hours=24)
+    week_ago = now - timedelta(days=7)
+    month_ago = now - timedelta(days=30)
+
+    # ── Independent queries, issued concurrently ─────────────
+    # Listings, bids and trips are only ever reduced to counters, so
+    # Postgres does the counting and returns one row per table.
+    cancelled_trip = FreightTrip.status == TripStatus.CANCELLED
+    listing_q = select(
+        func.count(),
+        func.count().filter(
+            FreightListing.status.in_((ListingStatus.ACTIVE, ListingStatus.BIDDING))
+        ),
+        func.count().filter(FreightListing.status == ListingStatus.CANCELLED),
+        func.count().filter(FreightListing.bid_count == 0),
+        func.count().filter(FreightListing.created_at >= month_ago),
+    ).where(FreightListing.shipper_id == user_id)
+    bid_stats_q = select(
+        func.count(),
+        func.count().filter(FreightBid.status == BidStatus.ACCEPTED),
+        func.count().filter(FreightBid.status == BidStatus.REJECTED),
+        func.count().filter(FreightBid.status == BidStatus.WITHDRAWN),
+        func.count().filter(FreightBid.created_at >= day_ago),
+        func.count().filter(FreightBid.created_at >= week_ago),
+        # The ML engine needs the raw 30-day prices, not just their mean
+        func.array_agg(FreightBid.price).filter(
+            FreightBid.created_at >= month_ago, FreightBid.price != 0
+        ),
+    ).where(FreightBid.courier_id == user_id)
+    # Counterparty pairs: the engine only looks at the three most frequent
+    # shippers this courier has bid to, so Postgres counts and ranks them
+    pair_count = func.count().label("n")
+    pair_q = (
+        select(FreightListing.shipper_id, pair_count)
+        .join(FreightListing, FreightBid.listing_id == FreightListing.id)
+        .where(FreightBid.courier_id == user_id)
+        .group_by(FreightListing.shipper_id)
+        .order_by(pair_count.desc())
+        .limit(3)
+    )
+    trip_q = select(
+        func.count(),
+        func.count().filter(
+            FreightTrip.status.in_((TripStatus.CONFIRMED, TripStatus.DELIVERED))
+        ),
+        func.count().filter(cancelled_trip),
+        func.count().filter(FreightTrip.status == TripStatus.DISPUTED),
+        func.count().filter(cancelled_trip, FreightTrip.updated_at >= week_ago),
+        func.count().filter(cancelled_trip, FreightTrip.updated_at >= day_ago),
+        # Cancel-after-accept: trips that were assigned (bid accepted) then cancelled
+        func.count().filter(cancelled_trip, FreightTrip.started_at.is_not(None)),
+    ).where(FreightTrip.courier_id == user_id)
+    # Wallet id plus its MoMo phone diversity in the same round trip
+    wallet_q = select(
+        Wallet.id,
+        select(func.count(func.distinct(MoMoPayment.phone_number)))
+        .where(MoMoPayment.wallet_id == Wallet.id)
+        .scalar_subquery(),
+    ).where(Wallet.user_id == user_id)
+    dispute_q = select(
+        func.count().filter(Dispute.raised_by_user_id == user_id),
+        func.count().filter(
+            Dispute.against_user_id == user_id,
+            Dispute.status.in_((DisputeStatus.RESOLVED_SHIPPER, DisputeStatus.RESOLVED_COURIER)),
+        ),
+        func.count().filter(Dispute.reason == DisputeReason.FRAUD),
+    ).where(
+        (Dispute.raised_by_user_id == user_id) | (Dispute.against_user_id == user_id)
+    )
+    org_q = (
+        _fetch_scalars(select(Organization).where(Organization.id == user.org_id))
+        if user.org_id else asyncio.sleep(0, result=[])
+    )
+
+    (
+        orgs, listing_row, bid_row, pair_rows, (market_avg, market_std), trip_row,
+        wallets, dispute_row,
+    ) = await asyncio.gather(
+        org_q,
+        _fetch_row(listing_q),
+        _fetch_row(bid_stats_q),
+        _fetch_rows(pair_q),
+        _market_stats(),
+        _fetch_row(trip_q),
+        _fetch_rows(wallet_q),
+        _fetch_row(dispute_q),
+    )
+    wallet_id, distinct_phones = wallets[0] if wallets else (None, 0)
+
+    # Wallet-dependent follow-up
+    types, statuses, amounts, ts = _EMPTY_TXN_ARRAYS
+    if wallet_id:
+        types, statuses, amounts, ts = await _fetch_txn_arrays(wallet_id)
 
     org_name = ""
     org_type = ""
@@ -92,209 +427,80 @@ async def _build_snapshot(
     org_reg = ""
     org_created_days = 0
     org_id_str: Optional[str] = None
-    if user.org_id:
-        org = await db.get(Organization, user.org_id)
-        if org:
-            org_id_str = str(org.id)
-            org_name = org.name or ""
-            org_type = org.type.value if org.type else ""
-            org_status = org.status.value if org.status else ""
-            org_reg = org.registration_number or ""
-            org_created_days = (now - org.created_at).days if org.created_at else 0
+    if orgs:
+        org = orgs[0]
+        org_id_str = str(org.id)
+        org_name = org.name or ""
+        org_type = org.type.value if org.type else ""
+        org_status = org.status.value if org.status else ""
+        org_reg = org.registration_number or ""
+        org_created_days = (now - org.created_at).days if org.created_at else 0
 
     roles = user.role_names
 
     # ── Listings ─────────────────────────────────────────────
-    listing_q = select(FreightListing).where(FreightListing.shipper_id == user_id)
-    listings_result = await db.execute(listing_q)
-    listings = listings_result.scalars().all()
-
-    total_listings = len(listings)
-    active_listings = sum(1 for l in listings if l.status.value in ("active", "bidding"))
-    cancelled_listings = sum(1 for l in listings if l.status.value == "cancelled")
-    listings_no_bids = sum(1 for l in listings if l.bid_count == 0)
-    month_ago = now - timedelta(days=30)
-    listings_30d = sum(1 for l in listings if l.created_at and l.created_at >= month_ago)
+    (
+        total_listings, active_listings, cancelled_listings,
+        listings_no_bids, listings_30d,
+    ) = listing_row
 
     # ── Bids ─────────────────────────────────────────────────
-    bid_q = select(FreightBid).where(FreightBid.courier_id == user_id)
-    bids_result = await db.execute(bid_q)
-    bids = bids_result.scalars().all()
-
-    total_bids = len(bids)
-    bids_accepted = sum(1 for b in bids if b.status.value == "accepted")
-    bids_rejected = sum(1 for b in bids if b.status.value == "rejected")
-    bids_withdrawn = sum(1 for b in bids if b.status.value == "withdrawn")
-
-    day_ago = now - timedelta(hours=24)
-    week_ago = now - timedelta(days=7)
-    bids_24h = sum(1 for b in bids if b.created_at and b.created_at >= day_ago)
-    bids_7d = sum(1 for b in bids if b.created_at and b.created_at >= week_ago)
-
-    bid_prices_30d = [
-        float(b.price) for b in bids
-        if b.created_at and b.created_at >= month_ago and b.price
-    ]
+    (
+        total_bids, bids_accepted, bids_rejected, bids_withdrawn,
+        bids_24h, bids_7d, prices_30d,
+    ) = bid_row
+    bid_prices_30d = [float(p) for p in prices_30d or ()]
     avg_bid = sum(bid_prices_30d) / len(bid_prices_30d) if bid_prices_30d else 0.0
 
     # ── Market pricing context ───────────────────────────────
-    # Get average accepted bid price across all routes in the last 90 days
-    ninety_days_ago = now - timedelta(days=90)
-    market_q = select(func.avg(FreightBid.price), func.stddev(FreightBid.price)).where(
-        and_(
-            FreightBid.status == "accepted",
-            FreightBid.created_at >= ninety_days_ago,
-        )
-    )
-    market_result = await db.execute(market_q)
-    market_row = market_result.one_or_none()
-    market_avg = float(market_row[0]) if market_row and market_row[0] else 0.0
-    market_std = float(market_row[1]) if market_row and market_row[1] else 0.0
     bid_vs_market = (avg_bid / market_avg) if market_avg > 0 and avg_bid > 0 else 1.0
 
     # ── Trips ────────────────────────────────────────────────
-    trip_q = select(FreightTrip).where(FreightTrip.courier_id == user_id)
-    trips_result = await db.execute(trip_q)
-    trips = trips_result.scalars().all()
-
-    total_trips = len(trips)
-    trips_completed = sum(1 for t in trips if t.status.value in ("confirmed", "delivered"))
-    trips_cancelled = sum(1 for t in trips if t.status.value == "cancelled")
-    trips_disputed = sum(1 for t in trips if t.status.value == "disputed")
-    cancel_7d = sum(
-        1 for t in trips
-        if t.status.value == "cancelled" and t.updated_at and t.updated_at >= week_ago
-    )
-    cancel_24h = sum(
-        1 for t in trips
-        if t.status.value == "cancelled" and t.updated_at and t.updated_at >= day_ago
-    )
-    # Cancel-after-accept: trips that were assigned (bid accepted) then cancelled
-    cancel_after_accept = sum(
-        1 for t in trips
-        if t.status.value == "cancelled" and t.started_at is not None
-    )
+    (
+        total_trips, trips_completed, trips_cancelled, trips_disputed,
+        cancel_7d, cancel_24h, cancel_after_accept,
+    ) = trip_row
 
     # ── Wallet & Transactions ────────────────────────────────
-    wallet_q = select(Wallet).where(Wallet.user_id == user_id)
-    wallet_result = await db.execute(wallet_q)
-    wallet = wallet_result.scalar_one_or_none()
-
-    total_deposits = 0
-    total_withdrawals = 0
-    deposits_24h = 0
-    withdrawals_24h = 0
-    deposits_7d = 0
-    withdrawals_7d = 0
-    total_deposit_amount = 0.0
-    total_withdrawal_amount = 0.0
-    deposit_amount_24h = 0.0
-    withdrawal_amount_24h = 0.0
-    failed_payments_7d = 0
-    largest_deposit = 0.0
-    largest_withdrawal = 0.0
-
-    if wallet:
-        txn_q = select(Transaction).where(Transaction.wallet_id == wallet.id)
-        txn_result = await db.execute(txn_q)
-        txns = txn_result.scalars().all()
-
-        for t in txns:
-            amount = float(t.amount) if t.amount else 0.0
-            is_deposit = t.type.value == "deposit"
-            is_withdrawal = t.type.value == "withdrawal"
-            in_24h = t.created_at and t.created_at >= day_ago
-            in_7d = t.created_at and t.created_at >= week_ago
-
-            if is_deposit:
-                total_deposits += 1
-                total_deposit_amount += amount
-                if amount > largest_deposit:
-                    largest_deposit = amount
-                if in_24h:
-                    deposits_24h += 1
-                    deposit_amount_24h += amount
-                if in_7d:
-                    deposits_7d += 1
-            elif is_withdrawal:
-                total_withdrawals += 1
-                total_withdrawal_amount += amount
-                if amount > largest_withdrawal:
-                    largest_withdrawal = amount
-                if in_24h:
-                    withdrawals_24h += 1
-                    withdrawal_amount_24h += amount
-                if in_7d:
-                    withdrawals_7d += 1
-
-            if t.status.value == "failed" and in_7d:
-                failed_payments_7d += 1
-
-        # Deposit→Withdraw cycle detection (deposits followed by withdrawal within 1h)
-        deposit_times = sorted([
-            t.created_at for t in txns
-            if t.type.value == "deposit" and t.status.value == "completed" and t.created_at
-        ])
-        withdrawal_times = sorted([
-            t.created_at for t in txns
-            if t.type.value == "withdrawal" and t.status.value in ("completed", "processing")
-            and t.created_at
-        ])
-        cycles = 0
-        for dt in deposit_times:
-            for wt in withdrawal_times:
-                if timedelta(0) < (wt - dt) < timedelta(hours=1):
-                    cycles += 1
-                    break
-
-        # Split transaction detection: multiple txns within 10 min summing to round number
-        recent_deposits = sorted(
-            [t for t in txns if t.type.value == "deposit" and in_7d and t.created_at],
-            key=lambda x: x.created_at,  # type: ignore[arg-type]
-        )
-        split_count = 0
-        for i in range(len(recent_deposits)):
-            window_sum = 0.0
-            for j in range(i, min(i + 5, len(recent_deposits))):
-                if (recent_deposits[j].created_at - recent_deposits[i].created_at) < timedelta(minutes=10):  # type: ignore[operator]
-                    window_sum += float(recent_deposits[j].amount)
-            if window_sum > 0 and window_sum % 100 < 5:  # Near-round number
-                split_count += 1
-
-    else:
-        cycles = 0
-        split_count = 0
-
-    # ── MoMo phone diversity ─────────────────────────────────
-    distinct_phones = 0
-    if wallet:
-        momo_q = select(func.count(func.distinct(MoMoPayment.phone_number))).where(
-            MoMoPayment.wallet_id == wallet.id
-        )
-        momo_result = await db.execute(momo_q)
-        distinct_phones = momo_result.scalar() or 0
+    # Every counter below is a masked reduction over the column arrays
+    # instead of a branch per transaction in the interpreter.
+    dep = types == _DEPOSIT
+    wd = types == _WITHDRAWAL
+    in_24h = ts >= day_ago.timestamp()
+    in_7d = ts >= week_ago.timestamp()
+
+    total_deposits = int(dep.sum())
+    total_withdrawals = int(wd.sum())
+    deposits_24h = int((dep & in_24h).sum())
+    withdrawals_24h = int((wd & in_24h).sum())
+    deposits_7d = int((dep & in_7d).sum())
+    withdrawals_7d = int((wd & in_7d).sum())
+    total_deposit_amount = float(amounts[dep].sum())
+    total_withdrawal_amount = float(amounts[wd].sum())
+    deposit_amount_24h = float(amounts[dep & in_24h].sum())
+    withdrawal_amount_24h = float(amounts[wd & in_24h].sum())
+    failed_payments_7d = int(((statuses == _FAILED) & in_7d).sum())
+    largest_deposit = float(amounts[dep].max(initial=0.0))
+    largest_withdrawal = float(amounts[wd].max(initial=0.0))
+
+    # Deposit→withdraw cycles: completed deposit, then a completed or
+    # processing withdrawal within the hour
+    cycles = count_cycles(
+        ts[dep & (statuses == _COMPLETED)],
+        ts[wd & ((statuses == _COMPLETED) | (statuses == _PROCESSING))],
+        _CYCLE_WINDOW,
+    )
+    # Split deposits: 10-minute bursts summing to just over a round hundred
+    split_count = count_splits(ts[dep], amounts[dep], week_ago.timestamp(), _SPLIT_WINDOW)
 
     # ── Disputes ─────────────────────────────────────────────
-    from app.models.wallet import Dispute
-    dispute_q = select(Dispute).where(
-        (Dispute.raised_by_user_id == user_id) | (Dispute.against_user_id == user_id)
-    )
-    dispute_result = await db.execute(dispute_q)
-    disputes = dispute_result.scalars().all()
-
-    disputes_raised = sum(1 for d in disputes if str(d.raised_by_user_id) == str(user_id))
-    disputes_lost = sum(
-        1 for d in disputes
-        if str(d.against_user_id) == str(user_id)
-        and d.status.value in ("resolved_shipper", "resolved_courier")
-    )
-    disputes_fraud = sum(1 for d in disputes if d.reason.value == "fraud")
+    disputes_raised, disputes_lost, disputes_fraud = dispute_row
 
     # ── Counterparty patterns ────────────────────────────────
-    pairs: list[tuple[str, str]] = []
-    for b in bids:
-        if b.listing:
-            pairs.append((str(b.listing.shipper_id), str(b.courier_id)))
+    courier_id_str = str(user_id)
+    pair_counts = [
+        ((str(shipper_id), courier_id_str), count) for shipper_id, count in pair_rows
+    ]
 
     return UserBehaviourSnapshot(
         user_id=str(user_id),
@@ -353,7 +559,7 @@ async def _build_snapshot(
         disputes_raised=disputes_raised,
         disputes_lost=disputes_lost,
         disputes_as_fraud_reason=disputes_fraud,
-        shipper_courier_pairs=pairs,
+        shipper_courier_pair_counts=pair_counts,
     )
 
 
@@ -378,6 +584,74 @@ def _build_alert_response(alert: FraudAlert) -> FraudAlertResponse:
     )
 
 
+def _encode_alert_cursor(alert: FraudAlert) -> str:
+    raw = orjson.dumps([alert.priority_score, alert.created_at, alert.id])
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_alert_cursor(cursor: str) -> tuple[float, datetime, uuid.UUID]:
+    try:
+        priority, created_at, alert_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+        return float(priority), datetime.fromisoformat(created_at), uuid.UUID(alert_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _invalidate_alert_caches() -> None:
+    """Call after committing a new alert or an alert status change."""
+    _alert_totals.clear()
+    _dashboard_cache.clear()
+
+
+async def _alert_total(
+    db: AsyncSession, status_value: Optional[str], category: Optional[str]
+) -> int:
+    """
+    Cached alert count for the list header.  The unfiltered total comes
+    from the planner's row estimate, which is free; filtered totals run
+    an indexed COUNT at most once per TTL.
+    """
+    async def load() -> int:
+        if status_value is None and category is None:
+            estimate = await db.scalar(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'fraud_alerts'::regclass")
+            )
+            # -1 / 0 until the table has been analysed — fall through
+            if estimate and estimate > 0:
+                return int(estimate)
+
+        count_q = select(func.count()).select_from(FraudAlert)
+        if status_value is not None:
+            count_q = count_q.where(FraudAlert.status == AlertStatus(status_value))
+        if category is not None:
+            count_q = count_q.where(FraudAlert.category == FraudCategory(category))
+        return await db.scalar(count_q) or 0
+
+    return await _alert_totals.get_or_load((status_value, category), load)
+
+
+async def _activity_version(user_id: uuid.UUID, db: AsyncSession) -> Optional[datetime]:
+    """
+    Latest change timestamp across everything the snapshot reads, in one
+    round trip.  Any new listing, bid, trip, transaction, MoMo payment or
+    dispute moves it forward and so misses the scan cache.
+    """
+    user_wallets = select(Wallet.id).where(Wallet.user_id == user_id)
+    latest = [
+        select(func.max(User.updated_at)).where(User.id == user_id),
+        select(func.max(FreightListing.updated_at)).where(FreightListing.shipper_id == user_id),
+        select(func.max(FreightBid.updated_at)).where(FreightBid.courier_id == user_id),
+        select(func.max(FreightTrip.updated_at)).where(FreightTrip.courier_id == user_id),
+        select(func.max(Wallet.updated_at)).where(Wallet.user_id == user_id),
+        select(func.max(Transaction.created_at)).where(Transaction.wallet_id.in_(user_wallets)),
+        select(func.max(MoMoPayment.created_at)).where(MoMoPayment.wallet_id.in_(user_wallets)),
+        select(func.max(Dispute.updated_at)).where(
+            (Dispute.raised_by_user_id == user_id) | (Dispute.against_user_id == user_id)
+        ),
+    ]
+    return await db.scalar(select(func.greatest(*(q.scalar_subquery() for q in latest))))
+
+
 async def _persist_scan_results(
     scan: FraudScanResult,
     user_id: uuid.UUID,
@@ -386,80 +660,118 @@ async def _persist_scan_results(
     """
     Save signals and risk profile to DB.  Create alert if needed.
     Returns the alert_id if one was created.
+
+    Everything goes out as one statement: the profile upsert carries the
+    signal and alert INSERTs as data-modifying CTEs.  Signal and alert
+    ids are generated here, so the alert can list its signals without
+    waiting on a RETURNING round trip.
     """
     now = datetime.now(timezone.utc)
     alert_id: Optional[str] = None
 
-    # 1. Persist individual signals
-    for sig in scan.signals:
-        db.add(FraudSignalModel(
-            user_id=user_id,
-            category=FraudCategory(sig.category),
-            signal_code=sig.code,
-            severity=SignalSeverity(sig.severity),
-            score_delta=sig.score_delta,
-            description=sig.description,
-            context_json=json.dumps(sig.context) if sig.context else None,
-            entity_type=sig.entity_type or None,
-            entity_id=sig.entity_id or None,
-            is_processed=True,
-        ))
+    # 1. Signals
+    signal_rows = [
+        {
+            "id": uuid.uuid4(),
+            "user_id": user_id,
+            "category": _CATEGORY_BY_VALUE[sig.category],
+            "signal_code": sig.code,
+            "severity": _SEVERITY_BY_VALUE[sig.severity],
+            "score_delta": sig.score_delta,
+            "description": sig.description,
+            "context_json": sig.context or None,
+            "entity_type": sig.entity_type or None,
+            "entity_id": sig.entity_id or None,
+            "is_processed": True,
+            "created_at": now,
+        }
+        for sig in scan.signals
+    ]
 
-    # 2. Upsert risk profile
-    rp_q = select(RiskProfile).where(RiskProfile.user_id == user_id)
-    rp_result = await db.execute(rp_q)
-    rp = rp_result.scalar_one_or_none()
+    # 2. Upsert risk profile — INSERT ... ON CONFLICT (user_id) DO UPDATE,
+    #    so concurrent scans never race a read-modify-write of the counters
+    restricted = scan.auto_action in _RESTRICTING_ACTIONS
+    banned = scan.auto_action == "ban_account"
+    alerts_added = 1 if scan.alert_required else 0
 
-    if not rp:
-        rp = RiskProfile(user_id=user_id)
-        db.add(rp)
-
-    rp.composite_score = scan.composite_score
-    rp.risk_level = RiskLevel(scan.risk_level)
-    rp.fake_company_score = scan.category_scores.get("fake_company", 0.0)
-    rp.suspicious_bidding_score = scan.category_scores.get("suspicious_bidding", 0.0)
-    rp.unusual_pricing_score = scan.category_scores.get("unusual_pricing", 0.0)
-    rp.repeated_cancellation_score = scan.category_scores.get("repeated_cancellation", 0.0)
-    rp.payment_abuse_score = scan.category_scores.get("payment_abuse", 0.0)
-    rp.total_signals = (rp.total_signals or 0) + len(scan.signals)
-    rp.is_flagged = scan.alert_required
-    rp.last_scan_at = now
-
-    # Apply auto-actions to profile flags
-    if scan.auto_action in ("restrict_bidding", "restrict_withdrawals"):
-        rp.is_restricted = True
-    elif scan.auto_action in ("freeze_wallet", "suspend_account", "ban_account"):
-        rp.is_restricted = True
-        if scan.auto_action == "ban_account":
-            rp.is_banned = True
+    rp_stmt = pg_insert(RiskProfile).values(
+        id=uuid.uuid4(),
+        user_id=user_id,
+        composite_score=scan.composite_score,
+        risk_level=_RISK_LEVEL_BY_VALUE[scan.risk_level],
+        fake_company_score=scan.category_scores.get("fake_company", 0.0),
+        suspicious_bidding_score=scan.category_scores.get("suspicious_bidding", 0.0),
+        unusual_pricing_score=scan.category_scores.get("unusual_pricing", 0.0),
+        repeated_cancellation_score=scan.category_scores.get("repeated_cancellation", 0.0),
+        payment_abuse_score=scan.category_scores.get("payment_abuse", 0.0),
+        total_signals=len(scan.signals),
+        total_alerts=alerts_added,
+        total_enforcements=0,
+        is_flagged=scan.alert_required,
+        # Auto-actions only ever raise these flags; clearing is an admin action
+        is_restricted=restricted,
+        is_banned=banned,
+        last_scan_at=now,
+        created_at=now,
+        updated_at=now,
+    )
+    excluded = rp_stmt.excluded
+    stmt = rp_stmt.on_conflict_do_update(
+        index_elements=[RiskProfile.user_id],
+        set_={
+            "composite_score": excluded.composite_score,
+            "risk_level": excluded.risk_level,
+            "fake_company_score": excluded.fake_company_score,
+            "suspicious_bidding_score": excluded.suspicious_bidding_score,
+            "unusual_pricing_score": excluded.unusual_pricing_score,
+            "repeated_cancellation_score": excluded.repeated_cancellation_score,
+            "payment_abuse_score": excluded.payment_abuse_score,
+            "total_signals": RiskProfile.total_signals + len(scan.signals),
+            "total_alerts": RiskProfile.total_alerts + alerts_added,
+            "is_flagged": excluded.is_flagged,
+            "is_restricted": RiskProfile.is_restricted | excluded.is_restricted,
+            "is_banned": RiskProfile.is_banned | excluded.is_banned,
+            "last_scan_at": excluded.last_scan_at,
+            "updated_at": excluded.updated_at,
+        },
+    )
+    if signal_rows:
+        stmt = stmt.add_cte(
+            insert(FraudSignalModel).values(signal_rows).cte("inserted_signals")
+        )
 
     # 3. Create alert if required
     if scan.alert_required:
         # Find the top category
         top_cat = max(scan.category_scores, key=scan.category_scores.get)  # type: ignore[arg-type]
-        signal_ids = [str(uuid.uuid4()) for _ in scan.signals]  # Already persisted above
 
-        alert = FraudAlert(
-            user_id=user_id,
-            category=FraudCategory(top_cat),
-            title=f"Risk alert: {scan.risk_level.upper()} ({scan.composite_score:.0f}/100)",
-            description=(
-                f"Fraud scan detected {len(scan.signals)} signal(s) across "
-                f"{sum(1 for v in scan.category_scores.values() if v > 0)} categories. "
-                f"Top concern: {top_cat.replace('_', ' ')} "
-                f"(score {scan.category_scores[top_cat]:.0f}/100)."
-            ),
-            priority_score=scan.composite_score,
-            signal_ids_json=json.dumps(signal_ids),
-            risk_score_at_alert=scan.composite_score,
+        alert_uuid = uuid.uuid4()
+        stmt = stmt.add_cte(
+            insert(FraudAlert).values(
+                id=alert_uuid,
+                user_id=user_id,
+                category=_CATEGORY_BY_VALUE[top_cat],
+                title=f"Risk alert: {scan.risk_level.upper()} ({scan.composite_score:.0f}/100)",
+                description=(
+                    f"Fraud scan detected {len(scan.signals)} signal(s) across "
+                    f"{sum(1 for v in scan.category_scores.values() if v > 0)} categories. "
+                    f"Top concern: {top_cat.replace('_', ' ')} "
+                    f"(score {scan.category_scores[top_cat]:.0f}/100)."
+                ),
+                priority_score=scan.composite_score,
+                signal_ids_json=orjson.dumps([row["id"] for row in signal_rows]).decode(),
+                status=AlertStatus.OPEN,
+                risk_score_at_alert=scan.composite_score,
+                created_at=now,
+                updated_at=now,
+            ).cte("new_alert")
         )
-        db.add(alert)
-        rp.total_alerts = (rp.total_alerts or 0) + 1
-
-        await db.flush()
-        alert_id = str(alert.id)
+        alert_id = str(alert_uuid)
 
+    await db.execute(stmt)
     await db.commit()
+    if alert_id:
+        _invalidate_alert_caches()
     return alert_id
 
 
@@ -470,6 +782,7 @@ async def _persist_scan_results(
 @router.post(
     "/scan/{user_id}",
     response_model=FraudScanResponse,
+    response_class=ORJSONResponse,
     summary="Trigger a full fraud scan for a user",
 )
 async def scan_user(
@@ -481,42 +794,47 @@ async def scan_user(
     Runs all 5 fraud detectors against the user's full activity
     history and returns the risk assessment.  Persists signals,
     updates the risk profile, and creates an alert if warranted.
+
+    If the user has had no activity since a scan in the last few
+    minutes, that scan's result is returned as-is.
     """
     try:
         uid = uuid.UUID(user_id)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid user_id")
 
+    version = await _activity_version(uid, db)
+    payload = await _scan_cache.get_or_load(
+        (uid, version), lambda: _run_scan(uid, db)
+    )
+    return ORJSONResponse(payload)
+
+
+async def _run_scan(uid: uuid.UUID, db: AsyncSession) -> dict:
+    """
+    Scan, persist, and return the FraudScanResponse-shaped payload as a
+    plain dict.  Signal dataclasses already match FraudSignalResponse
+    field for field, so orjson encodes them directly with no Pydantic
+    round trip.
+    """
     snapshot = await _build_snapshot(uid, db)
     scan = run_fraud_scan(snapshot)
 
     # Persist results
     alert_id = await _persist_scan_results(scan, uid, db)
 
-    return FraudScanResponse(
-        user_id=scan.user_id,
-        composite_score=scan.composite_score,
-        risk_level=scan.risk_level,
-        category_scores=scan.category_scores,
-        signals=[
-            FraudSignalResponse(
-                code=s.code,
-                category=s.category,
-                severity=s.severity,
-                score_delta=s.score_delta,
-                description=s.description,
-                entity_type=s.entity_type,
-                entity_id=s.entity_id,
-                context=s.context,
-            )
-            for s in scan.signals
-        ],
-        signal_count=len(scan.signals),
-        alert_required=scan.alert_required,
-        auto_action=scan.auto_action,
-        alert_id=alert_id,
-        scan_timestamp=scan.scan_timestamp,
-    )
+    return {
+        "user_id": scan.user_id,
+        "composite_score": scan.composite_score,
+        "risk_level": scan.risk_level,
+        "category_scores": scan.category_scores,
+        "signals": scan.signals,
+        "signal_count": len(scan.signals),
+        "alert_required": scan.alert_required,
+        "auto_action": scan.auto_action,
+        "alert_id": alert_id,
+        "scan_timestamp": scan.scan_timestamp,
+    }
 
 
 # ───────────────────────────────────────────────────────────
@@ -542,14 +860,29 @@ async def get_risk_profile(
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid user_id")
 
-    # Verify user exists
-    user = await db.get(User, uid)
-    if not user:
+    # User, profile and per-category signal counts in one round trip.
+    # jsonb keys are the enum names, as stored.
+    per_category = (
+        select(FraudSignalModel.category, func.count().label("cnt"))
+        .where(FraudSignalModel.user_id == uid)
+        .group_by(FraudSignalModel.category)
+        .subquery()
+    )
+    signal_counts = (
+        select(func.jsonb_object_agg(per_category.c.category, per_category.c.cnt))
+        .scalar_subquery()
+    )
+    row = (
+        await db.execute(
+            select(User.id, RiskProfile, signal_counts)
+            .outerjoin(RiskProfile, RiskProfile.user_id == User.id)
+            .where(User.id == uid)
+            .options(lazyload(RiskProfile.user))
+        )
+    ).one_or_none()
+    if row is None:
         raise HTTPException(status_code=404, detail="User not found")
-
-    rp_q = select(RiskProfile).where(RiskProfile.user_id == uid)
-    rp_result = await db.execute(rp_q)
-    rp = rp_result.scalar_one_or_none()
+    _, rp, raw_counts = row
 
     if not rp:
         return RiskProfileResponse(
@@ -557,11 +890,8 @@ async def get_risk_profile(
             composite_score=0.0,
             risk_level="low",
             category_scores=[
-                CategoryScoreResponse(category=c, score=0.0, signal_count=0)
-                for c in [
-                    "fake_company", "suspicious_bidding", "unusual_pricing",
-                    "repeated_cancellation", "payment_abuse",
-                ]
+                CategoryScoreResponse(category=c.value, score=0.0, signal_count=0)
+                for c in FraudCategory
             ],
             total_signals=0,
             total_alerts=0,
@@ -571,41 +901,14 @@ async def get_risk_profile(
             is_banned=False,
         )
 
-    # Get signal counts per category
-    sig_q = (
-        select(FraudSignalModel.category, func.count())
-        .where(FraudSignalModel.user_id == uid)
-        .group_by(FraudSignalModel.category)
-    )
-    sig_result = await db.execute(sig_q)
-    sig_counts = {row[0].value: row[1] for row in sig_result.all()}
-
+    sig_counts = {FraudCategory[name]: cnt for name, cnt in (raw_counts or {}).items()}
     cat_scores = [
         CategoryScoreResponse(
-            category="fake_company",
-            score=rp.fake_company_score,
-            signal_count=sig_counts.get("fake_company", 0),
-        ),
-        CategoryScoreResponse(
-            category="suspicious_bidding",
-            score=rp.suspicious_bidding_score,
-            signal_count=sig_counts.get("suspicious_bidding", 0),
-        ),
-        CategoryScoreResponse(
-            category="unusual_pricing",
-            score=rp.unusual_pricing_score,
-            signal_count=sig_counts.get("unusual_pricing", 0),
-        ),
-        CategoryScoreResponse(
-            category="repeated_cancellation",
-            score=rp.repeated_cancellation_score,
-            signal_count=sig_counts.get("repeated_cancellation", 0),
-        ),
-        CategoryScoreResponse(
-            category="payment_abuse",
-            score=rp.payment_abuse_score,
-            signal_count=sig_counts.get("payment_abuse", 0),
-        ),
+            category=c.value,
+            score=getattr(rp, f"{c.value}_score"),
+            signal_count=sig_counts.get(c, 0),
+        )
+        for c in FraudCategory
     ]
 
     return RiskProfileResponse(
@@ -635,13 +938,17 @@ async def get_risk_profile(
 async def list_alerts(
     status_filter: Optional[str] = Query(None, alias="status"),
     category: Optional[str] = Query(None),
-    page: int = Query(1, ge=1),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     page_size: int = Query(20, ge=1, le=100),
     admin: User = Depends(require_system_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    """Returns paginated fraud alerts, sorted by priority descending."""
-    query = select(FraudAlert)
+    """
+    Returns fraud alerts sorted by priority descending, newest first
+    within a priority.  Keyset-paginated on (priority_score, created_at,
+    id), so deep pages cost the same as the first.
+    """
+    query = select(FraudAlert).options(*_ALERT_RESPONSE_LOAD)
 
     if status_filter:
         if status_filter in ALERT_STATUSES:
@@ -650,25 +957,40 @@ async def list_alerts(
     if category:
         query = query.where(FraudAlert.category == FraudCategory(category))
 
-    # Count total
-    count_q = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_q)).scalar() or 0
+    total = await _alert_total(
+        db,
+        status_filter if status_filter in ALERT_STATUSES else None,
+        category,
+    )
+
+    if cursor:
+        query = query.where(
+            tuple_(FraudAlert.priority_score, FraudAlert.created_at, FraudAlert.id)
+            < tuple_(*_decode_alert_cursor(cursor))
+        )
 
-    # Fetch page
+    # Fetch page (+1 row to know whether another page follows)
     query = (
         query
-        .order_by(FraudAlert.priority_score.desc(), FraudAlert.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
+        .order_by(
+            FraudAlert.priority_score.desc(),
+            FraudAlert.created_at.desc(),
+            FraudAlert.id.desc(),
+        )
+        .limit(page_size + 1)
     )
     result = await db.execute(query)
     alerts = result.scalars().all()
 
+    has_more = len(alerts) > page_size
+    alerts = alerts[:page_size]
+
     return AlertListResponse(
         alerts=[_build_alert_response(a) for a in alerts],
         total=total,
-        page=page,
         page_size=page_size,
+        next_cursor=_encode_alert_cursor(alerts[-1]) if has_more else None,
+        has_more=has_more,
     )
 
 
@@ -691,7 +1013,7 @@ async def get_alert(
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid alert_id")
 
-    alert = await db.get(FraudAlert, aid)
+    alert = await db.get(FraudAlert, aid, options=_ALERT_RESPONSE_LOAD)
     if not alert:
         raise HTTPException(status_code=404, detail="Alert not found")
 
@@ -742,24 +1064,12 @@ async def resolve_alert(
     if body.expires_in_days:
         expires_at = now + timedelta(days=body.expires_in_days)
 
-    # Map action to alert resolution status
-    action_to_status = {
-        "clear": AlertStatus.RESOLVED_CLEAR,
-        "warning": AlertStatus.RESOLVED_WARNING,
-        "freeze_wallet": AlertStatus.RESOLVED_RESTRICT,
-        "suspend_account": AlertStatus.RESOLVED_RESTRICT,
-        "restrict_bidding": AlertStatus.RESOLVED_RESTRICT,
-        "restrict_withdrawals": AlertStatus.RESOLVED_RESTRICT,
-        "ban_account": AlertStatus.RESOLVED_BAN,
-        "manual_review": AlertStatus.INVESTIGATING,
-    }
-
     # Create decision record
     decision = FraudDecision(
         alert_id=aid,
         target_user_id=alert.user_id,
         decided_by_user_id=admin.id,
-        action=DecisionAction(body.action),
+        action=_ACTION_BY_VALUE[body.action],
         reason=body.reason,
         expires_at=expires_at,
         is_automated=False,
@@ -767,7 +1077,7 @@ async def resolve_alert(
     db.add(decision)
 
     # Update alert status
-    alert.status = action_to_status.get(body.action, AlertStatus.RESOLVED_CLEAR)
+    alert.status = _ACTION_TO_STATUS.get(body.action, AlertStatus.RESOLVED_CLEAR)
     alert.resolved_at = now
 
     # Apply enforcement to risk profile
@@ -798,6 +1108,7 @@ async def resolve_alert(
             wallet.status = WalletStatus.FROZEN
 
     await db.commit()
+    _invalidate_alert_caches()
     await db.refresh(decision)
 
     return ResolveAlertResponse(
@@ -836,10 +1147,13 @@ async def assign_alert(
         raise HTTPException(status_code=404, detail="Alert not found")
 
     alert.assigned_to_user_id = assignee_uuid
-    if alert.status == AlertStatus.OPEN:
+    status_changed = alert.status == AlertStatus.OPEN
+    if status_changed:
         alert.status = AlertStatus.INVESTIGATING
 
     await db.commit()
+    if status_changed:
+        _invalidate_alert_caches()
     await db.refresh(alert)
 
     return _build_alert_response(alert)
@@ -852,6 +1166,7 @@ async def assign_alert(
 @router.get(
     "/signals/{user_id}",
     response_model=list[FraudSignalResponse],
+    response_class=ORJSONResponse,
     summary="List raw fraud signals for a user",
 )
 async def list_user_signals(
@@ -867,7 +1182,16 @@ async def list_user_signals(
         raise HTTPException(status_code=400, detail="Invalid user_id")
 
     query = (
-        select(FraudSignalModel)
+        select(
+            FraudSignalModel.signal_code,
+            FraudSignalModel.category,
+            FraudSignalModel.severity,
+            FraudSignalModel.score_delta,
+            FraudSignalModel.description,
+            FraudSignalModel.entity_type,
+            FraudSignalModel.entity_id,
+            FraudSignalModel.context_json,
+        )
         .where(FraudSignalModel.user_id == uid)
         .order_by(FraudSignalModel.created_at.desc())
         .limit(limit)
@@ -876,21 +1200,21 @@ async def list_user_signals(
         query = query.where(FraudSignalModel.category == FraudCategory(category))
 
     result = await db.execute(query)
-    signals = result.scalars().all()
-
-    return [
-        FraudSignalResponse(
-            code=s.signal_code,
-            category=s.category.value,
-            severity=s.severity.value,
-            score_delta=s.score_delta,
-            description=s.description,
-            entity_type=s.entity_type or "",
-            entity_id=s.entity_id or "",
-            context=json.loads(s.context_json) if s.context_json else {},
-        )
-        for s in signals
-    ]
+
+    # Column rows straight into the response shape — no ORM objects
+    return ORJSONResponse([
+        {
+            "code": row["signal_code"],
+            "category": row["category"].value,
+            "severity": row["severity"].value,
+            "score_delta": row["score_delta"],
+            "description": row["description"],
+            "entity_type": row["entity_type"] or "",
+            "entity_id": row["entity_id"] or "",
+            "context": row["context_json"] or {},
+        }
+        for row in result.mappings()
+    ])
 
 
 # ───────────────────────────────────────────────────────────
@@ -900,91 +1224,89 @@ async def list_user_signals(
 @router.get(
     "/dashboard",
     response_model=FraudDashboardResponse,
+    response_class=ORJSONResponse,
     summary="Admin fraud dashboard overview",
 )
 async def fraud_dashboard(
     admin: User = Depends(require_system_admin),
-    db: AsyncSession = Depends(get_db),
 ):
     """
-    Aggregated fraud stats for the admin dashboard.
+    Aggregated fraud stats for the admin dashboard.  Served from a
+    short-lived cache; alert status changes in this worker refresh it
+    immediately.
     """
+    return ORJSONResponse(await _dashboard_cache.get_or_load("dashboard", _build_dashboard))
+
+
+async def _build_dashboard() -> dict:
     now = datetime.now(timezone.utc)
     week_ago = now - timedelta(days=7)
 
-    # ── Risk profile counts ──────────────────────────────────
+    # ── Alerts: one row per category, statuses as filtered counts ──
+    # The WHERE only admits rows some count needs, letting the planner
+    # OR the two partial indexes instead of scanning every alert
+    unresolved = (AlertStatus.OPEN, AlertStatus.INVESTIGATING, AlertStatus.ESCALATED)
+    alert_q = (
+        select(
+            FraudAlert.category,
+            func.count().filter(FraudAlert.status == AlertStatus.OPEN),
+            func.count().filter(FraudAlert.status == AlertStatus.INVESTIGATING),
+            func.count().filter(FraudAlert.status == AlertStatus.ESCALATED),
+            func.count().filter(FraudAlert.resolved_at >= week_ago),
+        )
+        .where(or_(FraudAlert.status.in_(unresolved), FraudAlert.resolved_at >= week_ago))
+        .group_by(FraudAlert.category)
+    )
+
+    # ── Risk levels and the 7-day enforcement count in one row ──
     rp_q = select(
-        RiskProfile.risk_level,
         func.count(),
-    ).group_by(RiskProfile.risk_level)
-    rp_result = await db.execute(rp_q)
-    level_counts = {row[0].value: row[1] for row in rp_result.all()}
-
-    total_scanned_q = select(func.count()).select_from(RiskProfile)
-    total_scanned = (await db.execute(total_scanned_q)).scalar() or 0
+        *(func.count().filter(RiskProfile.risk_level == level) for level in RiskLevel),
+        select(func.count())
+        .where(FraudDecision.created_at >= week_ago)
+        .scalar_subquery(),
+    )
 
-    # ── Alert counts ─────────────────────────────────────────
-    open_q = select(func.count()).where(FraudAlert.status == AlertStatus.OPEN)
-    investigating_q = select(func.count()).where(FraudAlert.status == AlertStatus.INVESTIGATING)
-    escalated_q = select(func.count()).where(FraudAlert.status == AlertStatus.ESCALATED)
+    # ── Per-category averages, kept current by the refresher ──
+    stats_q = select(
+        FraudCategoryStat.category,
+        FraudCategoryStat.avg_risk_score,
+        FraudCategoryStat.high_risk_users,
+    )
 
-    total_open = (await db.execute(open_q)).scalar() or 0
-    total_investigating = (await db.execute(investigating_q)).scalar() or 0
-    total_escalated = (await db.execute(escalated_q)).scalar() or 0
+    # ── Recent alerts (top 10) ───────────────────────────────
+    recent_q = (
+        select(FraudAlert)
+        .options(*_ALERT_RESPONSE_LOAD)
+        .order_by(FraudAlert.created_at.desc())
+        .limit(10)
+    )
 
-    # ── Per-category stats ───────────────────────────────────
-    category_stats: list[CategoryDashboardStat] = []
-    for cat_val in ["fake_company", "suspicious_bidding", "unusual_pricing",
-                     "repeated_cancellation", "payment_abuse"]:
-        cat_enum = FraudCategory(cat_val)
+    alert_rows, rp_row, stat_rows, recent = await asyncio.gather(
+        _fetch_rows(alert_q), _fetch_row(rp_q), _fetch_rows(stats_q), _fetch_scalars(recent_q),
+    )
 
-        open_cat_q = select(func.count()).where(
-            and_(FraudAlert.category == cat_enum, FraudAlert.status == AlertStatus.OPEN)
-        )
-        open_cat = (await db.execute(open_cat_q)).scalar() or 0
+    total_scanned, *level_values, enforce_count = rp_row
+    level_counts = dict(zip((level.value for level in RiskLevel), level_values))
+    category_risk = {cat: (avg, high) for cat, avg, high in stat_rows}
 
-        resolved_cat_q = select(func.count()).where(
-            and_(
-                FraudAlert.category == cat_enum,
-                FraudAlert.resolved_at >= week_ago,
-            )
-        )
-        resolved_cat = (await db.execute(resolved_cat_q)).scalar() or 0
-
-        # Average risk for this category
-        score_col = {
-            "fake_company": RiskProfile.fake_company_score,
-            "suspicious_bidding": RiskProfile.suspicious_bidding_score,
-            "unusual_pricing": RiskProfile.unusual_pricing_score,
-            "repeated_cancellation": RiskProfile.repeated_cancellation_score,
-            "payment_abuse": RiskProfile.payment_abuse_score,
-        }[cat_val]
-        avg_q = select(func.avg(score_col))
-        avg_score = (await db.execute(avg_q)).scalar() or 0.0
-
-        high_q = select(func.count()).where(score_col >= 50.0)
-        high_count = (await db.execute(high_q)).scalar() or 0
+    by_category = {row[0]: row[1:] for row in alert_rows}
+    total_open = sum(row[0] for row in by_category.values())
+    total_investigating = sum(row[1] for row in by_category.values())
+    total_escalated = sum(row[2] for row in by_category.values())
 
+    category_stats: list[CategoryDashboardStat] = []
+    for cat_enum in FraudCategory:
+        open_cat, _, _, resolved_cat = by_category.get(cat_enum, (0, 0, 0, 0))
+        avg_score, high_count = category_risk.get(cat_enum, (0.0, 0))
         category_stats.append(CategoryDashboardStat(
-            category=cat_val,
+            category=cat_enum.value,
             open_alerts=open_cat,
             resolved_alerts_7d=resolved_cat,
-            avg_risk_score=round(float(avg_score), 2),
+            avg_risk_score=round(float(avg_score or 0.0), 2),
             high_risk_users=high_count,
         ))
-
-    # ── Recent alerts (top 10) ───────────────────────────────
-    recent_q = (
-        select(FraudAlert)
-        .order_by(FraudAlert.created_at.desc())
-        .limit(10)
-    )
-    recent_result = await db.execute(recent_q)
-    recent_alerts = [_build_alert_response(a) for a in recent_result.scalars().all()]
-
-    # ── Enforcement count (7d) ───────────────────────────────
-    enforce_q = select(func.count()).where(FraudDecision.created_at >= week_ago)
-    enforce_count = (await db.execute(enforce_q)).scalar() or 0
+    recent_alerts = [_build_alert_response(a) for a in recent]
 
     return FraudDashboardResponse(
         total_users_scanned=total_scanned,
@@ -998,4 +1320,4 @@ async def fraud_dashboard(
         category_stats=category_stats,
         recent_alerts=recent_alerts,
         enforcement_actions_7d=enforce_count,
-    )
+    ).model_dump()
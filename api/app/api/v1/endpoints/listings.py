@@ -11,11 +11,16 @@ from datetime import datetime, timezone
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, case, func, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, lazyload, load_only, selectinload
 
-from app.api.deps.auth import require_any_authenticated, require_shipper
+from app.api.deps.auth import ADMIN_ROLES, require_any_authenticated, require_shipper
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.responses import ORJSONResponse
 from app.models.freight import (
     Address,
     BidStatus,
@@ -40,7 +45,6 @@ from app.schemas.freight import (
     CreateBidRequest,
     CreateListingRequest,
     ListingResponse,
-    ListingSummary,
     MessageResponse,
     PaginatedListings,
     UpdateListingRequest,
@@ -48,6 +52,49 @@ from app.schemas.freight import (
 
 router = APIRouter(prefix="/listings", tags=["Freight Listings"])
 
+# Loader options per response shape.  The mapper defaults selectin-load
+# every relationship (all bids, the trip, the shipper and through it the
+# organisation and its members); these fetch only what each builder reads.
+_LEAN_USER = (load_only(User.full_name), lazyload("*"))
+DETAIL_LOAD = (
+    joinedload(FreightListing.shipper).options(*_LEAN_USER),
+    selectinload(FreightListing.pickup_address),
+    selectinload(FreightListing.delivery_address),
+    lazyload(FreightListing.bids),
+    lazyload(FreightListing.trip),
+)
+# Ownership / status checks only
+NO_RELATIONS = (lazyload("*"),)
+
+# Search results are plain column rows — no ORM objects to hydrate
+_DELIVERY_ADDR = Address.__table__.alias("delivery_addr")
+SUMMARY_COLUMNS = (
+    FreightListing.id, FreightListing.title, FreightListing.distance_km,
+    FreightListing.cargo_type, FreightListing.weight_kg, FreightListing.vehicle_type,
+    FreightListing.shipper_price, FreightListing.ai_suggested_price, FreightListing.currency,
+    FreightListing.urgency, FreightListing.status, FreightListing.bid_count,
+    FreightListing.created_at,
+    Address.city.label("pickup_city"), _DELIVERY_ADDR.c.city.label("delivery_city"),
+)
+
+# Value → enum lookups for request strings, built once at import
+_CARGO_BY_VALUE = {c.value: c for c in CargoType}
+_VEHICLE_BY_VALUE = {v.value: v for v in VehicleType}
+_URGENCY_BY_VALUE = {u.value: u for u in Urgency}
+_LISTING_STATUS_BY_VALUE = {s.value: s for s in ListingStatus}
+_BID_STATUS_BY_VALUE = {s.value: s for s in BidStatus}
+# Request fields UpdateListingRequest has already validated
+_UPDATE_ENUMS = {
+    "cargo_type": _CARGO_BY_VALUE,
+    "vehicle_type": _VEHICLE_BY_VALUE,
+    "urgency": _URGENCY_BY_VALUE,
+    "status": _LISTING_STATUS_BY_VALUE,
+}
+
+# Search totals per filter combination, so paging through the same
+# search skips the count.  Free-text searches are too varied to cache.
+_search_totals = TTLCache(ttl=settings.LISTING_SEARCH_TOTAL_TTL_SECONDS)
+
 
 def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     R = 6371.0
@@ -62,6 +109,73 @@ def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
 
+def haversine_km_sql(lat_col, lng_col, lat: float, lng: float):
+    """SQL expression for the great-circle distance (km) from a fixed point."""
+    d_lat = func.radians(lat_col - lat) / 2
+    d_lng = func.radians(lng_col - lng) / 2
+    a = (
+        func.power(func.sin(d_lat), 2)
+        + math.cos(math.radians(lat)) * func.cos(func.radians(lat_col))
+        * func.power(func.sin(d_lng), 2)
+    )
+    # LEAST guards asin against rounding just above 1.0
+    return 2 * 6371.0 * func.asin(func.sqrt(func.least(a, 1.0)))
+
+
+async def reject_pending_bids(
+    db: AsyncSession, listing_id: uuid.UUID, now: datetime,
+    except_bid_id: Optional[uuid.UUID] = None,
+) -> int:
+    """Reject a listing's pending bids in one UPDATE; returns how many."""
+    stmt = update(FreightBid).where(
+        FreightBid.listing_id == listing_id, FreightBid.status == BidStatus.PENDING
+    )
+    if except_bid_id is not None:
+        stmt = stmt.where(FreightBid.id != except_bid_id)
+    result = await db.execute(
+        stmt.values(status=BidStatus.REJECTED, updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+def _search_base():
+    return (
+        select(*SUMMARY_COLUMNS)
+        .select_from(FreightListing)
+        .join(Address, FreightListing.pickup_address_id == Address.id, isouter=True)
+        .join(_DELIVERY_ADDR, FreightListing.delivery_address_id == _DELIVERY_ADDR.c.id, isouter=True)
+    )
+
+
+def warmup_statements() -> list:
+    """
+    The default listing search (newest first) and the detail lookup,
+    bound to dummy values, for `warm_statement_cache` at startup.  They
+    must match the handlers' statements structurally so they hit the same
+    cache entries; LIMIT is a bound parameter, so LIMIT 0 keeps the
+    search from counting every active listing.
+    """
+    dummy = uuid.UUID(int=0)
+    return [
+        _search_base()
+        .where(and_(FreightListing.status == ListingStatus.ACTIVE))
+        .add_columns(func.count().over().label("total_count"))
+        .order_by(FreightListing.created_at.desc().nullslast())
+        .offset(0)
+        .limit(0),
+        select(FreightListing).options(*DETAIL_LOAD).where(FreightListing.id == dummy),
+    ]
+
+
+def _query_enum(lookup: dict, value: str, name: str):
+    """Coerce an unvalidated query parameter, answering 400 if unknown."""
+    try:
+        return lookup[value.lower()]
+    except KeyError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name}: {value}")
+
+
 def build_listing_response(listing: FreightListing) -> ListingResponse:
     shipper_name = listing.shipper.full_name if listing.shipper else None
     return ListingResponse(
@@ -73,17 +187,17 @@ def build_listing_response(listing: FreightListing) -> ListingResponse:
         pickup=AddressResponse.model_validate(listing.pickup_address),
         delivery=AddressResponse.model_validate(listing.delivery_address),
         distance_km=listing.distance_km,
-        cargo_type=listing.cargo_type.value if isinstance(listing.cargo_type, CargoType) else listing.cargo_type,
+        cargo_type=listing.cargo_type.value,
         weight_kg=listing.weight_kg,
         dimensions_length_cm=listing.dimensions_length_cm,
         dimensions_width_cm=listing.dimensions_width_cm,
         dimensions_height_cm=listing.dimensions_height_cm,
-        vehicle_type=listing.vehicle_type.value if isinstance(listing.vehicle_type, VehicleType) else listing.vehicle_type,
+        vehicle_type=listing.vehicle_type.value,
         shipper_price=float(listing.shipper_price) if listing.shipper_price else None,
         ai_suggested_price=float(listing.ai_suggested_price) if listing.ai_suggested_price else None,
         currency=listing.currency,
-        urgency=listing.urgency.value if isinstance(listing.urgency, Urgency) else listing.urgency,
-        status=listing.status.value if isinstance(listing.status, ListingStatus) else listing.status,
+        urgency=listing.urgency.value,
+        status=listing.status.value,
         special_instructions=listing.special_instructions,
         bid_count=listing.bid_count,
         created_at=listing.created_at,
@@ -92,24 +206,25 @@ def build_listing_response(listing: FreightListing) -> ListingResponse:
     )
 
 
-def build_listing_summary(listing: FreightListing) -> ListingSummary:
-    return ListingSummary(
-        id=listing.id,
-        title=listing.title,
-        pickup_city=listing.pickup_address.city if listing.pickup_address else "N/A",
-        delivery_city=listing.delivery_address.city if listing.delivery_address else "N/A",
-        distance_km=listing.distance_km,
-        cargo_type=listing.cargo_type.value if isinstance(listing.cargo_type, CargoType) else listing.cargo_type,
-        weight_kg=listing.weight_kg,
-        vehicle_type=listing.vehicle_type.value if isinstance(listing.vehicle_type, VehicleType) else listing.vehicle_type,
-        shipper_price=float(listing.shipper_price) if listing.shipper_price else None,
-        ai_suggested_price=float(listing.ai_suggested_price) if listing.ai_suggested_price else None,
-        currency=listing.currency,
-        urgency=listing.urgency.value if isinstance(listing.urgency, Urgency) else listing.urgency,
-        status=listing.status.value if isinstance(listing.status, ListingStatus) else listing.status,
-        bid_count=listing.bid_count,
-        created_at=listing.created_at,
-    )
+def build_listing_summary(row) -> dict:
+    """Map a SUMMARY_COLUMNS row to the `ListingSummary` shape as a plain dict."""
+    return {
+        "id": row["id"],
+        "title": row["title"],
+        "pickup_city": row["pickup_city"] or "N/A",
+        "delivery_city": row["delivery_city"] or "N/A",
+        "distance_km": row["distance_km"],
+        "cargo_type": row["cargo_type"].value,
+        "weight_kg": row["weight_kg"],
+        "vehicle_type": row["vehicle_type"].value,
+        "shipper_price": float(row["shipper_price"]) if row["shipper_price"] else None,
+        "ai_suggested_price": float(row["ai_suggested_price"]) if row["ai_suggested_price"] else None,
+        "currency": row["currency"],
+        "urgency": row["urgency"].value,
+        "status": row["status"].value,
+        "bid_count": row["bid_count"],
+        "created_at": row["created_at"],
+    }
 
 
 # ── POST /listings ───────────────────────────────────────────
@@ -120,16 +235,19 @@ async def create_listing(
     user: User = Depends(require_shipper),
     db: AsyncSession = Depends(get_db),
 ) -> ListingResponse:
-    pickup = Address(city=body.pickup.city, region=body.pickup.region, street=body.pickup.street,
-                     postal_code=body.pickup.postal_code, latitude=body.pickup.latitude,
-                     longitude=body.pickup.longitude, country=body.pickup.country)
+    # Client-side ids so the addresses and the listing go out in a
+    # single flush instead of one to learn the address ids first
+    pickup = Address(id=uuid.uuid4(), city=body.pickup.city, region=body.pickup.region,
+                     street=body.pickup.street, postal_code=body.pickup.postal_code,
+                     latitude=body.pickup.latitude, longitude=body.pickup.longitude,
+                     country=body.pickup.country)
     db.add(pickup)
 
-    delivery = Address(city=body.delivery.city, region=body.delivery.region, street=body.delivery.street,
-                       postal_code=body.delivery.postal_code, latitude=body.delivery.latitude,
-                       longitude=body.delivery.longitude, country=body.delivery.country)
+    delivery = Address(id=uuid.uuid4(), city=body.delivery.city, region=body.delivery.region,
+                       street=body.delivery.street, postal_code=body.delivery.postal_code,
+                       latitude=body.delivery.latitude, longitude=body.delivery.longitude,
+                       country=body.delivery.country)
     db.add(delivery)
-    await db.flush()
 
     distance_km = None
     if all([pickup.latitude, pickup.longitude, delivery.latitude, delivery.longitude]):
@@ -137,22 +255,24 @@ async def create_listing(
 
     listing = FreightListing(
         shipper_id=user.id, pickup_address_id=pickup.id, delivery_address_id=delivery.id,
-        title=body.title, description=body.description, cargo_type=CargoType(body.cargo_type),
+        title=body.title, description=body.description, cargo_type=_CARGO_BY_VALUE[body.cargo_type],
         weight_kg=body.weight_kg, dimensions_length_cm=body.dimensions_length_cm,
         dimensions_width_cm=body.dimensions_width_cm, dimensions_height_cm=body.dimensions_height_cm,
-        vehicle_type=VehicleType(body.vehicle_type), shipper_price=body.shipper_price,
-        currency=body.currency, urgency=Urgency(body.urgency), status=ListingStatus.ACTIVE,
+        vehicle_type=_VEHICLE_BY_VALUE[body.vehicle_type], shipper_price=body.shipper_price,
+        currency=body.currency, urgency=_URGENCY_BY_VALUE[body.urgency], status=ListingStatus.ACTIVE,
         special_instructions=body.special_instructions, distance_km=distance_km,
+        # Already in hand — no reload needed to build the response
+        shipper=user, pickup_address=pickup, delivery_address=delivery,
     )
     db.add(listing)
     await db.flush()
-    await db.refresh(listing, attribute_names=["shipper", "pickup_address", "delivery_address"])
     return build_listing_response(listing)
 
 
 # ── GET /listings (search) ───────────────────────────────────
 
-@router.get("", response_model=PaginatedListings, summary="Search and filter freight listings")
+@router.get("", response_model=PaginatedListings, response_class=ORJSONResponse,
+            summary="Search and filter freight listings")
 async def search_listings(
     q: Optional[str] = Query(None, max_length=200),
     origin_city: Optional[str] = Query(None, max_length=100),
@@ -168,19 +288,21 @@ async def search_listings(
     max_price: Optional[float] = Query(None, ge=0),
     max_distance_km: Optional[float] = Query(None, ge=0),
     listing_status: Optional[str] = Query("active"),
-    sort_by: str = Query("created_at"),
+    sort_by: str = Query(
+        "created_at",
+        description="created_at, price, distance, weight, or origin_distance (with origin_lat/lng)",
+    ),
     sort_order: str = Query("desc"),
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     user: User = Depends(require_any_authenticated),
     db: AsyncSession = Depends(get_db),
-) -> PaginatedListings:
-    stmt = select(FreightListing).join(Address, FreightListing.pickup_address_id == Address.id, isouter=True)
-    delivery_alias = Address.__table__.alias("delivery_addr")
+) -> ORJSONResponse:
+    stmt = _search_base()
     conditions = []
 
     if listing_status:
-        conditions.append(FreightListing.status == ListingStatus(listing_status.lower()))
+        conditions.append(FreightListing.status == _query_enum(_LISTING_STATUS_BY_VALUE, listing_status, "listing_status"))
     if q:
         term = f"%{q}%"
         conditions.append(or_(FreightListing.title.ilike(term), FreightListing.description.ilike(term)))
@@ -189,22 +311,26 @@ async def search_listings(
     if origin_region:
         conditions.append(Address.region.ilike(f"%{origin_region}%"))
     if destination_city:
-        stmt = stmt.join(delivery_alias, FreightListing.delivery_address_id == delivery_alias.c.id)
-        conditions.append(delivery_alias.c.city.ilike(f"%{destination_city}%"))
+        conditions.append(_DELIVERY_ADDR.c.city.ilike(f"%{destination_city}%"))
+    origin_distance = None
     if origin_lat is not None and origin_lng is not None:
         lat_d = origin_radius_km / 111.0
         lng_d = origin_radius_km / (111.0 * max(math.cos(math.radians(origin_lat)), 0.01))
+        origin_distance = haversine_km_sql(Address.latitude, Address.longitude, origin_lat, origin_lng)
         conditions.extend([
             Address.latitude.isnot(None), Address.longitude.isnot(None),
+            # Bounding box first so ix_addresses_coords narrows the rows,
+            # then the exact radius
             Address.latitude.between(origin_lat - lat_d, origin_lat + lat_d),
             Address.longitude.between(origin_lng - lng_d, origin_lng + lng_d),
+            origin_distance <= origin_radius_km,
         ])
     if cargo_type:
-        conditions.append(FreightListing.cargo_type == CargoType(cargo_type.lower()))
+        conditions.append(FreightListing.cargo_type == _query_enum(_CARGO_BY_VALUE, cargo_type, "cargo_type"))
     if vehicle_type:
-        conditions.append(FreightListing.vehicle_type == VehicleType(vehicle_type.lower()))
+        conditions.append(FreightListing.vehicle_type == _query_enum(_VEHICLE_BY_VALUE, vehicle_type, "vehicle_type"))
     if urgency:
-        conditions.append(FreightListing.urgency == Urgency(urgency.lower()))
+        conditions.append(FreightListing.urgency == _query_enum(_URGENCY_BY_VALUE, urgency, "urgency"))
     if min_price is not None:
         conditions.append(FreightListing.shipper_price >= min_price)
     if max_price is not None:
@@ -215,30 +341,52 @@ async def search_listings(
     if conditions:
         stmt = stmt.where(and_(*conditions))
 
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total = (await db.execute(count_stmt)).scalar() or 0
-
     sort_map = {"created_at": FreightListing.created_at, "price": FreightListing.shipper_price,
                 "distance": FreightListing.distance_km, "weight": FreightListing.weight_kg}
+    if origin_distance is not None:
+        sort_map["origin_distance"] = origin_distance
     sort_col = sort_map.get(sort_by, FreightListing.created_at)
-    stmt = stmt.order_by(sort_col.asc().nullslast() if sort_order == "asc" else sort_col.desc().nullslast())
-    stmt = stmt.offset((page - 1) * per_page).limit(per_page)
 
-    listings = (await db.execute(stmt)).scalars().unique().all()
-    summaries = []
-    for l in listings:
-        if origin_lat is not None and origin_lng is not None and l.pickup_address:
-            if l.pickup_address.latitude and l.pickup_address.longitude:
-                if haversine_km(origin_lat, origin_lng, l.pickup_address.latitude, l.pickup_address.longitude) > origin_radius_km:
-                    continue
-        summaries.append(build_listing_summary(l))
+    order = sort_col.asc().nullslast() if sort_order == "asc" else sort_col.desc().nullslast()
+    offset = (page - 1) * per_page
 
-    return PaginatedListings(listings=summaries, total=total, page=page, per_page=per_page)
+    totals_key = None if q else (
+        listing_status, origin_city, origin_region, destination_city,
+        origin_lat, origin_lng, origin_radius_km if origin_distance is not None else None,
+        cargo_type, vehicle_type, urgency, min_price, max_price, max_distance_km,
+    )
+    total = _search_totals.get(totals_key) if totals_key else None
+    if total is not None:
+        rows = (await db.execute(stmt.order_by(order).offset(offset).limit(per_page))).mappings().all()
+    else:
+        # Page rows and the filtered total in one execution — the window
+        # count is evaluated before OFFSET/LIMIT
+        page_stmt = (
+            stmt.add_columns(func.count().over().label("total_count"))
+            .order_by(order).offset(offset).limit(per_page)
+        )
+        rows = (await db.execute(page_stmt)).mappings().all()
+        if rows:
+            total = rows[0]["total_count"]
+        elif page == 1:
+            total = 0
+        else:
+            # Past the last page: no row to carry the window count
+            total = (await db.execute(select(func.count()).select_from(stmt.subquery()))).scalar() or 0
+        if totals_key:
+            _search_totals.set(totals_key, total)
+    return ORJSONResponse({
+        "listings": [build_listing_summary(row) for row in rows],
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+    })
 
 
 # ── GET /listings/available ──────────────────────────────────
 
-@router.get("/available", response_model=PaginatedListings, summary="Browse available loads (couriers)")
+@router.get("/available", response_model=PaginatedListings, response_class=ORJSONResponse,
+            summary="Browse available loads (couriers)")
 async def available_listings(
     origin_city: Optional[str] = Query(None), destination_city: Optional[str] = Query(None),
     origin_lat: Optional[float] = Query(None, ge=-90, le=90),
@@ -249,7 +397,7 @@ async def available_listings(
     sort_by: str = Query("created_at"), sort_order: str = Query("desc"),
     page: int = Query(1, ge=1), per_page: int = Query(20, ge=1, le=100),
     user: User = Depends(require_any_authenticated), db: AsyncSession = Depends(get_db),
-) -> PaginatedListings:
+) -> ORJSONResponse:
     return await search_listings(
         q=None, origin_city=origin_city, origin_region=None, destination_city=destination_city,
         origin_lat=origin_lat, origin_lng=origin_lng, origin_radius_km=radius_km,
@@ -265,7 +413,9 @@ async def available_listings(
 @router.get("/{listing_id}", response_model=ListingResponse, summary="Get listing detail")
 async def get_listing(listing_id: uuid.UUID, user: User = Depends(require_any_authenticated),
                       db: AsyncSession = Depends(get_db)) -> ListingResponse:
-    result = await db.execute(select(FreightListing).where(FreightListing.id == listing_id))
+    result = await db.execute(
+        select(FreightListing).options(*DETAIL_LOAD).where(FreightListing.id == listing_id)
+    )
     listing = result.scalar_one_or_none()
     if not listing:
         raise HTTPException(status_code=404, detail="Listing not found")
@@ -277,12 +427,14 @@ async def get_listing(listing_id: uuid.UUID, user: User = Depends(require_any_au
 @router.patch("/{listing_id}", response_model=ListingResponse, summary="Update a freight listing")
 async def update_listing(listing_id: uuid.UUID, body: UpdateListingRequest,
                          user: User = Depends(require_shipper), db: AsyncSession = Depends(get_db)) -> ListingResponse:
-    result = await db.execute(select(FreightListing).where(FreightListing.id == listing_id))
+    result = await db.execute(
+        select(FreightListing).options(*DETAIL_LOAD).where(FreightListing.id == listing_id)
+    )
     listing = result.scalar_one_or_none()
     if not listing:
         raise HTTPException(status_code=404, detail="Listing not found")
 
-    is_admin = any(r in user.role_names for r in ("system_admin", "org_admin"))
+    is_admin = not ADMIN_ROLES.isdisjoint(user.role_set)
     if listing.shipper_id != user.id and not is_admin:
         raise HTTPException(status_code=403, detail="Not authorised")
 
@@ -291,20 +443,12 @@ async def update_listing(listing_id: uuid.UUID, body: UpdateListingRequest,
         raise HTTPException(status_code=400, detail="Cannot edit assigned/completed listing")
 
     for field, value in body.model_dump(exclude_unset=True).items():
-        if field == "cargo_type" and value:
-            setattr(listing, field, CargoType(value))
-        elif field == "vehicle_type" and value:
-            setattr(listing, field, VehicleType(value))
-        elif field == "urgency" and value:
-            setattr(listing, field, Urgency(value))
-        elif field == "status" and value:
-            setattr(listing, field, ListingStatus(value))
-        else:
-            setattr(listing, field, value)
+        if value and field in _UPDATE_ENUMS:
+            value = _UPDATE_ENUMS[field][value]
+        setattr(listing, field, value)
 
     listing.updated_at = datetime.now(timezone.utc)
     await db.flush()
-    await db.refresh(listing, attribute_names=["shipper", "pickup_address", "delivery_address"])
     return build_listing_response(listing)
 
 
@@ -313,67 +457,68 @@ async def update_listing(listing_id: uuid.UUID, body: UpdateListingRequest,
 @router.delete("/{listing_id}", response_model=MessageResponse, summary="Cancel a freight listing")
 async def delete_listing(listing_id: uuid.UUID, user: User = Depends(require_shipper),
                          db: AsyncSession = Depends(get_db)) -> MessageResponse:
-    result = await db.execute(select(FreightListing).where(FreightListing.id == listing_id))
+    result = await db.execute(
+        select(FreightListing).options(*NO_RELATIONS).where(FreightListing.id == listing_id)
+    )
     listing = result.scalar_one_or_none()
     if not listing:
         raise HTTPException(status_code=404, detail="Listing not found")
 
-    is_admin = any(r in user.role_names for r in ("system_admin", "org_admin"))
+    is_admin = not ADMIN_ROLES.isdisjoint(user.role_set)
     if listing.shipper_id != user.id and not is_admin:
         raise HTTPException(status_code=403, detail="Not authorised")
     if listing.status in (ListingStatus.IN_TRANSIT, ListingStatus.DELIVERED):
         raise HTTPException(status_code=400, detail="Cannot cancel active trip listing")
 
+    now = datetime.now(timezone.utc)
     listing.status = ListingStatus.CANCELLED
-    listing.updated_at = datetime.now(timezone.utc)
-
-    bids = (await db.execute(
-        select(FreightBid).where(FreightBid.listing_id == listing_id, FreightBid.status == BidStatus.PENDING)
-    )).scalars().all()
-    for bid in bids:
-        bid.status = BidStatus.REJECTED
-        bid.updated_at = datetime.now(timezone.utc)
+    listing.updated_at = now
 
+    rejected = await reject_pending_bids(db, listing_id, now)
     await db.flush()
-    return MessageResponse(message=f"Listing {listing_id} cancelled. {len(bids)} bid(s) rejected.")
+    return MessageResponse(message=f"Listing {listing_id} cancelled. {rejected} bid(s) rejected.")
 
 
 # ── GET /listings/:id/bids ───────────────────────────────────
 
-@router.get("/{listing_id}/bids", response_model=BidListResponse, summary="View bids on a listing")
+@router.get("/{listing_id}/bids", response_model=BidListResponse, response_class=ORJSONResponse,
+            summary="View bids on a listing")
 async def get_listing_bids(
     listing_id: uuid.UUID, bid_status: Optional[str] = Query(None),
     sort_by: str = Query("price"), sort_order: str = Query("asc"),
     user: User = Depends(require_any_authenticated), db: AsyncSession = Depends(get_db),
-) -> BidListResponse:
-    lr = await db.execute(select(FreightListing).where(FreightListing.id == listing_id))
-    listing = lr.scalar_one_or_none()
-    if not listing:
+) -> ORJSONResponse:
+    shipper_id = (await db.execute(
+        select(FreightListing.shipper_id).where(FreightListing.id == listing_id)
+    )).scalar_one_or_none()
+    if shipper_id is None:
         raise HTTPException(status_code=404, detail="Listing not found")
 
-    stmt = select(FreightBid).where(FreightBid.listing_id == listing_id)
-    is_admin = any(r in user.role_names for r in ("system_admin", "org_admin"))
-    if listing.shipper_id != user.id and not is_admin:
+    stmt = (
+        select(
+            FreightBid.id, FreightBid.listing_id, FreightBid.courier_id,
+            User.full_name.label("courier_name"), FreightBid.price, FreightBid.currency,
+            FreightBid.eta_hours, FreightBid.eta_description, FreightBid.message,
+            FreightBid.status, FreightBid.created_at, FreightBid.updated_at,
+        )
+        .join(User, FreightBid.courier_id == User.id, isouter=True)
+        .where(FreightBid.listing_id == listing_id)
+    )
+    is_admin = not ADMIN_ROLES.isdisjoint(user.role_set)
+    if shipper_id != user.id and not is_admin:
         stmt = stmt.where(FreightBid.courier_id == user.id)
     if bid_status:
-        stmt = stmt.where(FreightBid.status == BidStatus(bid_status.lower()))
+        stmt = stmt.where(FreightBid.status == _query_enum(_BID_STATUS_BY_VALUE, bid_status, "bid_status"))
 
     sort_map = {"price": FreightBid.price, "created_at": FreightBid.created_at, "eta_hours": FreightBid.eta_hours}
     col = sort_map.get(sort_by, FreightBid.price)
     stmt = stmt.order_by(col.asc().nullslast() if sort_order == "asc" else col.desc().nullslast())
 
-    bids = (await db.execute(stmt)).scalars().all()
-    return BidListResponse(
-        bids=[BidResponse(
-            id=b.id, listing_id=b.listing_id, courier_id=b.courier_id,
-            courier_name=b.courier.full_name if b.courier else None,
-            price=float(b.price), currency=b.currency, eta_hours=b.eta_hours,
-            eta_description=b.eta_description, message=b.message,
-            status=b.status.value if isinstance(b.status, BidStatus) else b.status,
-            created_at=b.created_at, updated_at=b.updated_at,
-        ) for b in bids],
-        total=len(bids),
-    )
+    bids = [
+        {**row, "price": float(row["price"]), "status": row["status"].value}
+        for row in (await db.execute(stmt)).mappings()
+    ]
+    return ORJSONResponse({"bids": bids, "total": len(bids)})
 
 
 # ── POST /listings/:id/bids ─────────────────────────────────
@@ -381,8 +526,9 @@ async def get_listing_bids(
 @router.post("/{listing_id}/bids", response_model=BidResponse, status_code=status.HTTP_201_CREATED, summary="Place a bid")
 async def create_bid(listing_id: uuid.UUID, body: CreateBidRequest,
                      user: User = Depends(require_any_authenticated), db: AsyncSession = Depends(get_db)) -> BidResponse:
-    lr = await db.execute(select(FreightListing).where(FreightListing.id == listing_id))
-    listing = lr.scalar_one_or_none()
+    listing = (await db.execute(
+        select(FreightListing.status, FreightListing.shipper_id).where(FreightListing.id == listing_id)
+    )).one_or_none()
     if not listing:
         raise HTTPException(status_code=404, detail="Listing not found")
     if listing.status not in (ListingStatus.ACTIVE, ListingStatus.BIDDING):
@@ -390,28 +536,44 @@ async def create_bid(listing_id: uuid.UUID, body: CreateBidRequest,
     if listing.shipper_id == user.id:
         raise HTTPException(status_code=400, detail="Cannot bid on own listing")
 
-    existing = (await db.execute(select(FreightBid).where(
-        FreightBid.listing_id == listing_id, FreightBid.courier_id == user.id, FreightBid.status == BidStatus.PENDING
-    ))).scalar_one_or_none()
-    if existing:
+    # uq_bids_one_pending rejects a second pending bid from this courier,
+    # even when two requests race
+    bid = (await db.execute(
+        pg_insert(FreightBid)
+        .values(listing_id=listing_id, courier_id=user.id, price=body.price, currency=body.currency,
+                eta_hours=body.eta_hours, eta_description=body.eta_description, message=body.message,
+                status=BidStatus.PENDING)
+        .on_conflict_do_nothing(
+            index_elements=[FreightBid.listing_id, FreightBid.courier_id],
+            # Literal, not a bound parameter: with prepared statements a
+            # generic plan's `status = $1` would not match the index
+            index_where=text("status = 'PENDING'"),
+        )
+        .returning(FreightBid.id, FreightBid.created_at, FreightBid.updated_at)
+    )).one_or_none()
+    if bid is None:
         raise HTTPException(status_code=409, detail="You already have a pending bid")
 
-    bid = FreightBid(listing_id=listing_id, courier_id=user.id, price=body.price, currency=body.currency,
-                     eta_hours=body.eta_hours, eta_description=body.eta_description, message=body.message,
-                     status=BidStatus.PENDING)
-    db.add(bid)
-    listing.bid_count += 1
-    if listing.status == ListingStatus.ACTIVE:
-        listing.status = ListingStatus.BIDDING
-    await db.flush()
-    await db.refresh(bid, attribute_names=["courier"])
+    # Bump the counter in the database so concurrent bids can't lose an
+    # increment to a read-modify-write
+    await db.execute(
+        update(FreightListing)
+        .where(FreightListing.id == listing_id)
+        .values(
+            bid_count=FreightListing.bid_count + 1,
+            status=case(
+                (FreightListing.status == ListingStatus.ACTIVE, ListingStatus.BIDDING),
+                else_=FreightListing.status,
+            ),
+        )
+        .execution_options(synchronize_session=False)
+    )
 
     return BidResponse(
-        id=bid.id, listing_id=bid.listing_id, courier_id=bid.courier_id,
-        courier_name=bid.courier.full_name if bid.courier else None,
-        price=float(bid.price), currency=bid.currency, eta_hours=bid.eta_hours,
-        eta_description=bid.eta_description, message=bid.message,
-        status=bid.status.value, created_at=bid.created_at, updated_at=bid.updated_at,
+        id=bid.id, listing_id=listing_id, courier_id=user.id, courier_name=user.full_name,
+        price=float(body.price), currency=body.currency, eta_hours=body.eta_hours,
+        eta_description=body.eta_description, message=body.message,
+        status=BidStatus.PENDING.value, created_at=bid.created_at, updated_at=bid.updated_at,
     )
 
 
@@ -420,18 +582,24 @@ async def create_bid(listing_id: uuid.UUID, body: CreateBidRequest,
 @router.post("/{listing_id}/accept-bid", response_model=AcceptBidResponse, summary="Accept a bid and create a trip")
 async def accept_bid(listing_id: uuid.UUID, body: AcceptBidRequest,
                      user: User = Depends(require_shipper), db: AsyncSession = Depends(get_db)) -> AcceptBidResponse:
-    lr = await db.execute(select(FreightListing).where(FreightListing.id == listing_id))
+    lr = await db.execute(
+        select(FreightListing).options(*NO_RELATIONS).where(FreightListing.id == listing_id)
+    )
     listing = lr.scalar_one_or_none()
     if not listing:
         raise HTTPException(status_code=404, detail="Listing not found")
 
-    is_admin = any(r in user.role_names for r in ("system_admin", "org_admin"))
+    is_admin = not ADMIN_ROLES.isdisjoint(user.role_set)
     if listing.shipper_id != user.id and not is_admin:
         raise HTTPException(status_code=403, detail="Not authorised")
     if listing.status not in (ListingStatus.ACTIVE, ListingStatus.BIDDING):
         raise HTTPException(status_code=400, detail=f"Cannot accept bids ({listing.status.value})")
 
-    br = await db.execute(select(FreightBid).where(FreightBid.id == body.bid_id, FreightBid.listing_id == listing_id))
+    br = await db.execute(
+        select(FreightBid)
+        .options(joinedload(FreightBid.courier).options(*_LEAN_USER))
+        .where(FreightBid.id == body.bid_id, FreightBid.listing_id == listing_id)
+    )
     bid = br.scalar_one_or_none()
     if not bid:
         raise HTTPException(status_code=404, detail="Bid not found")
@@ -442,11 +610,7 @@ async def accept_bid(listing_id: uuid.UUID, body: AcceptBidRequest,
     bid.status = BidStatus.ACCEPTED
     bid.updated_at = now
 
-    for other in (await db.execute(select(FreightBid).where(
-        FreightBid.listing_id == listing_id, FreightBid.id != bid.id, FreightBid.status == BidStatus.PENDING
-    ))).scalars().all():
-        other.status = BidStatus.REJECTED
-        other.updated_at = now
+    await reject_pending_bids(db, listing_id, now, except_bid_id=bid.id)
 
     listing.status = ListingStatus.ASSIGNED
     listing.updated_at = now
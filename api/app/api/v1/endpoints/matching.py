@@ -11,13 +11,22 @@ GET  /matching/profile/{user_id}  — Admin: view any courier profile
 
 from __future__ import annotations
 
-import json
+import asyncio
+import logging
+import math
+import time
 import uuid
 from datetime import datetime, timezone
+from typing import Sequence
 
+import numpy as np
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import and_, select
+from sqlalchemy import and_, func, insert, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, lazyload, load_only
 
 from app.api.deps.auth import (
     get_current_active_user,
@@ -25,13 +34,18 @@ from app.api.deps.auth import (
     require_courier,
     require_system_admin,
 )
-from app.core.database import get_db
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import async_session_factory, get_db
+from app.core.responses import ORJSONResponse
 from app.models.freight import Address, FreightListing
 from app.models.matching import CourierProfile, MatchRecommendation
 from app.models.user import User
 from app.ml.matching import (
+    CourierBatch,
     CourierStats,
     ListingContext,
+    MatchResult,
     ml_rerank,
     rank_couriers,
     score_courier,
@@ -41,9 +55,7 @@ from app.ml.matching import (
 from app.schemas.matching import (
     CourierProfileResponse,
     CourierScoreResponse,
-    DimensionScoreResponse,
     LocationUpdateResponse,
-    MatchedCourier,
     MatchRequest,
     MatchResponse,
     ScoreCourierRequest,
@@ -52,8 +64,56 @@ from app.schemas.matching import (
 
 router = APIRouter(prefix="/matching", tags=["Load Matching"])
 
+logger = logging.getLogger("loadmovegh.api.matching")
+
 ALGORITHM_VERSION = "v1.0-formula"
 
+KM_PER_DEGREE = 111.0
+
+# Plain listing columns; addresses come from _build_listing_context
+_LISTING_ONLY = (lazyload("*"),)
+
+# Listing contexts keyed by (listing_id, updated_at).  Every listing
+# mutation bumps updated_at, and addresses are fixed once created, so a
+# stale entry is never read — it just ages out.
+_listing_contexts = TTLCache(
+    ttl=settings.MATCHING_LISTING_CONTEXT_TTL_SECONDS, maxsize=4096,
+)
+
+# Only the courier's name is read off the user; skip its role/org loaders
+_LEAN_USER = (load_only(User.full_name), lazyload("*"))
+
+# (created_at, listing_id, matches, total_candidates) awaiting
+# run_recommendation_audit_writer.  Rows are only queued while that task
+# is running in this process; otherwise they are written directly.
+_audit_queue: asyncio.Queue[tuple] = asyncio.Queue(
+    maxsize=settings.MATCHING_AUDIT_QUEUE_SIZE,
+)
+_audit_writer_running = False
+
+# Last (monotonic time, batch) loaded by refresh_courier_snapshot
+_courier_snapshot: tuple[float, CourierBatch] | None = None
+
+# /recommend reads candidates as plain columns, labelled with the
+# CourierStats names CourierBatch reads — no ORM objects per courier.
+_CANDIDATE_COLUMNS = (
+    CourierProfile.user_id,
+    func.coalesce(User.full_name, "Unknown").label("full_name"),
+    func.coalesce(func.nullif(CourierProfile.vehicle_type, ""), "any").label("vehicle_type"),
+    CourierProfile.current_latitude.label("latitude"),
+    CourierProfile.current_longitude.label("longitude"),
+    CourierProfile.vehicle_capacity_kg,
+    CourierProfile.has_refrigeration,
+    CourierProfile.has_gps_tracker,
+    CourierProfile.acceptance_rate,
+    CourierProfile.completion_rate,
+    CourierProfile.on_time_rate,
+    CourierProfile.total_trips_completed,
+    CourierProfile.total_trips_cancelled,
+    CourierProfile.disputes_lost,
+    CourierProfile.avg_price_vs_market,
+)
+
 
 # ───────────────────────────────────────────────────────────
 #  HELPERS
@@ -96,16 +156,21 @@ async def _build_listing_context(
     pickup_city = ""
     delivery_city = ""
 
-    if listing.pickup_address_id:
-        addr = await db.get(Address, listing.pickup_address_id)
-        if addr:
-            pickup_lat = addr.latitude
-            pickup_lng = addr.longitude
-            pickup_city = addr.city or ""
-    if listing.delivery_address_id:
-        addr = await db.get(Address, listing.delivery_address_id)
-        if addr:
-            delivery_city = addr.city or ""
+    # Both addresses in one round-trip
+    ids = [i for i in (listing.pickup_address_id, listing.delivery_address_id) if i]
+    addresses: dict[uuid.UUID, Address] = {}
+    if ids:
+        result = await db.execute(select(Address).where(Address.id.in_(ids)))
+        addresses = {a.id: a for a in result.scalars()}
+
+    addr = addresses.get(listing.pickup_address_id)
+    if addr:
+        pickup_lat = addr.latitude
+        pickup_lng = addr.longitude
+        pickup_city = addr.city or ""
+    addr = addresses.get(listing.delivery_address_id)
+    if addr:
+        delivery_city = addr.city or ""
 
     return ListingContext(
         listing_id=str(listing.id),
@@ -122,27 +187,264 @@ async def _build_listing_context(
     )
 
 
-def _build_profile_response(p: CourierProfile) -> CourierProfileResponse:
-    return CourierProfileResponse(
-        user_id=str(p.user_id),
-        full_name=p.user.full_name if p.user else "Unknown",
-        vehicle_type=p.vehicle_type,
-        vehicle_capacity_kg=p.vehicle_capacity_kg,
-        current_city=p.current_city,
-        current_region=p.current_region,
-        is_available=p.is_available,
-        is_on_trip=p.is_on_trip,
-        acceptance_rate=p.acceptance_rate,
-        completion_rate=p.completion_rate,
-        on_time_rate=p.on_time_rate,
-        avg_rating=p.avg_rating,
-        total_ratings=p.total_ratings,
-        total_trips_completed=p.total_trips_completed,
-        member_since_days=p.member_since_days,
-        has_gps_tracker=p.has_gps_tracker,
+def _pickup_box(
+    lat: float, lng: float, radius_km: float,
+) -> tuple[float, float, float, float]:
+    """(min_lat, max_lat, min_lng, max_lng) containing the radius_km circle."""
+    d_lat = radius_km / KM_PER_DEGREE
+    d_lng = radius_km / (KM_PER_DEGREE * max(math.cos(math.radians(lat)), 0.01))
+    return lat - d_lat, lat + d_lat, lng - d_lng, lng + d_lng
+
+
+def _within_box_or_unlocated(lat: float, lng: float, radius_km: float):
+    """
+    SQL filter for couriers inside the pickup box.  Couriers without a
+    GPS fix still pass; they score a neutral proximity.
+    """
+    min_lat, max_lat, min_lng, max_lng = _pickup_box(lat, lng, radius_km)
+    return or_(
+        CourierProfile.current_latitude.is_(None),
+        CourierProfile.current_longitude.is_(None),
+        and_(
+            CourierProfile.current_latitude.between(min_lat, max_lat),
+            CourierProfile.current_longitude.between(min_lng, max_lng),
+        ),
+    )
+
+
+def _box_filter(
+    batch: CourierBatch, lat: float, lng: float, radius_km: float,
+) -> CourierBatch:
+    """`_within_box_or_unlocated` applied to an in-memory batch."""
+    min_lat, max_lat, min_lng, max_lng = _pickup_box(lat, lng, radius_km)
+    unlocated = np.isnan(batch.latitude) | np.isnan(batch.longitude)
+    inside = (
+        (batch.latitude >= min_lat) & (batch.latitude <= max_lat)
+        & (batch.longitude >= min_lng) & (batch.longitude <= max_lng)
+    )
+    return batch.take(np.flatnonzero(unlocated | inside))
+
+
+def _candidate_query():
+    """Every matchable courier, as columns CourierBatch reads."""
+    return (
+        select(*_CANDIDATE_COLUMNS)
+        .select_from(CourierProfile)
+        .outerjoin(User, User.id == CourierProfile.user_id)
+        .where(
+            and_(
+                CourierProfile.is_available.is_(True),
+                CourierProfile.is_on_trip.is_(False),
+            )
+        )
     )
 
 
+async def refresh_courier_snapshot() -> None:
+    """Reload every matchable courier into a new snapshot batch."""
+    global _courier_snapshot
+    async with async_session_factory() as session:
+        rows = (await session.execute(_candidate_query())).all()
+    batch = await asyncio.to_thread(CourierBatch.from_stats, rows)
+    # Swapped in whole; readers never see a half-built batch
+    _courier_snapshot = (time.monotonic(), batch)
+
+
+async def run_courier_snapshot_refresher() -> None:
+    """Keep the matchable-courier snapshot fresh forever."""
+    while True:
+        try:
+            await refresh_courier_snapshot()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("Courier snapshot refresh failed", exc_info=True)
+        await asyncio.sleep(settings.MATCHING_COURIER_SNAPSHOT_REFRESH_SECONDS)
+
+
+def _fresh_snapshot() -> CourierBatch | None:
+    """The current snapshot, or None if there is none or it has gone stale."""
+    if _courier_snapshot is None:
+        return None
+    taken_at, batch = _courier_snapshot
+    if time.monotonic() - taken_at > settings.MATCHING_COURIER_SNAPSHOT_MAX_AGE_SECONDS:
+        return None
+    return batch
+
+
+def _rank(
+    candidates: CourierBatch | Sequence[Row],
+    listing_ctx: ListingContext,
+    body: MatchRequest,
+    weights: dict[str, float],
+) -> list[MatchResult]:
+    matches = rank_couriers(
+        candidates, listing_ctx,
+        top_k=body.top_k,
+        min_score=body.min_score,
+        weights=weights,
+    )
+    if body.use_ml_reranker:
+        matches = ml_rerank(matches, listing_ctx)
+    return matches
+
+
+async def _record_recommendation(
+    listing_id: uuid.UUID,
+    matches: list[MatchResult],
+    total_candidates: int,
+) -> None:
+    """
+    Hand a MatchRecommendation audit row to the batch writer.  If the
+    writer has fallen so far behind that the queue is full, the row is
+    dropped — an audit row must never hold up a recommendation.  In a
+    process that does not run the writer the row is inserted directly.
+    """
+    row = (datetime.now(timezone.utc), listing_id, matches, total_candidates)
+    if not _audit_writer_running:
+        try:
+            await _write_recommendations([row])
+        except Exception:
+            logger.warning("Failed to record match recommendation", exc_info=True)
+        return
+    try:
+        _audit_queue.put_nowait(row)
+    except asyncio.QueueFull:
+        logger.warning("Match recommendation audit queue full; dropping row")
+
+
+async def _write_recommendations(batch: list[tuple]) -> None:
+    """Insert queued audit rows with one multi-row INSERT."""
+    rows = [
+        {
+            "listing_id": listing_id,
+            "algorithm_version": ALGORITHM_VERSION,
+            "ranked_results_json": orjson.dumps([m.to_dict() for m in matches]).decode(),
+            "total_candidates": total_candidates,
+            "returned_count": len(matches),
+            "created_at": created_at,
+        }
+        for created_at, listing_id, matches, total_candidates in batch
+    ]
+    async with async_session_factory() as session:
+        await session.execute(insert(MatchRecommendation).values(rows))
+        await session.commit()
+
+
+def _drain_audit_queue(batch: list[tuple]) -> list[tuple]:
+    while len(batch) < settings.MATCHING_AUDIT_BATCH_SIZE and not _audit_queue.empty():
+        batch.append(_audit_queue.get_nowait())
+    return batch
+
+
+async def run_recommendation_audit_writer() -> None:
+    """
+    Persist queued MatchRecommendation rows forever, up to
+    MATCHING_AUDIT_BATCH_SIZE per INSERT, at most once per
+    MATCHING_AUDIT_FLUSH_SECONDS.  On shutdown whatever is still queued
+    is written before the task exits.
+    """
+    global _audit_writer_running
+    _audit_writer_running = True
+    try:
+        while True:
+            try:
+                batch = _drain_audit_queue([await _audit_queue.get()])
+                await _write_recommendations(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Failed to record match recommendations", exc_info=True)
+            await asyncio.sleep(settings.MATCHING_AUDIT_FLUSH_SECONDS)
+    finally:
+        # New rows go straight to the DB from here on; flush the backlog
+        _audit_writer_running = False
+        while not _audit_queue.empty():
+            await _write_recommendations(_drain_audit_queue([]))
+
+
+async def _listing_context(
+    listing: FreightListing,
+    db: AsyncSession,
+) -> ListingContext:
+    return await _listing_contexts.get_or_load(
+        (listing.id, listing.updated_at),
+        lambda: _build_listing_context(listing, db),
+    )
+
+
+async def _load_listing_context(
+    listing_id: uuid.UUID,
+    db: AsyncSession,
+) -> ListingContext | None:
+    listing = await db.get(FreightListing, listing_id, options=_LISTING_ONLY)
+    if not listing:
+        return None
+    return await _listing_context(listing, db)
+
+
+async def _fetch_courier_profile(user_id: uuid.UUID) -> CourierProfile | None:
+    """
+    A courier's profile (with name) on its own short-lived session, so it
+    can run concurrently with lookups on the request session.  Everything
+    the caller reads is loaded before the session closes.
+    """
+    async with async_session_factory() as session:
+        result = await session.execute(
+            select(CourierProfile)
+            .options(joinedload(CourierProfile.user).options(*_LEAN_USER))
+            .where(CourierProfile.user_id == user_id)
+        )
+        return result.scalar_one_or_none()
+
+
+def _dimensions(m: MatchResult) -> dict:
+    """DimensionScoreResponse-shaped dict."""
+    d = m.dimensions
+    return {
+        "proximity": d.proximity,
+        "reliability": d.reliability,
+        "acceptance": d.acceptance,
+        "vehicle_fit": d.vehicle_fit,
+        "pricing": d.pricing,
+    }
+
+
+def _matched_courier(m: MatchResult) -> dict:
+    """MatchedCourier-shaped dict; the scorer's output needs no re-validation."""
+    return {
+        "courier_id": m.courier_id,
+        "courier_name": m.courier_name,
+        "rank": m.rank,
+        "composite_score": m.composite_score,
+        "dimensions": _dimensions(m),
+        "distance_km": m.distance_km,
+        "vehicle_type": m.vehicle_type,
+    }
+
+
+def _build_profile_response(p: CourierProfile) -> dict:
+    """CourierProfileResponse-shaped dict."""
+    return {
+        "user_id": str(p.user_id),
+        "full_name": p.user.full_name if p.user else "Unknown",
+        "vehicle_type": p.vehicle_type,
+        "vehicle_capacity_kg": p.vehicle_capacity_kg,
+        "current_city": p.current_city,
+        "current_region": p.current_region,
+        "is_available": p.is_available,
+        "is_on_trip": p.is_on_trip,
+        "acceptance_rate": p.acceptance_rate,
+        "completion_rate": p.completion_rate,
+        "on_time_rate": p.on_time_rate,
+        "avg_rating": p.avg_rating,
+        "total_ratings": p.total_ratings,
+        "total_trips_completed": p.total_trips_completed,
+        "member_since_days": p.member_since_days,
+        "has_gps_tracker": p.has_gps_tracker,
+    }
+
+
 # ───────────────────────────────────────────────────────────
 #  POST /matching/recommend
 # ───────────────────────────────────────────────────────────
@@ -150,6 +452,7 @@ def _build_profile_response(p: CourierProfile) -> CourierProfileResponse:
 @router.post(
     "/recommend",
     response_model=MatchResponse,
+    response_class=ORJSONResponse,
     summary="Get ranked courier recommendations for a listing",
 )
 async def recommend_couriers(
@@ -162,32 +465,31 @@ async def recommend_couriers(
     scores them against the listing, and returns a ranked list.
     """
     # 1. Load listing
-    try:
-        listing_uuid = uuid.UUID(body.listing_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid listing_id")
-
-    listing = await db.get(FreightListing, listing_uuid)
+    listing = await db.get(FreightListing, body.listing_id, options=_LISTING_ONLY)
     if not listing:
         raise HTTPException(status_code=404, detail="Listing not found")
 
-    listing_ctx = await _build_listing_context(listing, db)
+    listing_ctx = await _listing_context(listing, db)
 
-    # 2. Fetch available courier profiles within max radius
+    # 2. Available couriers within max radius — from the in-process
+    #    snapshot when it is fresh, otherwise straight from the DB
     max_radius = min(body.max_radius_km, MAX_PROXIMITY_RADIUS_KM)
-    query = select(CourierProfile).where(
-        and_(
-            CourierProfile.is_available.is_(True),
-            CourierProfile.is_on_trip.is_(False),
-        )
-    )
-    result = await db.execute(query)
-    profiles = result.scalars().all()
-
-    # 3. Convert to stats
-    courier_stats = [_profile_to_stats(p) for p in profiles]
-
-    # 4. Build weights
+    has_pickup = listing_ctx.pickup_lat is not None and listing_ctx.pickup_lng is not None
+    candidates: CourierBatch | Sequence[Row] | None = _fresh_snapshot()
+    if candidates is not None:
+        if has_pickup:
+            candidates = _box_filter(
+                candidates, listing_ctx.pickup_lat, listing_ctx.pickup_lng, max_radius,
+            )
+    else:
+        query = _candidate_query()
+        if has_pickup:
+            query = query.where(_within_box_or_unlocated(
+                listing_ctx.pickup_lat, listing_ctx.pickup_lng, max_radius,
+            ))
+        candidates = (await db.execute(query)).all()
+
+    # 3. Build weights
     weights = select_weights(listing_ctx)
     if body.weight_overrides:
         overrides = body.weight_overrides.model_dump(exclude_none=True)
@@ -198,57 +500,25 @@ async def recommend_couriers(
             if total > 0:
                 weights = {k: v / total for k, v in weights.items()}
 
-    # 5. Rank
-    matches = rank_couriers(
-        courier_stats, listing_ctx,
-        top_k=body.top_k,
-        min_score=body.min_score,
-        weights=weights,
+    # 4–5. Rank, then optional ML re-rank — CPU-bound, so off the event loop
+    matches = await asyncio.to_thread(
+        _rank, candidates, listing_ctx, body, weights,
     )
 
-    # 6. Optional ML re-rank
-    if body.use_ml_reranker:
-        matches = ml_rerank(matches, listing_ctx)
-
-    # 7. Build response
-    matched_couriers = [
-        MatchedCourier(
-            courier_id=m.courier_id,
-            courier_name=m.courier_name,
-            rank=m.rank,
-            composite_score=m.composite_score,
-            dimensions=DimensionScoreResponse(
-                proximity=m.dimensions.proximity,
-                reliability=m.dimensions.reliability,
-                acceptance=m.dimensions.acceptance,
-                vehicle_fit=m.dimensions.vehicle_fit,
-                pricing=m.dimensions.pricing,
-            ),
-            distance_km=m.distance_km,
-            vehicle_type=m.vehicle_type,
-        )
-        for m in matches
-    ]
+    # 6. Build response
+    matched_couriers = [_matched_courier(m) for m in matches]
 
-    # 8. Log recommendation for audit / ML feedback
-    rec = MatchRecommendation(
-        listing_id=listing_uuid,
-        algorithm_version=ALGORITHM_VERSION,
-        ranked_results_json=json.dumps([m.to_dict() for m in matches]),
-        total_candidates=len(courier_stats),
-        returned_count=len(matched_couriers),
-    )
-    db.add(rec)
-    await db.commit()
+    # 7. Log recommendation for audit / ML feedback — written in batches
+    await _record_recommendation(listing.id, matches, len(candidates))
 
-    return MatchResponse(
-        listing_id=str(listing.id),
-        algorithm_version=ALGORITHM_VERSION,
-        total_candidates=len(courier_stats),
-        returned_count=len(matched_couriers),
-        weights_used={k: round(v, 4) for k, v in weights.items()},
-        matches=matched_couriers,
-    )
+    return ORJSONResponse({
+        "listing_id": str(listing.id),
+        "algorithm_version": ALGORITHM_VERSION,
+        "total_candidates": len(candidates),
+        "returned_count": len(matched_couriers),
+        "weights_used": {k: round(v, 4) for k, v in weights.items()},
+        "matches": matched_couriers,
+    })
 
 
 # ───────────────────────────────────────────────────────────
@@ -258,11 +528,12 @@ async def recommend_couriers(
 @router.get(
     "/score/{listing_id}/{courier_id}",
     response_model=CourierScoreResponse,
+    response_class=ORJSONResponse,
     summary="Score a single courier against a listing",
 )
 async def score_single_courier(
-    listing_id: str,
-    courier_id: str,
+    listing_id: uuid.UUID,
+    courier_id: uuid.UUID,
     user: User = Depends(require_any_authenticated),
     db: AsyncSession = Depends(get_db),
 ):
@@ -270,24 +541,16 @@ async def score_single_courier(
     Detailed scoring breakdown for a specific courier–listing pair.
     Useful for debugging and understanding why a courier ranked where they did.
     """
-    try:
-        listing_uuid = uuid.UUID(listing_id)
-        courier_uuid = uuid.UUID(courier_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid UUID")
-
-    listing = await db.get(FreightListing, listing_uuid)
-    if not listing:
-        raise HTTPException(status_code=404, detail="Listing not found")
-
-    result = await db.execute(
-        select(CourierProfile).where(CourierProfile.user_id == courier_uuid)
+    # The listing side and the courier side are independent lookups
+    listing_ctx, profile = await asyncio.gather(
+        _load_listing_context(listing_id, db),
+        _fetch_courier_profile(courier_id),
     )
-    profile = result.scalar_one_or_none()
+    if listing_ctx is None:
+        raise HTTPException(status_code=404, detail="Listing not found")
     if not profile:
         raise HTTPException(status_code=404, detail="Courier profile not found")
 
-    listing_ctx = await _build_listing_context(listing, db)
     courier_st = _profile_to_stats(profile)
     weights = select_weights(listing_ctx)
 
@@ -306,24 +569,18 @@ async def score_single_courier(
         reasons.append("Courier is currently on another trip")
         is_eligible = False
 
-    return CourierScoreResponse(
-        listing_id=listing_id,
-        courier_id=courier_id,
-        courier_name=match.courier_name,
-        composite_score=match.composite_score,
-        dimensions=DimensionScoreResponse(
-            proximity=match.dimensions.proximity,
-            reliability=match.dimensions.reliability,
-            acceptance=match.dimensions.acceptance,
-            vehicle_fit=match.dimensions.vehicle_fit,
-            pricing=match.dimensions.pricing,
-        ),
-        distance_km=match.distance_km,
-        vehicle_type=match.vehicle_type,
-        weights_used={k: round(v, 4) for k, v in weights.items()},
-        is_eligible=is_eligible,
-        disqualification_reasons=reasons,
-    )
+    return ORJSONResponse({
+        "listing_id": str(listing_id),
+        "courier_id": str(courier_id),
+        "courier_name": match.courier_name,
+        "composite_score": match.composite_score,
+        "dimensions": _dimensions(match),
+        "distance_km": match.distance_km,
+        "vehicle_type": match.vehicle_type,
+        "weights_used": {k: round(v, 4) for k, v in weights.items()},
+        "is_eligible": is_eligible,
+        "disqualification_reasons": reasons,
+    })
 
 
 # ───────────────────────────────────────────────────────────
@@ -344,39 +601,43 @@ async def update_courier_location(
     Called by the driver app to push real-time GPS coordinates.
     Creates a courier profile if one doesn't exist yet.
     """
-    result = await db.execute(
-        select(CourierProfile).where(CourierProfile.user_id == user.id)
-    )
-    profile = result.scalar_one_or_none()
-
     now = datetime.now(timezone.utc)
 
-    if not profile:
-        profile = CourierProfile(
-            user_id=user.id,
-            current_latitude=body.latitude,
-            current_longitude=body.longitude,
-            current_city=body.city,
-            current_region=body.region,
-            location_updated_at=now,
-        )
-        db.add(profile)
-    else:
-        profile.current_latitude = body.latitude
-        profile.current_longitude = body.longitude
-        profile.current_city = body.city or profile.current_city
-        profile.current_region = body.region or profile.current_region
-        profile.location_updated_at = now
-
+    # One round-trip: insert the profile or move the existing one
+    stmt = pg_insert(CourierProfile).values(
+        user_id=user.id,
+        current_latitude=body.latitude,
+        current_longitude=body.longitude,
+        current_city=body.city,
+        current_region=body.region,
+        location_updated_at=now,
+    )
+    excluded = stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CourierProfile.user_id],
+        set_={
+            "current_latitude": excluded.current_latitude,
+            "current_longitude": excluded.current_longitude,
+            # A ping without a city/region keeps the last known one
+            "current_city": func.coalesce(
+                func.nullif(excluded.current_city, ""), CourierProfile.current_city,
+            ),
+            "current_region": func.coalesce(
+                func.nullif(excluded.current_region, ""), CourierProfile.current_region,
+            ),
+            "location_updated_at": excluded.location_updated_at,
+            "updated_at": now,
+        },
+    ).returning(CourierProfile.current_city, CourierProfile.current_region)
+    city, region = (await db.execute(stmt)).one()
     await db.commit()
-    await db.refresh(profile)
 
     return LocationUpdateResponse(
         user_id=str(user.id),
         latitude=body.latitude,
         longitude=body.longitude,
-        city=profile.current_city,
-        region=profile.current_region,
+        city=city,
+        region=region,
         updated_at=now.isoformat(),
     )
 
@@ -388,6 +649,7 @@ async def update_courier_location(
 @router.get(
     "/profile/me",
     response_model=CourierProfileResponse,
+    response_class=ORJSONResponse,
     summary="Get own courier matching profile",
 )
 async def get_my_courier_profile(
@@ -396,7 +658,9 @@ async def get_my_courier_profile(
 ):
     """Retrieve the authenticated courier's matching profile and stats."""
     result = await db.execute(
-        select(CourierProfile).where(CourierProfile.user_id == user.id)
+        select(CourierProfile)
+        .options(joinedload(CourierProfile.user).options(*_LEAN_USER))
+        .where(CourierProfile.user_id == user.id)
     )
     profile = result.scalar_one_or_none()
 
@@ -406,7 +670,7 @@ async def get_my_courier_profile(
             detail="Courier profile not found. Update your location to create one.",
         )
 
-    return _build_profile_response(profile)
+    return ORJSONResponse(_build_profile_response(profile))
 
 
 # ───────────────────────────────────────────────────────────
@@ -416,25 +680,23 @@ async def get_my_courier_profile(
 @router.get(
     "/profile/{user_id}",
     response_model=CourierProfileResponse,
+    response_class=ORJSONResponse,
     summary="Admin: view any courier profile",
 )
 async def get_courier_profile(
-    user_id: str,
+    user_id: uuid.UUID,
     user: User = Depends(require_system_admin),
     db: AsyncSession = Depends(get_db),
 ):
     """Admin endpoint to inspect any courier's matching profile."""
-    try:
-        uid = uuid.UUID(user_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid user_id")
-
     result = await db.execute(
-        select(CourierProfile).where(CourierProfile.user_id == uid)
+        select(CourierProfile)
+        .options(joinedload(CourierProfile.user).options(*_LEAN_USER))
+        .where(CourierProfile.user_id == user_id)
     )
     profile = result.scalar_one_or_none()
 
     if not profile:
         raise HTTPException(status_code=404, detail="Courier profile not found")
 
-    return _build_profile_response(profile)
+    return ORJSONResponse(_build_profile_response(profile))
@@ -13,7 +13,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps.auth import require_any_authenticated
+from app.api.deps.auth import ADMIN_ROLES, require_any_authenticated
 from app.core.database import get_db
 from app.models.freight import FreightListing, FreightTrip, ListingStatus, TripStatus
 from app.models.user import User
@@ -60,7 +60,7 @@ async def get_trip(trip_id: uuid.UUID, user: User = Depends(require_any_authenti
     if not trip:
         raise HTTPException(status_code=404, detail="Trip not found")
 
-    is_admin = any(r in user.role_names for r in ("system_admin", "org_admin"))
+    is_admin = not ADMIN_ROLES.isdisjoint(user.role_set)
     is_courier = trip.courier_id == user.id
     is_shipper = trip.listing and trip.listing.shipper_id == user.id
     if not (is_courier or is_shipper or is_admin):
@@ -78,7 +78,7 @@ async def update_trip_status(trip_id: uuid.UUID, body: UpdateTripStatusRequest,
     if not trip:
         raise HTTPException(status_code=404, detail="Trip not found")
 
-    is_admin = any(r in user.role_names for r in ("system_admin", "org_admin"))
+    is_admin = not ADMIN_ROLES.isdisjoint(user.role_set)
     is_courier = trip.courier_id == user.id
     is_shipper = trip.listing and trip.listing.shipper_id == user.id
     if not (is_courier or is_shipper or is_admin):
@@ -146,7 +146,7 @@ async def list_my_trips(
     per_page: int = Query(20, ge=1, le=100),
     user: User = Depends(require_any_authenticated), db: AsyncSession = Depends(get_db),
 ) -> list[TripResponse]:
-    is_admin = any(r in user.role_names for r in ("system_admin", "org_admin"))
+    is_admin = not ADMIN_ROLES.isdisjoint(user.role_set)
     stmt = select(FreightTrip)
     if not is_admin:
         stmt = stmt.join(FreightListing, FreightTrip.listing_id == FreightListing.id, isouter=True)
@@ -154,7 +154,7 @@ async def list_my_trips(
     if trip_status:
         stmt = stmt.where(FreightTrip.status == TripStatus(trip_status.lower()))
     stmt = stmt.order_by(FreightTrip.created_at.desc()).offset((page - 1) * per_page).limit(per_page)
-    trips = (await db.execute(stmt)).scalars().unique().all()
+    trips = (await db.execute(stmt)).scalars().all()
     return [build_trip_response(t) for t in trips]
 
 
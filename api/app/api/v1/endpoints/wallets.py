@@ -11,6 +11,7 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps.auth import get_current_active_user, require_any_authenticated
@@ -55,17 +56,25 @@ router = APIRouter(prefix="/wallets", tags=["Wallet & Payments"])
 async def get_or_create_wallet(
     db: AsyncSession, user: User, currency: str = "GHS"
 ) -> Wallet:
-    """Get existing wallet for user+currency, or create one."""
-    result = await db.execute(
-        select(Wallet).where(
-            Wallet.user_id == user.id,
-            Wallet.currency == currency,
-        )
+    """
+    Get existing wallet for user+currency, or create one.
+
+    Creation is INSERT ... ON CONFLICT (user_id, currency) DO NOTHING
+    RETURNING, so concurrent first requests converge on one row without
+    a mid-handler flush; the loser of the race re-reads the winner's row.
+    """
+    wallet_q = select(Wallet).where(
+        Wallet.user_id == user.id,
+        Wallet.currency == currency,
     )
-    wallet = result.scalar_one_or_none()
+    wallet = (await db.execute(wallet_q)).scalar_one_or_none()
+    if wallet is not None:
+        return wallet
 
-    if wallet is None:
-        wallet = Wallet(
+    result = await db.execute(
+        pg_insert(Wallet)
+        .values(
+            id=uuid.uuid4(),
             user_id=user.id,
             org_id=user.org_id,
             currency=currency,
@@ -76,9 +85,12 @@ async def get_or_create_wallet(
             total_earned=0.00,
             status=WalletStatus.ACTIVE,
         )
-        db.add(wallet)
-        await db.flush()
-
+        .on_conflict_do_nothing(index_elements=["user_id", "currency"])
+        .returning(Wallet)
+    )
+    wallet = result.scalar_one_or_none()
+    if wallet is None:
+        wallet = (await db.execute(wallet_q)).scalar_one()
     return wallet
 
 
@@ -91,7 +103,7 @@ def build_transaction_response(txn: Transaction) -> TransactionResponse:
         currency=txn.currency,
         fee=float(txn.fee),
         net_amount=float(txn.net_amount),
-        balance_after=float(txn.balance_after),
+        balance_after=float(txn.balance_after) if txn.balance_after is not None else None,
         status=txn.status.value if hasattr(txn.status, "value") else txn.status,
         reference_type=txn.reference_type,
         reference_id=txn.reference_id,
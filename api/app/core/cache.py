@@ -0,0 +1,70 @@
+"""
+LoadMoveGH — In-process TTL Cache
+Small per-worker cache for values that may be a few seconds stale.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class TTLCache:
+    """
+    Maps keys to values that expire ``ttl`` seconds after being stored.
+
+    ``get_or_load`` serialises loaders per key, so a burst of concurrent
+    misses runs the loader once and the rest reuse its result.  When the
+    cache is full the entry closest to expiry is evicted.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if key not in self._data and len(self._data) >= self.maxsize:
+            self._evict()
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        entry = self._data.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            value = await loader()
+            self.set(key, value)
+        if not lock.locked():
+            self._locks.pop(key, None)
+        return value
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        expired = [k for k, (exp, _) in self._data.items() if exp <= now]
+        for k in expired:
+            del self._data[k]
+        if len(self._data) >= self.maxsize:
+            del self._data[min(self._data, key=lambda k: self._data[k][0])]
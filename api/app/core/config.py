@@ -68,6 +68,16 @@ class Settings(BaseSettings):
     MIN_DEPOSIT_AMOUNT: float = 1.00          # GHS
     MIN_WITHDRAWAL_AMOUNT: float = 5.00       # GHS
     MAX_TRANSACTION_AMOUNT: float = 50000.00  # GHS
+    PLATFORM_ACCOUNT_EMAIL: str = "platform@loadmovegh.com"  # Owns commission wallets
+    PLATFORM_WALLET_CURRENCIES: List[str] = ["GHS"]  # Provisioned at startup
+    PLATFORM_WALLET_CACHE_TTL_SECONDS: float = 300.0  # Commission wallet id lookup
+
+    # ── Outbox Dispatcher ─────────────────────────────────────
+    OUTBOX_POLL_INTERVAL_SECONDS: float = 2.0
+    OUTBOX_BATCH_SIZE: int = 500
+
+    # ── Freight Listings ──────────────────────────────────────
+    LISTING_SEARCH_TOTAL_TTL_SECONDS: float = 60.0  # Search-result total cache
 
     # ── AI Pricing Engine ───────────────────────────────────────
     PRICING_MODEL_DIR: str = "ml_models"
@@ -75,12 +85,25 @@ class Settings(BaseSettings):
     PRICING_CONFIDENCE_THRESHOLD: float = 0.50   # Below this → add disclaimer
     PRICING_MAX_TRAINING_SAMPLES: int = 100000
 
+    # ── Load Matching ──────────────────────────────────────────
+    MATCHING_LISTING_CONTEXT_TTL_SECONDS: float = 60.0  # Per listing version
+    MATCHING_COURIER_SNAPSHOT_REFRESH_SECONDS: float = 5.0   # Candidate snapshot
+    MATCHING_COURIER_SNAPSHOT_MAX_AGE_SECONDS: float = 30.0  # Older → query the DB
+    MATCHING_AUDIT_BATCH_SIZE: int = 100         # Recommendation rows per INSERT
+    MATCHING_AUDIT_FLUSH_SECONDS: float = 0.2     # Pause between audit flushes
+    MATCHING_AUDIT_QUEUE_SIZE: int = 10000        # Beyond this, rows are dropped
+
     # ── Fraud Detection ──────────────────────────────────────────
     FRAUD_ALERT_THRESHOLD_MEDIUM: float = 40.0   # Composite ≥ this → alert
     FRAUD_ALERT_THRESHOLD_HIGH: float = 65.0     # ≥ this → auto-restrict
     FRAUD_ALERT_THRESHOLD_CRITICAL: float = 85.0 # ≥ this → auto-freeze
     FRAUD_AUTO_SCAN_ON_TRANSACTION: bool = True   # Scan on every payment event
     FRAUD_MAX_SIGNALS_PER_SCAN: int = 50          # Cap to prevent log flood
+    FRAUD_ALERT_TOTAL_TTL_SECONDS: float = 30.0   # Alert-list total cache
+    FRAUD_SCAN_CACHE_TTL_SECONDS: float = 300.0   # Re-scan with no new activity
+    FRAUD_MARKET_STATS_TTL_SECONDS: float = 600.0 # 90-day market price stats
+    FRAUD_DASHBOARD_TTL_SECONDS: float = 30.0     # Admin dashboard aggregates
+    FRAUD_CATEGORY_STATS_REFRESH_SECONDS: float = 60.0  # fraud_category_stats
 
     # ── AI Assistant (OpenAI) ─────────────────────────────────
     OPENAI_API_KEY: str = ""
@@ -4,7 +4,10 @@ LoadMoveGH — Async SQLAlchemy Database Engine & Session
 
 from __future__ import annotations
 
+from typing import Iterable
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.sql import Executable
 from sqlalchemy.orm import DeclarativeBase
 
 from app.core.config import settings
@@ -15,6 +18,16 @@ engine = create_async_engine(
     pool_size=20,
     max_overflow=10,
     pool_pre_ping=True,
+    # Rows per multi-row INSERT batch for executemany()-style inserts
+    insertmanyvalues_page_size=1000,
+    # SQLAlchemy compiled-statement LRU (default 500)
+    query_cache_size=1200,
+    connect_args={
+        # SQLAlchemy asyncpg dialect: per-connection prepared statement LRU
+        "prepared_statement_cache_size": 500,
+        # asyncpg's own statement cache
+        "statement_cache_size": 500,
+    },
 )
 
 async_session_factory = async_sessionmaker(
@@ -40,3 +53,15 @@ async def get_db() -> AsyncSession:  # type: ignore[misc]
             raise
         finally:
             await session.close()
+
+
+async def warm_statement_cache(statements: Iterable[Executable]) -> None:
+    """
+    Execute each statement once so its compiled form lands in the engine's
+    query cache and the pooled connection prepares it.  Statements should be
+    read-only lookups bound to dummy values; the session is rolled back.
+    """
+    async with async_session_factory() as session:
+        for stmt in statements:
+            await session.execute(stmt)
+        await session.rollback()
@@ -0,0 +1,94 @@
+"""
+LoadMoveGH — Outbox Dispatcher
+Background task that delivers pending OutboxEvent rows.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+
+from sqlalchemy import select, update
+
+from app.core.config import settings
+from app.core.database import async_session_factory
+from app.models.outbox import OutboxEvent
+
+logger = logging.getLogger("loadmovegh.api.outbox")
+
+OutboxHandler = Callable[[OutboxEvent], Awaitable[None]]
+
+# event_type → handler.  Unregistered types are logged and marked
+# dispatched so they cannot block the queue.
+OUTBOX_HANDLERS: dict[str, OutboxHandler] = {}
+
+
+def register_outbox_handler(event_type: str, handler: OutboxHandler) -> None:
+    OUTBOX_HANDLERS[event_type] = handler
+
+
+async def dispatch_pending_events(batch_size: int | None = None) -> int:
+    """
+    Deliver one batch of undelivered events in id order.
+
+    Rows are claimed with FOR UPDATE SKIP LOCKED so several API workers
+    can drain the same table without double delivery.  A handler failure
+    leaves its row pending for the next poll.  Returns the number of
+    events marked dispatched.
+    """
+    limit = batch_size or settings.OUTBOX_BATCH_SIZE
+    async with async_session_factory() as session:
+        async with session.begin():
+            result = await session.execute(
+                select(OutboxEvent)
+                .where(OutboxEvent.dispatched_at.is_(None))
+                .order_by(OutboxEvent.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            events = result.scalars().all()
+            if not events:
+                return 0
+
+            delivered: list[int] = []
+            for event in events:
+                handler = OUTBOX_HANDLERS.get(event.event_type)
+                try:
+                    if handler is None:
+                        logger.info(
+                            "Outbox %s %s for %s:%s",
+                            event.id, event.event_type,
+                            event.aggregate_type, event.aggregate_id,
+                        )
+                    else:
+                        await handler(event)
+                except Exception:
+                    logger.exception("Outbox event %s (%s) failed", event.id, event.event_type)
+                    continue
+                delivered.append(event.id)
+
+            if delivered:
+                await session.execute(
+                    update(OutboxEvent)
+                    .where(OutboxEvent.id.in_(delivered))
+                    .values(dispatched_at=datetime.now(timezone.utc))
+                    .execution_options(synchronize_session=False)
+                )
+            return len(delivered)
+
+
+async def run_outbox_dispatcher() -> None:
+    """Poll forever; a full batch is followed immediately by the next one."""
+    interval = settings.OUTBOX_POLL_INTERVAL_SECONDS
+    while True:
+        try:
+            delivered = await dispatch_pending_events()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("Outbox dispatch failed", exc_info=True)
+            delivered = 0
+        if delivered < settings.OUTBOX_BATCH_SIZE:
+            await asyncio.sleep(interval)
@@ -0,0 +1,26 @@
+"""
+LoadMoveGH — JSON Responses
+orjson encoding that keeps the wire format of the Pydantic responses.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse as _ORJSONResponse
+
+# Pydantic writes UTC datetimes as "…Z"; orjson defaults to "…+00:00".
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+
+
+def dumps(content: Any) -> bytes:
+    """Encode ``content`` exactly as ``ORJSONResponse`` would."""
+    return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+class ORJSONResponse(_ORJSONResponse):
+    """FastAPI's ``ORJSONResponse`` with UTC datetimes written as ``Z``."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,62 @@
+"""
+LoadMoveGH — Fraud Engine Numeric Kernels
+==========================================
+
+Tight loops over sorted timestamp / amount arrays used when building a
+user's behaviour snapshot.  Compiled with Numba when it is installed;
+otherwise the same functions run as plain Python.
+
+All timestamps are float64 POSIX seconds, sorted ascending.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Plain-Python fallback — identical results, slower
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def count_cycles(dep_ts: np.ndarray, wd_ts: np.ndarray, window: float) -> int:
+    """
+    Deposits followed by a withdrawal strictly later but less than
+    `window` seconds after.  Single forward sweep: O(N + M).
+    """
+    n_wd = len(wd_ts)
+    j = 0
+    cycles = 0
+    for i in range(len(dep_ts)):
+        while j < n_wd and wd_ts[j] <= dep_ts[i]:
+            j += 1
+        if j < n_wd and wd_ts[j] - dep_ts[i] < window:
+            cycles += 1
+    return cycles
+
+
+@njit(cache=True)
+def count_splits(
+    ts: np.ndarray, amounts: np.ndarray, since: float, window: float
+) -> int:
+    """
+    Deposits at or after `since` whose forward `window` of deposits
+    (itself included) sums to just over a round hundred.
+    """
+    n = len(ts)
+    splits = 0
+    for i in range(n):
+        if ts[i] < since:
+            continue
+        window_sum = 0.0
+        j = i
+        while j < n and ts[j] - ts[i] < window:
+            window_sum += amounts[j]
+            j += 1
+        if window_sum > 0 and window_sum % 100 < 5:  # Near-round number
+            splits += 1
+    return splits
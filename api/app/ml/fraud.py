@@ -187,6 +187,9 @@ class UserBehaviourSnapshot:
     # Relationships (for collusion detection)
     frequently_transacting_user_ids: list[str] = field(default_factory=list)
     shipper_courier_pairs: list[tuple[str, str]] = field(default_factory=list)
+    # Pre-aggregated ((shipper, courier), count), most frequent first.
+    # Takes precedence over shipper_courier_pairs when set.
+    shipper_courier_pair_counts: list[tuple[tuple[str, str], int]] = field(default_factory=list)
 
 
 @dataclass
@@ -457,27 +460,31 @@ def detect_suspicious_bidding(snap: UserBehaviourSnapshot) -> CategoryResult:
         score += s.score_delta
 
     # S5: Frequent counterparty (same shipper-courier pair repeatedly)
-    if len(snap.shipper_courier_pairs) > 0:
+    if snap.shipper_courier_pair_counts:
+        top_pairs = snap.shipper_courier_pair_counts[:3]
+    elif snap.shipper_courier_pairs:
         from collections import Counter
-        pair_counts = Counter(snap.shipper_courier_pairs)
-        for pair, count in pair_counts.most_common(3):
-            if count > 8:
-                s = Signal(
-                    code="REPEATED_COUNTERPARTY",
-                    category="suspicious_bidding",
-                    severity="high",
-                    score_delta=18.0,
-                    description=(
-                        f"User has transacted with the same counterparty {count} times "
-                        f"— possible collusion ring."
-                    ),
-                    entity_type="user",
-                    entity_id=snap.user_id,
-                    context={"pair": list(pair), "count": count},
-                )
-                signals.append(s)
-                score += s.score_delta
-                break  # Only flag the top one
+        top_pairs = Counter(snap.shipper_courier_pairs).most_common(3)
+    else:
+        top_pairs = []
+    for pair, count in top_pairs:
+        if count > 8:
+            s = Signal(
+                code="REPEATED_COUNTERPARTY",
+                category="suspicious_bidding",
+                severity="high",
+                score_delta=18.0,
+                description=(
+                    f"User has transacted with the same counterparty {count} times "
+                    f"— possible collusion ring."
+                ),
+                entity_type="user",
+                entity_id=snap.user_id,
+                context={"pair": list(pair), "count": count},
+            )
+            signals.append(s)
+            score += s.score_delta
+            break  # Only flag the top one
 
     return CategoryResult(
         category="suspicious_bidding",
@@ -66,8 +66,8 @@ used exclusively.
     - Location within configurable radius (default 150 km)
     - Account is active and KYC verified
 
- 2. SCORING (in-process, per candidate):
-    - Compute 5 dimension scores
+ 2. SCORING (in-process, all candidates at once):
+    - Compute 5 dimension scores as NumPy array expressions
     - Apply urgency-adjusted weights
     - Compute composite score
     - (Optional) ML re-rank top N
@@ -85,11 +85,13 @@ used exclusively.
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Sequence
 
-from app.ml.features import VEHICLE_MAX_WEIGHT, haversine_km
+import numpy as np
+
+from app.ml.features import VEHICLE_MAX_WEIGHT
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -251,56 +253,187 @@ class MatchResult:
 
 
 # ═══════════════════════════════════════════════════════════════
-#  DIMENSION SCORING FUNCTIONS
+#  COMPOSITE SCORER
 # ═══════════════════════════════════════════════════════════════
 
-def score_proximity(
+def select_weights(listing: ListingContext) -> dict[str, float]:
+    """Choose dimension weights based on listing characteristics."""
+    urgency = listing.urgency.lower()
+    cargo = listing.cargo_type.lower()
+
+    if cargo in HIGH_VALUE_CARGO:
+        return HIGH_VALUE_WEIGHTS.copy()
+    elif urgency == "urgent":
+        return URGENT_WEIGHTS.copy()
+    elif urgency == "express":
+        return EXPRESS_WEIGHTS.copy()
+    else:
+        return DEFAULT_WEIGHTS.copy()
+
+
+def score_courier(
     courier: CourierStats,
     listing: ListingContext,
-) -> tuple[float, Optional[float]]:
+    weights: Optional[dict[str, float]] = None,
+) -> MatchResult:
+    """
+    Compute the full 5-dimension score and weighted composite
+    for a single courier against a listing.
+
+    Returns a MatchResult with breakdown.
+    """
+    if weights is None:
+        weights = select_weights(listing)
+
+    # Scored as a batch of one, so a single score always agrees with
+    # the courier's score in a ranked list
+    batch = CourierBatch.from_stats([courier])
+    return score_batch(batch, listing, weights).result(batch, 0)
+
+
+# ═══════════════════════════════════════════════════════════════
+#  DIMENSION SCORING (vectorised over a batch of couriers)
+# ═══════════════════════════════════════════════════════════════
+
+@dataclass
+class CourierBatch:
+    """
+    Column-wise (structure-of-arrays) view of many couriers, so every
+    dimension is scored for all of them in a handful of NumPy ops.
+    Missing coordinates are NaN.
+    """
+    user_id: list[str]
+    full_name: list[str]
+    vehicle_type: list[str]
+    latitude: np.ndarray
+    longitude: np.ndarray
+    vehicle_capacity_kg: np.ndarray
+    has_refrigeration: np.ndarray
+    has_gps_tracker: np.ndarray
+    acceptance_rate: np.ndarray
+    completion_rate: np.ndarray
+    on_time_rate: np.ndarray
+    total_trips_completed: np.ndarray
+    total_trips_cancelled: np.ndarray
+    disputes_lost: np.ndarray
+    avg_price_vs_market: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.user_id)
+
+    def take(self, idx: np.ndarray) -> "CourierBatch":
+        """The couriers at positions `idx`, in that order."""
+        cols = {}
+        for f in fields(self):
+            col = getattr(self, f.name)
+            cols[f.name] = col[idx] if isinstance(col, np.ndarray) else [col[i] for i in idx]
+        return CourierBatch(**cols)
+
+    @classmethod
+    def from_stats(cls, couriers: Sequence[CourierStats]) -> "CourierBatch":
+        """
+        Accepts CourierStats or anything with the same attribute names,
+        e.g. DB result rows whose columns are labelled to match.
+        """
+        def col(attr: str, dtype=np.float64) -> np.ndarray:
+            return np.fromiter(
+                (getattr(c, attr) for c in couriers), dtype=dtype, count=len(couriers)
+            )
+
+        return cls(
+            user_id=[c.user_id for c in couriers],
+            full_name=[c.full_name for c in couriers],
+            vehicle_type=[c.vehicle_type for c in couriers],
+            latitude=np.array(
+                [np.nan if c.latitude is None else c.latitude for c in couriers], dtype=np.float64
+            ),
+            longitude=np.array(
+                [np.nan if c.longitude is None else c.longitude for c in couriers], dtype=np.float64
+            ),
+            vehicle_capacity_kg=col("vehicle_capacity_kg"),
+            has_refrigeration=col("has_refrigeration", bool),
+            has_gps_tracker=col("has_gps_tracker", bool),
+            acceptance_rate=col("acceptance_rate"),
+            completion_rate=col("completion_rate"),
+            on_time_rate=col("on_time_rate"),
+            total_trips_completed=col("total_trips_completed"),
+            total_trips_cancelled=col("total_trips_cancelled"),
+            disputes_lost=col("disputes_lost"),
+            avg_price_vs_market=col("avg_price_vs_market"),
+        )
+
+
+def _round(x: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    Elementwise Python round(x, ndigits).  np.round scales, rounds half
+    to even and scales back, which only disagrees with round() when the
+    scaled value sits on (or within float error of) a .5 tie — those few
+    entries are redone with round() itself.
+    """
+    out = np.round(x, ndigits)
+    scaled = x * 10.0 ** ndigits
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_tie):
+        out[i] = round(float(x[i]), ndigits)
+    return out
+
+
+def _clip_round(score: np.ndarray) -> np.ndarray:
+    return _round(np.clip(score, 0.0, 100.0), 2)
+
+
+def _libm(fn, *args: np.ndarray) -> np.ndarray:
+    """
+    Apply a `math` function elementwise.  NumPy's SIMD exp/arctan2 can
+    land one ulp away from libm, enough to tip a score across a rounding
+    tie, so these stay on the same functions score_courier always used.
+    """
+    return np.fromiter(map(fn, *(a.tolist() for a in args)), dtype=np.float64, count=len(args[0]))
+
+
+def batch_proximity(
+    batch: CourierBatch, listing: ListingContext,
+) -> tuple[np.ndarray, np.ndarray]:
     """
     Score: 0–100 based on GPS distance from courier to pickup point.
 
-    Formula (exponential decay):
-      score = 100 × exp(-distance / decay_constant)
+    Formula (exponential decay, constant 80 km):
+      score = 100 × exp(-distance / 80), +10 within IDEAL_PROXIMITY_KM
 
-    Where decay_constant is tuned so that:
       • 0–15 km  → 85–100 (excellent)
       • 15–50 km → 55–85  (good)
       • 50–150 km → 20–55 (acceptable)
       • >150 km  → <20    (poor)
 
-    Returns (score, distance_km).
+    Beyond MAX_PROXIMITY_RADIUS_KM the score is 0.  No GPS data on
+    either side → neutral 50, so the courier isn't penalised.
+
+    Returns (scores, distances); distance is NaN without a GPS fix.
     """
-    if (
-        courier.latitude is None
-        or courier.longitude is None
-        or listing.pickup_lat is None
-        or listing.pickup_lng is None
-    ):
-        # No GPS data → neutral score (50) so courier isn't penalised
-        return 50.0, None
-
-    distance = haversine_km(
-        courier.latitude, courier.longitude,
-        listing.pickup_lat, listing.pickup_lng,
+    n = len(batch)
+    if listing.pickup_lat is None or listing.pickup_lng is None:
+        return np.full(n, 50.0), np.full(n, np.nan)
+
+    d_lat = np.radians(listing.pickup_lat - batch.latitude)
+    d_lng = np.radians(listing.pickup_lng - batch.longitude)
+    a = (
+        np.sin(d_lat / 2) ** 2
+        + np.cos(np.radians(batch.latitude))
+        * math.cos(math.radians(listing.pickup_lat))
+        * np.sin(d_lng / 2) ** 2
     )
+    distance = 6371.0 * 2 * _libm(math.atan2, np.sqrt(a), np.sqrt(1 - a))
 
-    if distance > MAX_PROXIMITY_RADIUS_KM:
-        return 0.0, distance
-
-    # Exponential decay with decay constant of 80 km
-    decay = 80.0
-    score = 100.0 * math.exp(-distance / decay)
-
-    # Bonus for being very close (< ideal radius)
-    if distance <= IDEAL_PROXIMITY_KM:
-        score = min(100.0, score + 10.0)
+    score = 100.0 * _libm(math.exp, -distance / 80.0)
+    score = np.where(distance <= IDEAL_PROXIMITY_KM, np.minimum(100.0, score + 10.0), score)
+    score = np.where(distance > MAX_PROXIMITY_RADIUS_KM, 0.0, _clip_round(score))
+    distance = np.where(distance > MAX_PROXIMITY_RADIUS_KM, distance, _round(distance, 1))
 
-    return round(max(0.0, min(100.0, score)), 2), round(distance, 1)
+    no_gps = np.isnan(distance)
+    return np.where(no_gps, 50.0, score), distance
 
 
-def score_reliability(courier: CourierStats) -> float:
+def batch_reliability(batch: CourierBatch) -> np.ndarray:
     """
     Score: 0–100 based on completion history and dispute record.
 
@@ -313,235 +446,178 @@ def score_reliability(courier: CourierStats) -> float:
     Where:
       dispute_penalty = min(disputes_lost / max(total_trips, 1), 0.5)
       experience_bonus = min(total_trips / 50, 1.0) × 100
-    """
-    total_trips = max(courier.total_trips_completed + courier.total_trips_cancelled, 1)
-
-    completion_pct = courier.completion_rate * 100  # Already 0.0–1.0
-
-    on_time_pct = courier.on_time_rate * 100
-
-    # Dispute penalty: each lost dispute hurts, capped at 50%
-    dispute_penalty = min(courier.disputes_lost / total_trips, 0.5)
-    dispute_score = (1.0 - dispute_penalty) * 100
 
-    # Experience bonus: ramps up to 100 over 50 completed trips
-    experience_bonus = min(courier.total_trips_completed / 50.0, 1.0) * 100
+    Fewer than 3 completed trips blends toward 35 (neutral-low).
+    """
+    completed = batch.total_trips_completed
+    total_trips = np.maximum(completed + batch.total_trips_cancelled, 1)
+    dispute_penalty = np.minimum(batch.disputes_lost / total_trips, 0.5)
 
     score = (
-        0.50 * completion_pct
-        + 0.25 * on_time_pct
-        + 0.15 * dispute_score
-        + 0.10 * experience_bonus
+        0.50 * (batch.completion_rate * 100)
+        + 0.25 * (batch.on_time_rate * 100)
+        + 0.15 * ((1.0 - dispute_penalty) * 100)
+        + 0.10 * (np.minimum(completed / 50.0, 1.0) * 100)
     )
+    score = np.where(completed < 3, score * 0.7 + 35.0 * 0.3, score)
+    return _clip_round(score)
 
-    # New courier adjustment: if < 3 trips, reduce confidence
-    if courier.total_trips_completed < 3:
-        score = score * 0.7 + 35.0 * 0.3  # Blend toward 35 (neutral-low)
-
-    return round(max(0.0, min(100.0, score)), 2)
 
-
-def score_acceptance(courier: CourierStats) -> float:
+def batch_acceptance(batch: CourierBatch) -> np.ndarray:
     """
     Score: 0–100 based on bid follow-through rate.
 
     Formula:
-      score = acceptance_rate × 100
-
-    With adjustments:
-      • < 5 total bids → blend toward 50 (insufficient data)
-      • Cancelled trips count negatively (beyond simple acceptance)
+      score = acceptance_rate × 100 - cancel_rate × 30
 
-    A courier who accepts bids and completes them is rewarded;
-    one who frequently cancels after accepting is penalised.
+    Fewer than 5 total bids blends toward 50 (insufficient data).
     """
-    base = courier.acceptance_rate * 100
-
-    # Cancellation penalty
-    total_assigned = max(
-        courier.total_trips_completed + courier.total_trips_cancelled, 1
-    )
-    cancel_rate = courier.total_trips_cancelled / total_assigned
-    penalty = cancel_rate * 30  # Up to 30 point penalty
-
-    score = base - penalty
+    total_bids = batch.total_trips_completed + batch.total_trips_cancelled
+    cancel_rate = batch.total_trips_cancelled / np.maximum(total_bids, 1)
 
-    # New courier: blend toward neutral
-    total_bids = courier.total_trips_completed + courier.total_trips_cancelled
-    if total_bids < 5:
-        score = score * 0.5 + 50.0 * 0.5
+    score = batch.acceptance_rate * 100 - cancel_rate * 30
+    score = np.where(total_bids < 5, score * 0.5 + 50.0 * 0.5, score)
+    return _clip_round(score)
 
-    return round(max(0.0, min(100.0, score)), 2)
 
-
-def score_vehicle_fit(
-    courier: CourierStats,
-    listing: ListingContext,
-) -> float:
+def batch_vehicle_fit(batch: CourierBatch, listing: ListingContext) -> np.ndarray:
     """
     Score: 0–100 based on vehicle suitability for the load.
 
     Components:
-      1. Type compatibility (0 or 40 points)
-      2. Capacity headroom (0–30 points)
-      3. Special equipment (0–20 points)
+      1. Type compatibility (40 points, or a hard 0)
+      2. Capacity headroom (15–30 points; over capacity is a hard 0)
+      3. Special equipment (-10 to +20 points)
       4. GPS tracker bonus (0–10 points)
 
-    A courier with the wrong vehicle type scores 0 (hard filter).
+    A 0 marks a hard mismatch and removes the courier from ranking.
     """
-    score = 0.0
-
-    # 1. Type compatibility (hard requirement)
+    n = len(batch)
     required = listing.required_vehicle_type.lower()
-    courier_vtype = (courier.vehicle_type or "any").lower()
-
-    compatible_types = VEHICLE_COMPATIBILITY.get(required, set())
     if required == "any":
-        # Any vehicle works, but bigger is better for heavy loads
-        score += 40.0
-    elif courier_vtype in compatible_types:
-        score += 40.0
-    else:
-        return 0.0  # Incompatible → hard zero
-
-    # 2. Capacity headroom: ideal is 60–90% utilisation
-    if courier.vehicle_capacity_kg > 0:
-        utilisation = listing.weight_kg / courier.vehicle_capacity_kg
-        if utilisation > 1.0:
-            return 0.0  # Overweight → hard zero
-        elif utilisation <= 0.0:
-            score += 15.0
-        elif 0.3 <= utilisation <= 0.9:
-            score += 30.0  # Sweet spot
-        elif utilisation < 0.3:
-            score += 20.0  # Oversized truck → slight penalty
-        else:  # 0.9–1.0
-            score += 22.0  # Near capacity → a bit risky
+        type_ok = np.ones(n, dtype=bool)
     else:
-        score += 15.0
+        compatible = VEHICLE_COMPATIBILITY.get(required, set())
+        type_ok = np.fromiter(
+            ((v or "any").lower() in compatible for v in batch.vehicle_type), dtype=bool, count=n
+        )
+
+    capacity = batch.vehicle_capacity_kg
+    has_capacity = capacity > 0
+    utilisation = np.divide(
+        listing.weight_kg, capacity, out=np.zeros(n), where=has_capacity
+    )
+    overweight = has_capacity & (utilisation > 1.0)
+    headroom = np.select(
+        [
+            ~has_capacity | (utilisation <= 0.0),
+            (utilisation >= 0.3) & (utilisation <= 0.9),
+            utilisation < 0.3,
+        ],
+        [15.0, 30.0, 20.0],
+        default=22.0,
+    )
 
-    # 3. Special equipment
-    if listing.cargo_type in ("perishables",) and courier.has_refrigeration:
-        score += 20.0
-    elif listing.cargo_type in ("perishables",) and not courier.has_refrigeration:
-        score -= 10.0  # Penalty for missing refrigeration
+    if listing.cargo_type in ("perishables",):
+        equipment = np.where(batch.has_refrigeration, 20.0, -10.0)
     else:
-        score += 10.0  # Neutral for non-perishable
+        equipment = np.full(n, 10.0)
 
-    # 4. GPS tracker (important for high-value cargo)
-    if courier.has_gps_tracker:
-        if listing.cargo_type in HIGH_VALUE_CARGO:
-            score += 10.0
-        else:
-            score += 5.0
+    gps_bonus = 10.0 if listing.cargo_type in HIGH_VALUE_CARGO else 5.0
+    gps = np.where(batch.has_gps_tracker, gps_bonus, 0.0)
 
-    return round(max(0.0, min(100.0, score)), 2)
+    score = _clip_round(40.0 + headroom + equipment + gps)
+    return np.where(type_ok & ~overweight, score, 0.0)
 
 
-def score_pricing(
-    courier: CourierStats,
-    listing: ListingContext,
-) -> float:
+def batch_pricing(batch: CourierBatch) -> np.ndarray:
     """
     Score: 0–100 based on pricing competitiveness.
 
-    A courier who consistently bids near or below market rate scores
-    higher; one who bids significantly above market scores lower.
-
-    Formula:
-      ratio = courier.avg_price_vs_market
-      score = 100 × exp(-2 × max(ratio - 0.8, 0))
+    ratio = avg_price_vs_market:
+      • 0.80–1.05 → 90–100 (sweet spot)
+      • < 0.80    → 70 + 25 × ratio, and -20 (floor 40) below 0.50
+      • > 1.05    → 90 × exp(-3 × (ratio - 1.05))
 
-    Sweet spot: ratio 0.8–1.0 (competitive but not suspiciously cheap).
-    Penalty ramps for ratio > 1.2 (expensive).
-    Slight penalty for ratio < 0.6 (too cheap → quality concern).
+    No pricing data or no completed trips → neutral 50.
     """
-    ratio = courier.avg_price_vs_market
-
-    if ratio <= 0 or courier.total_trips_completed == 0:
-        # No data → neutral
-        return 50.0
-
-    # Optimal zone: 0.80–1.05
-    if 0.80 <= ratio <= 1.05:
-        score = 90.0 + (1.05 - ratio) * 40  # 90–100
-    elif ratio < 0.80:
-        # Suspiciously cheap — slight concern
-        score = 70.0 + ratio * 25  # ~87 at 0.70, ~75 at 0.60
-        if ratio < 0.50:
-            score = max(40.0, score - 20)  # Quality concern
-    else:
-        # Expensive: exponential penalty above 1.05
-        overshoot = ratio - 1.05
-        score = 90.0 * math.exp(-3.0 * overshoot)
-
-    return round(max(0.0, min(100.0, score)), 2)
-
-
-# ═══════════════════════════════════════════════════════════════
-#  COMPOSITE SCORER
-# ═══════════════════════════════════════════════════════════════
-
-def select_weights(listing: ListingContext) -> dict[str, float]:
-    """Choose dimension weights based on listing characteristics."""
-    urgency = listing.urgency.lower()
-    cargo = listing.cargo_type.lower()
-
-    if cargo in HIGH_VALUE_CARGO:
-        return HIGH_VALUE_WEIGHTS.copy()
-    elif urgency == "urgent":
-        return URGENT_WEIGHTS.copy()
-    elif urgency == "express":
-        return EXPRESS_WEIGHTS.copy()
-    else:
-        return DEFAULT_WEIGHTS.copy()
+    ratio = batch.avg_price_vs_market
+    cheap = 70.0 + ratio * 25
+    score = np.select(
+        [
+            (ratio <= 0) | (batch.total_trips_completed == 0),
+            (ratio >= 0.80) & (ratio <= 1.05),
+            ratio < 0.50,
+            ratio < 0.80,
+        ],
+        [
+            50.0,
+            90.0 + (1.05 - ratio) * 40,
+            np.maximum(40.0, cheap - 20),
+            cheap,
+        ],
+        default=90.0 * _libm(math.exp, -3.0 * (np.maximum(ratio, 1.05) - 1.05)),
+    )
+    return _clip_round(score)
 
 
-def score_courier(
-    courier: CourierStats,
+@dataclass
+class BatchScores:
+    """Per-courier dimension scores, distances and composites for a batch."""
+    proximity: np.ndarray
+    reliability: np.ndarray
+    acceptance: np.ndarray
+    vehicle_fit: np.ndarray
+    pricing: np.ndarray
+    distance_km: np.ndarray
+    composite: np.ndarray
+
+    def result(self, batch: CourierBatch, i: int) -> MatchResult:
+        distance = self.distance_km[i]
+        return MatchResult(
+            courier_id=str(batch.user_id[i]),
+            courier_name=batch.full_name[i],
+            composite_score=float(self.composite[i]),
+            dimensions=DimensionScores(
+                proximity=float(self.proximity[i]),
+                reliability=float(self.reliability[i]),
+                acceptance=float(self.acceptance[i]),
+                vehicle_fit=float(self.vehicle_fit[i]),
+                pricing=float(self.pricing[i]),
+            ),
+            distance_km=None if np.isnan(distance) else float(distance),
+            vehicle_type=batch.vehicle_type[i] or "unknown",
+        )
+
+
+def score_batch(
+    batch: CourierBatch,
     listing: ListingContext,
-    weights: Optional[dict[str, float]] = None,
-) -> MatchResult:
-    """
-    Compute the full 5-dimension score and weighted composite
-    for a single courier against a listing.
-
-    Returns a MatchResult with breakdown.
-    """
-    if weights is None:
-        weights = select_weights(listing)
-
-    # Score each dimension
-    prox_score, distance_km = score_proximity(courier, listing)
-    rel_score = score_reliability(courier)
-    acc_score = score_acceptance(courier)
-    veh_score = score_vehicle_fit(courier, listing)
-    price_score = score_pricing(courier, listing)
-
-    dimensions = DimensionScores(
-        proximity=prox_score,
-        reliability=rel_score,
-        acceptance=acc_score,
-        vehicle_fit=veh_score,
-        pricing=price_score,
-    )
-
-    # Weighted composite
-    composite = (
-        weights["proximity"] * prox_score
-        + weights["reliability"] * rel_score
-        + weights["acceptance"] * acc_score
-        + weights["vehicle_fit"] * veh_score
-        + weights["pricing"] * price_score
+    weights: dict[str, float],
+) -> BatchScores:
+    """All five dimensions and the weighted composite for every courier."""
+    proximity, distance = batch_proximity(batch, listing)
+    reliability = batch_reliability(batch)
+    acceptance = batch_acceptance(batch)
+    vehicle_fit = batch_vehicle_fit(batch, listing)
+    pricing = batch_pricing(batch)
+
+    composite = _round(
+        weights["proximity"] * proximity
+        + weights["reliability"] * reliability
+        + weights["acceptance"] * acceptance
+        + weights["vehicle_fit"] * vehicle_fit
+        + weights["pricing"] * pricing,
+        2,
     )
-
-    return MatchResult(
-        courier_id=courier.user_id,
-        courier_name=courier.full_name,
-        composite_score=round(composite, 2),
-        dimensions=dimensions,
-        distance_km=distance_km,
-        vehicle_type=courier.vehicle_type or "unknown",
+    return BatchScores(
+        proximity=proximity,
+        reliability=reliability,
+        acceptance=acceptance,
+        vehicle_fit=vehicle_fit,
+        pricing=pricing,
+        distance_km=distance,
+        composite=composite,
     )
 
 
@@ -549,8 +625,25 @@ def score_courier(
 #  BATCH RANKING
 # ═══════════════════════════════════════════════════════════════
 
+def _top_k(idx: np.ndarray, values: np.ndarray, k: int) -> np.ndarray:
+    """
+    The k entries of `idx` with the highest `values`, best first — the
+    same as a stable descending sort cut to k, but only the k winners
+    are sorted.  A linear partition finds the k-th value; among entries
+    tied with it, the earliest in `idx` are kept.
+    """
+    if k <= 0:
+        return idx[:0]
+    if len(idx) > k:
+        kth = -np.partition(-values, k - 1)[k - 1]
+        tied = values == kth
+        keep = (values > kth) | (tied & (np.cumsum(tied) <= k - np.count_nonzero(values > kth)))
+        idx, values = idx[keep], values[keep]
+    return idx[np.argsort(-values, kind="stable")]
+
+
 def rank_couriers(
-    couriers: list[CourierStats],
+    couriers: Sequence[CourierStats] | CourierBatch,
     listing: ListingContext,
     top_k: int = 10,
     min_score: float = MIN_COMPOSITE_SCORE,
@@ -560,32 +653,30 @@ def rank_couriers(
     Score all candidate couriers against a listing, filter,
     sort, and return the top K matches.
 
-    This is the main entry point for the formula-based ranker.
+    This is the main entry point for the formula-based ranker.  Scores
+    match `score_courier` per courier but are computed column-wise, and
+    MatchResult objects are only built for the couriers returned.
     """
     if weights is None:
         weights = select_weights(listing)
 
-    results: list[MatchResult] = []
-
-    for courier in couriers:
-        result = score_courier(courier, listing, weights)
+    batch = couriers if isinstance(couriers, CourierBatch) else CourierBatch.from_stats(couriers)
+    if len(batch) == 0:
+        return []
 
-        # Hard filters
-        if result.dimensions.vehicle_fit == 0:
-            continue  # Incompatible vehicle
-        if result.composite_score < min_score:
-            continue
+    scores = score_batch(batch, listing, weights)
+    composite = scores.composite
 
-        results.append(result)
+    # Hard filters: incompatible vehicle, below threshold
+    (candidates,) = np.nonzero((scores.vehicle_fit != 0) & (composite >= min_score))
 
-    # Sort by composite score descending
-    results.sort(key=lambda r: r.composite_score, reverse=True)
+    # Highest composite first; ties keep input order
+    order = _top_k(candidates, composite[candidates], top_k)
 
-    # Assign ranks
-    for i, result in enumerate(results):
-        result.rank = i + 1
-
-    return results[:top_k]
+    results = [scores.result(batch, i) for i in order]
+    for rank, result in enumerate(results, start=1):
+        result.rank = rank
+    return results
 
 
 # ═══════════════════════════════════════════════════════════════
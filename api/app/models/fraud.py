@@ -43,7 +43,7 @@ from sqlalchemy import (
     String,
     Text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -159,7 +159,7 @@ class FraudSignal(Base):
     description: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Context data (JSON): entity IDs, thresholds exceeded, raw values
-    context_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    context_json: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     # Reference to the entity that triggered the signal
     entity_type: Mapped[Optional[str]] = mapped_column(
@@ -313,6 +313,36 @@ class FraudAlert(Base):
     assigned_to = relationship("User", foreign_keys=[assigned_to_user_id], lazy="selectin")
 
 
+# Review queue: filter by status/category, walk (priority, created_at, id)
+# descending with a keyset cursor
+Index(
+    "ix_fa_queue",
+    FraudAlert.status,
+    FraudAlert.category,
+    FraudAlert.priority_score.desc(),
+    FraudAlert.created_at.desc(),
+    FraudAlert.id.desc(),
+)
+
+# Dashboard counts: unresolved alerts per category/status, and alerts
+# resolved in the last week.  Both are small slices of the table, so
+# partial indexes keep them to index-only scans.
+Index(
+    "ix_fa_unresolved_category",
+    FraudAlert.category,
+    FraudAlert.status,
+    postgresql_where=FraudAlert.status.in_([
+        AlertStatus.OPEN, AlertStatus.INVESTIGATING, AlertStatus.ESCALATED,
+    ]),
+)
+Index(
+    "ix_fa_resolved_at",
+    FraudAlert.resolved_at,
+    FraudAlert.category,
+    postgresql_where=FraudAlert.resolved_at.isnot(None),
+)
+
+
 # ═══════════════════════════════════════════════════════════════
 #  FRAUD DECISION (admin enforcement)
 # ═══════════════════════════════════════════════════════════════
@@ -326,6 +356,7 @@ class FraudDecision(Base):
     __table_args__ = (
         Index("ix_fd_alert", "alert_id"),
         Index("ix_fd_user", "target_user_id"),
+        Index("ix_fd_created", "created_at"),  # Dashboard 7-day count
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -366,3 +397,27 @@ class FraudDecision(Base):
     alert = relationship("FraudAlert", lazy="selectin")
     target_user = relationship("User", foreign_keys=[target_user_id], lazy="selectin")
     decided_by = relationship("User", foreign_keys=[decided_by_user_id], lazy="selectin")
+
+
+# ═══════════════════════════════════════════════════════════════
+#  CATEGORY RISK SUMMARY (dashboard aggregate)
+# ═══════════════════════════════════════════════════════════════
+
+class FraudCategoryStat(Base):
+    """
+    Per-category risk aggregates over all risk profiles, one row per
+    FraudCategory.  Recomputed in a single statement by a background
+    refresher so the admin dashboard reads five rows instead of scanning
+    risk_profiles.
+    """
+    __tablename__ = "fraud_category_stats"
+
+    category: Mapped[FraudCategory] = mapped_column(
+        SAEnum(FraudCategory, name="fraud_category_enum", create_constraint=True),
+        primary_key=True,
+    )
+    avg_risk_score: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    high_risk_users: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False
+    )
@@ -20,6 +20,7 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -133,7 +134,11 @@ class FreightListing(Base):
     __tablename__ = "freight_listings"
     __table_args__ = (
         Index("ix_listings_status_created", "status", "created_at"),
-        Index("ix_listings_shipper", "shipper_id"),
+        # Per-shipper counters (fraud snapshot) read only these columns
+        Index(
+            "ix_listings_shipper_status", "shipper_id", "status",
+            postgresql_include=["bid_count", "created_at"],
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -232,7 +237,11 @@ class FreightBid(Base):
     __tablename__ = "freight_bids"
     __table_args__ = (
         Index("ix_bids_listing_status", "listing_id", "status"),
-        Index("ix_bids_courier", "courier_id"),
+        # Per-courier bid history and counters, index-only
+        Index(
+            "ix_bids_courier_created", "courier_id", "created_at",
+            postgresql_include=["status", "price"],
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -277,6 +286,19 @@ class FreightBid(Base):
     courier = relationship("User", foreign_keys=[courier_id], lazy="selectin")
 
 
+# At most one pending bid per courier per listing; create_bid inserts
+# with ON CONFLICT against it instead of checking first.  The predicate
+# is literal SQL (enums are stored by name) so create_bid can repeat it
+# verbatim.
+Index(
+    "uq_bids_one_pending",
+    FreightBid.listing_id,
+    FreightBid.courier_id,
+    unique=True,
+    postgresql_where=text("status = 'PENDING'"),
+)
+
+
 # ═══════════════════════════════════════════════════════════════
 #  FREIGHT TRIP (created when a bid is accepted)
 # ═══════════════════════════════════════════════════════════════
@@ -285,7 +307,11 @@ class FreightTrip(Base):
     __tablename__ = "freight_trips"
     __table_args__ = (
         Index("ix_trips_listing", "listing_id"),
-        Index("ix_trips_courier", "courier_id"),
+        # Per-courier trip outcomes, incl. recent cancellations
+        Index(
+            "ix_trips_courier_status_updated", "courier_id", "status", "updated_at",
+            postgresql_include=["started_at"],
+        ),
         Index("ix_trips_status", "status"),
     )
 
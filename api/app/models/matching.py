@@ -22,6 +22,7 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -54,7 +55,11 @@ class CourierProfile(Base):
     __tablename__ = "courier_profiles"
     __table_args__ = (
         Index("ix_cp_user", "user_id", unique=True),
-        Index("ix_cp_active_loc", "is_available", "current_latitude", "current_longitude"),
+        # Bounding-box prefilter in /matching/recommend
+        Index(
+            "ix_cp_matchable_loc", "current_latitude", "current_longitude",
+            postgresql_where=text("is_available AND NOT is_on_trip"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
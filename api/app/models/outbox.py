@@ -0,0 +1,64 @@
+"""
+LoadMoveGH — SQLAlchemy Models: Transactional Outbox
+=====================================================
+
+Domain events (dispute resolved, …) are written to the outbox in the
+same transaction as the state change that caused them.  A background
+dispatcher drains undelivered rows in id order, so notifications are
+never sent for a rolled-back write and never lost for a committed one.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, Index, String, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+# ═══════════════════════════════════════════════════════════════
+#  OUTBOX EVENT
+# ═══════════════════════════════════════════════════════════════
+
+class OutboxEvent(Base):
+    """
+    One pending (or delivered) domain event.
+
+    ``id`` is a monotonically increasing bigint so the dispatcher can
+    deliver in commit order; ``dispatched_at`` stays NULL until the event
+    has been handed off.
+    """
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        # Only undelivered rows are ever polled — keep that index tiny
+        Index(
+            "ix_outbox_pending",
+            "id",
+            postgresql_where=text("dispatched_at IS NULL"),
+        ),
+        Index("ix_outbox_aggregate", "aggregate_type", "aggregate_id"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    aggregate_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    aggregate_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False
+    )
+    dispatched_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<OutboxEvent {self.id} {self.event_type} {self.aggregate_id}>"
@@ -44,6 +44,7 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -172,6 +173,11 @@ class Wallet(Base):
     __table_args__ = (
         UniqueConstraint("user_id", "currency", name="uq_wallet_user_currency"),
         Index("ix_wallets_user", "user_id"),
+        # At most one platform (commission) wallet per currency
+        Index(
+            "uq_wallet_platform_currency", "currency",
+            unique=True, postgresql_where=text("is_platform"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -209,6 +215,10 @@ class Wallet(Base):
         default=WalletStatus.ACTIVE,
     )
     is_verified: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # Receives platform commission; owned by the platform's system account.
+    # Its balance columns are not moved per escrow release — platform
+    # revenue is the sum of its COMMISSION ledger rows.
+    is_platform: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -237,9 +247,25 @@ class Transaction(Base):
     """
     __tablename__ = "transactions"
     __table_args__ = (
-        Index("ix_txn_wallet_created", "wallet_id", "created_at"),
-        Index("ix_txn_reference", "reference_type", "reference_id"),
+        # Covering: the fraud snapshot streams a wallet's history in time
+        # order reading only these columns
+        Index(
+            "ix_txn_wallet_created", "wallet_id", "created_at",
+            postgresql_include=["type", "status", "amount"],
+        ),
+        # Covering: reverse ledger lookups by reference read only these
+        Index(
+            "ix_txn_reference_cover", "reference_type", "reference_id",
+            postgresql_include=["type", "amount", "balance_after"],
+        ),
         Index("ix_txn_type_status", "type", "status"),
+        # Idempotency: one ledger row per (wallet, reference, type).
+        # wallet_id is part of the key because an escrow release writes
+        # an escrow_release row on both the shipper and courier wallets.
+        UniqueConstraint(
+            "wallet_id", "reference_type", "reference_id", "type",
+            name="uq_txn_wallet_ref_type",
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -259,8 +285,9 @@ class Transaction(Base):
     fee: Mapped[float] = mapped_column(Numeric(14, 2), nullable=False, default=0.00)
     net_amount: Mapped[float] = mapped_column(Numeric(14, 2), nullable=False)
 
-    # Balance snapshot after this transaction
-    balance_after: Mapped[float] = mapped_column(Numeric(14, 2), nullable=False)
+    # Balance snapshot after this transaction (NULL on platform commission
+    # rows, whose wallet balance is not updated in the request)
+    balance_after: Mapped[Optional[float]] = mapped_column(Numeric(14, 2), nullable=True)
 
     status: Mapped[TransactionStatus] = mapped_column(
         SAEnum(TransactionStatus, name="txn_status_enum", create_constraint=True),
@@ -299,7 +326,14 @@ class EscrowHold(Base):
     """
     __tablename__ = "escrow_holds"
     __table_args__ = (
-        Index("ix_escrow_trip", "trip_id"),
+        # Covering: trip → escrow lookups can be answered index-only
+        Index(
+            "ix_escrow_trip_cover", "trip_id",
+            postgresql_include=[
+                "status", "amount", "currency",
+                "shipper_wallet_id", "courier_wallet_id",
+            ],
+        ),
         Index("ix_escrow_status", "status"),
     )
 
@@ -308,7 +342,7 @@ class EscrowHold(Base):
     )
     trip_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("freight_trips.id", ondelete="CASCADE"),
-        nullable=False, unique=True,
+        nullable=False,
     )
     listing_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("freight_listings.id"), nullable=False
@@ -362,6 +396,17 @@ class EscrowHold(Base):
     )
 
 
+# At most one live escrow per trip — a refunded hold frees the trip for a
+# new one.  Declared after the class so the predicate can use the mapped
+# enum column (rendered with the enum's persisted representation).
+Index(
+    "uq_escrow_trip_active",
+    EscrowHold.trip_id,
+    unique=True,
+    postgresql_where=EscrowHold.status != EscrowStatus.REFUNDED,
+)
+
+
 # ═══════════════════════════════════════════════════════════════
 #  MTN MOBILE MONEY PAYMENT
 # ═══════════════════════════════════════════════════════════════
@@ -502,6 +547,15 @@ class Dispute(Base):
     __table_args__ = (
         Index("ix_dispute_trip", "trip_id"),
         Index("ix_dispute_status", "status"),
+        # Per-party dispute counts (fraud snapshot), index-only
+        Index(
+            "ix_dispute_raised_by", "raised_by_user_id",
+            postgresql_include=["status", "reason"],
+        ),
+        Index(
+            "ix_dispute_against", "against_user_id",
+            postgresql_include=["status", "reason"],
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -104,11 +104,15 @@ class FraudAlertResponse(BaseModel):
 
 
 class AlertListResponse(BaseModel):
-    """Paginated list of fraud alerts."""
+    """
+    One page of fraud alerts.  Pass `next_cursor` back as `cursor` to
+    fetch the following page; it is null on the last page.
+    """
     alerts: list[FraudAlertResponse]
     total: int
-    page: int
     page_size: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
 
 
 class ResolveAlertRequest(BaseModel):
@@ -4,6 +4,7 @@ LoadMoveGH — Pydantic Schemas for Load-Matching Engine
 
 from __future__ import annotations
 
+import uuid
 from typing import Optional
 
 from pydantic import BaseModel, Field
@@ -24,7 +25,7 @@ class WeightOverrides(BaseModel):
 
 class MatchRequest(BaseModel):
     """Request to find best-matched couriers for a listing."""
-    listing_id: str = Field(..., description="UUID of the freight listing to match")
+    listing_id: uuid.UUID = Field(..., description="UUID of the freight listing to match")
     top_k: int = Field(10, ge=1, le=50, description="Maximum couriers to return")
     min_score: float = Field(30.0, ge=0, le=100, description="Minimum composite score threshold")
     max_radius_km: float = Field(300.0, ge=1, le=1000, description="Maximum courier distance from pickup (km)")
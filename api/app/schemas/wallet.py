@@ -200,7 +200,7 @@ class TransactionResponse(BaseModel):
     currency: str
     fee: float
     net_amount: float
-    balance_after: float
+    balance_after: Optional[float] = None
     status: str
     reference_type: Optional[str] = None
     reference_id: Optional[str] = None
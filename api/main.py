@@ -2,11 +2,64 @@
 LoadMoveGH — FastAPI Application Entry Point
 """
 
+import asyncio
+import contextlib
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.v1.endpoints.escrow import (
+    provision_platform_wallets,
+    warmup_statements as escrow_warmup_statements,
+)
+from app.api.v1.endpoints.fraud import run_category_stats_refresher
+from app.api.v1.endpoints.listings import warmup_statements as listing_warmup_statements
+from app.api.v1.endpoints.matching import (
+    run_courier_snapshot_refresher,
+    run_recommendation_audit_writer,
+)
 from app.api.v1.router import api_router
 from app.core.config import settings
+from app.core.database import async_session_factory, warm_statement_cache
+from app.core.outbox import run_outbox_dispatcher
+from app.core.responses import ORJSONResponse
+
+logger = logging.getLogger("loadmovegh.api")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pre-compile / prepare the hot wallet-path and listing queries; a
+    # cold DB must not block startup, so failures are logged and ignored.
+    try:
+        await warm_statement_cache([
+            *escrow_warmup_statements(),
+            *listing_warmup_statements(),
+        ])
+    except Exception:
+        logger.warning("Statement cache warm-up failed", exc_info=True)
+
+    try:
+        async with async_session_factory() as session:
+            await provision_platform_wallets(session)
+    except Exception:
+        logger.warning("Platform wallet provisioning failed", exc_info=True)
+
+    background = [
+        asyncio.create_task(run_outbox_dispatcher()),
+        asyncio.create_task(run_category_stats_refresher()),
+        asyncio.create_task(run_courier_snapshot_refresher()),
+        asyncio.create_task(run_recommendation_audit_writer()),
+    ]
+    yield
+    for task in background:
+        task.cancel()
+    for task in background:
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
 
 app = FastAPI(
     title="LoadMoveGH API",
@@ -14,6 +67,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # ── CORS ─────────────────────────────────────────────────────